@@ -70,6 +70,8 @@ GET_ALL_NW_IFCS_CMD = 'ls /sys/class/net'
 IP_LINK_SHOW_CMD = "ip link show | grep {} | grep -o {}"
 CMD_UPDATE_FILE = "echo {} > {}"
 CMD_TOUCH_FILE = "touch {}"
+CMD_FILE_SIZE = "stat -c %s {}"
+CMD_READ_FROM_OFFSET = "tail -c +{} {} | head -c {}"
 LSSCSI_CMD = "lsscsi > {}"
 LINUX_STRING_CMD = "sed '/{}/!d' {} > {}"
 LINUX_REPLACE_STRING = "sed -i 's/{}/{}/g' {}"
@@ -516,6 +518,7 @@ KUBECTL_GET_POD_CONTAINERS = "kubectl get pods {} -o jsonpath='{{.spec.container
 KUBECTL_GET_POD_IPS = 'kubectl get pods --no-headers -o ' \
                       'custom-columns=":metadata.name,:.status.podIP"'
 KUBECTL_GET_POD_NAMES = 'kubectl get pods --no-headers -o custom-columns=":metadata.name"'
+KUBECTL_GET_PODS_JSON = "kubectl get pods -o json"
 KUBECTL_GET_REPLICASET = "kubectl get rs | grep '{}'"
 KUBECTL_GET_POD_DETAILS = "kubectl get pods --show-labels | grep '{}'"
 KUBECTL_CREATE_REPLICA = "kubectl scale --replicas={} deployment/{}"
@@ -0,0 +1,189 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Parallel multi-node command fan-out helper.
+
+Runs one command, or one command per node, on all the cluster nodes at the same time so that
+total latency is set by the slowest node instead of growing with node count.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Union
+
+from commons import constants as const
+from commons.helpers.host import Host
+from commons.helpers.node_helper import Node
+from commons.helpers.pods_helper import LogicalNode
+from config import CMN_CFG
+
+LOGGER = logging.getLogger(__name__)
+
+
+class NodeResult:
+    """Result of a command executed on a single node."""
+
+    def __init__(self, hostname: str, cmd: str = None) -> None:
+        """Initializer for NodeResult."""
+        self.hostname = hostname
+        self.cmd = cmd
+        self.exit_status = None
+        self.output = None
+        self.error = None
+        self.exception = None
+        self.start_time = None
+        self.duration = None
+
+    @property
+    def status(self) -> bool:
+        """True if command/function completed without exception and with zero exit status."""
+        return self.exception is None and self.exit_status in (0, None)
+
+    def __repr__(self) -> str:
+        return (f"NodeResult(hostname={self.hostname!r}, exit_status={self.exit_status}, "
+                f"duration={self.duration}, exception={self.exception!r})")
+
+
+def get_cluster_hosts(node_type: str = None, nodes: list = None) -> List[Host]:
+    """
+    Build host objects for the nodes in CMN_CFG["nodes"].
+    :param node_type: Filter nodes on node_type e.g. master/worker, None for all nodes.
+    :param nodes: Nodes config list, default CMN_CFG["nodes"].
+    :return: list of LogicalNode objects for k8s setups else Node objects.
+    """
+    nodes = CMN_CFG["nodes"] if nodes is None else nodes
+    host_cls = LogicalNode if CMN_CFG.get("product_type") == const.PROD_TYPE_K8S else Node
+    hosts = []
+    for node in nodes:
+        if node_type and node.get("node_type", "").lower() != node_type.lower():
+            continue
+        hosts.append(host_cls(hostname=node["hostname"],
+                              username=node["username"],
+                              password=node["password"]))
+    return hosts
+
+
+class MultiNodeExecutor:
+    """Execute commands or functions on multiple nodes concurrently."""
+
+    def __init__(self, hosts: List[Host] = None, max_workers: int = None,
+                 timeout: int = 400) -> None:
+        """
+        Initializer for MultiNodeExecutor.
+        :param hosts: Host/LogicalNode objects, default all nodes from CMN_CFG["nodes"].
+        :param max_workers: Max concurrent nodes, default number of hosts.
+        :param timeout: Per command timeout in seconds.
+        """
+        self.hosts = get_cluster_hosts() if hosts is None else list(hosts)
+        self.max_workers = max_workers or max(len(self.hosts), 1)
+        self.timeout = timeout
+
+    def run(self, cmd: Union[str, Dict[str, str], Callable[[Host], str]],
+            **kwargs) -> Dict[str, NodeResult]:
+        """
+        Run command on all the hosts concurrently.
+        :param cmd: Same command for all hosts, dict of hostname to command or a callable
+        which returns the command for a given host. Hosts without command are skipped.
+        :param kwargs: Optional keyword arguments for Host.execute_cmd_status.
+        :return: dict of hostname to NodeResult.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+
+        def _run(host: Host, result: NodeResult) -> None:
+            status, output, error = host.execute_cmd_status(result.cmd, **kwargs)
+            result.exit_status, result.output, result.error = status, output, error
+
+        tasks = []
+        for host in self.hosts:
+            if isinstance(cmd, dict):
+                host_cmd = cmd.get(host.hostname)
+            elif callable(cmd):
+                host_cmd = cmd(host)
+            else:
+                host_cmd = cmd
+            if host_cmd:
+                tasks.append((host, NodeResult(host.hostname, host_cmd), _run))
+        return self._execute(tasks)
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Dict[str, NodeResult]:
+        """
+        Call func(host, *args, **kwargs) for all the hosts concurrently.
+        e.g. executor.call(Health.check_node_health) for Health objects.
+        :param func: Function or unbound method to be called for each host.
+        :return: dict of hostname to NodeResult, return value is stored in output.
+        """
+        def _call(host: Host, result: NodeResult) -> None:
+            result.output = func(host, *args, **kwargs)
+
+        return self._execute([(host, NodeResult(host.hostname), _call) for host in self.hosts])
+
+    def _execute(self, tasks: list) -> Dict[str, NodeResult]:
+        """Execute the (host, result, worker) tasks on the thread pool and collect results."""
+        def _worker(task: tuple) -> NodeResult:
+            host, result, work = task
+            result.start_time = time.time()
+            try:
+                work(host, result)
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.error("%s %s on %s: %s", const.EXCEPTION_ERROR,
+                             MultiNodeExecutor.__name__, host.hostname, error)
+                result.exception = error
+            result.duration = time.time() - result.start_time
+            LOGGER.debug("%s completed in %.2f sec", result, result.duration)
+            return result
+
+        results = {}
+        if not tasks:
+            return results
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            for result in executor.map(_worker, tasks):
+                results[result.hostname] = result
+        return results
+
+
+def run_on_nodes(cmd: Union[str, Dict[str, str], Callable[[Host], str]],
+                 hosts: List[Host] = None, **kwargs) -> Dict[str, NodeResult]:
+    """
+    Run command on the given hosts or all cluster nodes concurrently.
+    :param cmd: Command string, dict of hostname to command or callable(host) -> command.
+    :param hosts: Host objects, default all nodes from CMN_CFG["nodes"].
+    :return: dict of hostname to NodeResult.
+    """
+    return MultiNodeExecutor(hosts).run(cmd, **kwargs)
+
+
+def call_on_nodes(func: Callable[..., Any], *args, hosts: List[Host] = None,
+                  raise_error: bool = False, **kwargs) -> Dict[str, NodeResult]:
+    """
+    Call func(host, *args, **kwargs) on the given hosts or all cluster nodes concurrently.
+    :param func: Function to be called for each host.
+    :param hosts: Host objects, default all nodes from CMN_CFG["nodes"].
+    :param raise_error: Re-raise the first exception raised on any node.
+    :return: dict of hostname to NodeResult.
+    """
+    results = MultiNodeExecutor(hosts).call(func, *args, **kwargs)
+    if raise_error:
+        for result in results.values():
+            if result.exception is not None:
+                raise result.exception
+    return results
@@ -17,9 +17,11 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 #
 
+import base64
 import json
 import logging
 import re
+import threading
 import time
 from typing import Tuple, List, Any
 
@@ -31,16 +33,143 @@ from commons.helpers.host import Host
 from commons.helpers.pods_helper import LogicalNode
 from commons.utils.assert_utils import assert_true
 from commons.utils.system_utils import check_ping
-from commons.utils.system_utils import run_remote_cmd
 from config import CMN_CFG
 from config import RAS_VAL
 
 LOG = logging.getLogger(__name__)
 
+# Max age in seconds of a cached health report reused by the health checks run before a test,
+# the cache is dropped after every test.
+HEALTH_PROBE_TTL = 30
+
+# Probe executed on the node (LR) or in the hax container of a data pod (LC). It runs all
+# the commands in one invocation and prints one json document of their results.
+HEALTH_PROBE_SCRIPT = """
+import json, subprocess, time
+doc = {"timestamp": time.time(), "results": {}}
+try:
+    import psutil
+    doc["cpu_usage"] = psutil.cpu_percent(interval=1)
+    doc["memory_usage"] = psutil.virtual_memory().percent
+except Exception as error:
+    doc["results"]["psutil"] = {"rc": -1, "out": "", "err": str(error)}
+for name, cmd in %r.items():
+    proc = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    doc["results"][name] = {"rc": proc.returncode,
+                            "out": proc.stdout.decode("utf-8", "replace"),
+                            "err": proc.stderr.decode("utf-8", "replace")}
+print(json.dumps(doc))
+"""
+
+# Cached health reports keyed by (hostname, username).
+health_probe_map = {}
+health_probe_lock = threading.Lock()
+
+
+class HealthReport:
+    """Typed view of the json document returned by the health probe."""
+
+    def __init__(self, hostname: str, doc: dict) -> None:
+        """
+        Parse health probe output.
+        :param hostname: Node on which probe was executed.
+        :param doc: Parsed json output of the probe.
+        """
+        self.hostname = hostname
+        self.doc = doc
+        self.timestamp = doc.get("timestamp", time.time())
+        self.probe_time = time.time()
+        self.cpu_usage = doc.get("cpu_usage")
+        self.memory_usage = doc.get("memory_usage")
+        self.results = doc.get("results", {})
+        self.hctl_status = None
+        hctl = self.results.get("hctl_json", {})
+        if hctl.get("rc") == 0:
+            try:
+                self.hctl_status = json.loads(hctl["out"])
+            except ValueError as error:
+                LOG.error("Invalid hctl status json from %s: %s", hostname, error)
+
+    def age(self) -> float:
+        """Seconds elapsed since report was collected."""
+        return time.time() - self.probe_time
+
+    def status(self, name: str) -> bool:
+        """True if probe command name completed with zero exit status."""
+        return self.results.get(name, {}).get("rc") == 0
+
+    def output(self, name: str, read_lines: bool = False) -> Any:
+        """Stdout of probe command name as string or list of lines."""
+        out = self.results.get(name, {}).get("out", "")
+        return out.splitlines(keepends=True) if read_lines else out
+
+    def to_dict(self) -> dict:
+        """Json serializable health document."""
+        return {"hostname": self.hostname, "timestamp": self.timestamp,
+                "cpu_usage": self.cpu_usage, "memory_usage": self.memory_usage,
+                "hctl_status": self.hctl_status, "results": self.results}
+
+
+def invalidate_health_probes() -> None:
+    """Drop all cached health reports, e.g. after a failed or disruptive test."""
+    with health_probe_lock:
+        health_probe_map.clear()
+
 
 class Health(Host):
     """Class for health related methods."""
 
+    @property
+    def logical_node(self) -> LogicalNode:
+        """LogicalNode of this host, created once and reused."""
+        if getattr(self, "_logical_node", None) is None:
+            self._logical_node = LogicalNode(hostname=self.hostname, username=self.username,
+                                             password=self.password)
+        return self._logical_node
+
+    def probe(self, max_age: float = 0, pod_name: str = None,
+              namespace: str = const.NAMESPACE) -> HealthReport:
+        """
+        Collect cpu, memory, hctl status and (for LR) pcs status and pcs xml in a single remote
+        invocation. A cached report younger than max_age is returned without probing.
+        :param max_age: Max age in seconds of a reusable cached report, 0 to always probe.
+        :param pod_name: Data pod to probe for LC, default first data pod.
+        :param namespace: namespace name
+        :return: HealthReport object.
+        """
+        # Reports of different pods of the node are cached separately.
+        key = (self.hostname, self.username, pod_name, namespace)
+        with health_probe_lock:
+            report = health_probe_map.get(key)
+        if max_age and report is not None and report.age() <= max_age:
+            LOG.debug("Using %.1f seconds old health report of %s", report.age(), self.hostname)
+            return report
+        probe_cmds = {"hctl_json": commands.HCTL_STATUS_CMD_JSON}
+        is_lr = CMN_CFG.get("product_family") == const.PROD_FAMILY_LR and \
+            CMN_CFG.get("product_type") == const.PROD_TYPE_NODE
+        if is_lr:
+            probe_cmds.update({"hctl": commands.MOTR_STATUS_CMD,
+                               "pcs": commands.PCS_STATUS_CMD,
+                               "pcs_xml": commands.CMD_PCS_GET_XML})
+        script = base64.b64encode((HEALTH_PROBE_SCRIPT % probe_cmds).encode()).decode()
+        cmd = f"python3 -c \"import base64;exec(base64.b64decode('{script}'))\""
+        if is_lr:
+            out = self.execute_cmd(cmd).decode("utf-8")
+        else:
+            if pod_name is None:
+                resp = self.logical_node.get_pod_name(pod_prefix=const.POD_NAME_PREFIX)
+                assert_true(resp[0], resp[1])
+                pod_name = resp[1]
+            out = self.logical_node.send_k8s_cmd(
+                operation="exec", pod=pod_name, namespace=namespace,
+                command_suffix=f"-c {const.HAX_CONTAINER_NAME} -- {cmd}", decode=True)
+        report = HealthReport(self.hostname, json.loads(out.strip().splitlines()[-1]))
+        LOG.debug("Health report of %s: cpu %s%%, memory %s%%", self.hostname,
+                  report.cpu_usage, report.memory_usage)
+        with health_probe_lock:
+            health_probe_map[key] = report
+        return report
+
     def get_ports_of_service(self, service: str) -> List[str] or None:
         """
         Find all TCP ports for given running service
@@ -99,8 +228,7 @@ class Health(Host):
             LOG.debug(res)
             res = res.decode("utf-8")
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
-            node = LogicalNode(hostname=self.hostname, username=self.username,
-                               password=self.password)
+            node = self.logical_node
             if pod_name is None:
                 resp = node.get_pod_name(pod_prefix=const.POD_NAME_PREFIX)
                 assert_true(resp[0], resp[1])
@@ -132,8 +260,7 @@ class Health(Host):
             LOG.debug(res)
             res = res.decode("utf-8")
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
-            node = LogicalNode(hostname=self.hostname, username=self.username,
-                               password=self.password)
+            node = self.logical_node
             if pod_name is None:
                 resp = node.get_pod_name(pod_prefix=const.POD_NAME_PREFIX)
                 assert_true(resp[0], resp[1])
@@ -162,8 +289,7 @@ class Health(Host):
             res = res.decode("utf-8")
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
             container = const.HAX_CONTAINER_NAME
-            node = LogicalNode(hostname=self.hostname, username=self.username,
-                               password=self.password)
+            node = self.logical_node
             resp = node.get_pod_name(pod_prefix=const.POD_NAME_PREFIX)
             assert_true(resp[0], resp[1])
             pod_name = resp[1]
@@ -248,9 +374,10 @@ class Health(Host):
 
         return resp
 
-    def is_motr_online(self) -> bool:
+    def is_motr_online(self, max_age: float = 0) -> bool:
         """
         Check whether all services are online in motr cluster.
+        :param max_age: Max age in seconds of a reusable cached health report (LC).
         :return: hctl response.
         """
         if CMN_CFG.get("product_family") == const.PROD_FAMILY_LR and \
@@ -263,7 +390,10 @@ class Health(Host):
                 if any(fail_str in line for fail_str in fail_list):
                     return False
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
-            result = self.hctl_status_json()
+            result = self.probe(max_age=max_age).hctl_status
+            if result is None:
+                LOG.error("Failed to get hctl status from %s", self.hostname)
+                return False
             for node in result["nodes"]:
                 pod_name = node["name"]
                 services = node["svcs"]
@@ -299,8 +429,7 @@ class Health(Host):
             LOG.debug("Machine is already configured..!")
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
             container = const.HAX_CONTAINER_NAME
-            node = LogicalNode(hostname=self.hostname, username=self.username,
-                               password=self.password)
+            node = self.logical_node
             resp = node.get_pod_name(pod_prefix=const.POD_NAME_PREFIX)
             assert_true(resp[0], resp[1])
             pod_name = resp[1]
@@ -380,8 +509,7 @@ class Health(Host):
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
             LOG.info("Executing command for LC product family....")
             container = const.HAX_CONTAINER_NAME
-            node = LogicalNode(hostname=self.hostname, username=self.username,
-                               password=self.password)
+            node = self.logical_node
             if pod_name is None:
                 resp = node.get_pod_name(pod_prefix=const.POD_NAME_PREFIX)
                 assert_true(resp[0], resp[1])
@@ -417,8 +545,7 @@ class Health(Host):
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
             LOG.info("Executing command for LC product family....")
             container = const.HAX_CONTAINER_NAME
-            node = LogicalNode(hostname=self.hostname, username=self.username,
-                               password=self.password)
+            node = self.logical_node
             cmd = "| sed -e '1,/Devices:/ d' -e 's/^[ \t]*//' | sed -n '/cortx-data/p;/\[/p'"
             if pod_name is None:
                 resp = node.get_pod_name(pod_prefix=const.POD_NAME_PREFIX)
@@ -470,11 +597,14 @@ class Health(Host):
         LOG.error("Product family: %s Unimplemented method", CMN_CFG.get("product_family"))
         return False, {}
 
-    def get_sys_capacity(self):
+    def get_sys_capacity(self, max_age: float = 0):
         """Parse the hctl response to extract used, available and total capacity
+        :param max_age: Max age in seconds of a reusable cached health report.
         :return [tuple]: total_cap,avail_cap,used_cap
         """
-        response = self.hctl_status_json()
+        response = self.probe(max_age=max_age).hctl_status
+        if response is None:
+            response = self.hctl_status_json()
         # LOG.info("HCTL response : \n%s", response)
         avail_cap = response['filesystem']['stats']['fs_avail_disk']
         LOG.info("Available Capacity : %s", avail_cap)
@@ -525,13 +655,15 @@ class Health(Host):
 
         return True, resp
 
-    def check_node_health(self, resource_cleanup: bool = False) -> tuple:
+    def check_node_health(self, resource_cleanup: bool = False, max_age: float = 0) -> tuple:
         """
         Check the node health (pcs and hctl status) and return True if all services up and running.
         1. Checking online status of node.
         2. Check hctl status response for all resources
         3. Check pcs status response for all resources
+        Status is collected with a single health probe of the node.
         :param resource_cleanup: If True will do pcs resources cleanup.
+        :param max_age: Max age in seconds of a reusable cached health report.
         :return: True or False, response/dictionary of failed hctl/pcs resources status.
         """
         if CMN_CFG.get("product_family") == const.PROD_FAMILY_LR and \
@@ -543,16 +675,12 @@ class Health(Host):
             LOG.info("Node %s is online.", self.hostname)
 
             LOG.info("Checking hctl status for %s node", self.hostname)
-            status, hctl_result = run_remote_cmd(
-                cmd=commands.MOTR_STATUS_CMD,
-                hostname=self.hostname,
-                username=self.username,
-                password=self.password,
-                read_lines=True)
-            if not status:
-                return False, f"Failed to get HCTL status {hctl_result}"
-
-            resp = self.hctl_status_json()
+            report = self.probe(max_age=0 if resource_cleanup else max_age)
+            hctl_result = report.output("hctl", read_lines=True)
+            if not report.status("hctl") or report.hctl_status is None:
+                return False, f"Failed to get HCTL status {report.results.get('hctl')}"
+
+            resp = report.hctl_status
             hctl_services_failed = {}
             svcs_elem = {'service': None, 'status': None}
             for node_data in resp['nodes']:
@@ -577,16 +705,12 @@ class Health(Host):
                 if "Cleaned up all resources on all nodes" not in str(response):
                     return False, "Failed to clean up all resources on all nodes"
                 time.sleep(10)
+                report = self.probe()
 
             LOG.info("Checking pcs status for %s node", self.hostname)
-            status, pcs_result = run_remote_cmd(
-                cmd=commands.PCS_STATUS_CMD,
-                hostname=self.hostname,
-                username=self.username,
-                password=self.password,
-                read_lines=True)
-            if not status:
-                return False, f"Failed to get PCS status {pcs_result}"
+            pcs_result = report.output("pcs", read_lines=True)
+            if not report.status("pcs"):
+                return False, f"Failed to get PCS status {report.results.get('pcs')}"
 
             pcs_failed_data = {}
             daemons = ["corosync:", "pacemaker:", "pcsd:"]
@@ -598,9 +722,7 @@ class Health(Host):
                             pcs_failed_data[daemon] = line
                             LOG.debug("Daemon %s status: %s", daemon, line)
 
-            response = self.execute_cmd(cmd=commands.CMD_PCS_GET_XML, read_lines=False, exc=False)
-            if isinstance(response, bytes):
-                response = str(response, 'UTF-8')
+            response = report.output("pcs_xml")
             json_format = self.get_node_health_xml(pcs_response=response)
             crm_mon_res = json_format['crm_mon']['resources']
             no_node = int(json_format['crm_mon']['summary']['nodes_configured']['@number'])
@@ -646,7 +768,7 @@ class Health(Host):
                 return False, node_health_failure
 
         elif CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
-            resp = self.is_motr_online()
+            resp = self.is_motr_online(max_age=max_age)
             if not resp:
                 return resp, "cluster health is not good"
         return True, "cluster on {} up and running.".format(self.hostname)
@@ -977,8 +1099,7 @@ class Health(Host):
         :param pod_name: Running pod to fetch the hctl status
         :return: Bool, list
         """
-        pod_obj = LogicalNode(hostname=self.hostname, username=self.username,
-                              password=self.password)
+        pod_obj = self.logical_node
         try:
             results = []
             if fail:
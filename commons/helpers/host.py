@@ -18,15 +18,20 @@
 #
 """Interface module for establishing connections."""
 
+import atexit
 import logging
 import os
 import posixpath
 import re
+import select
 import shutil
 import socket
 import stat
+import threading
 import time
 from typing import Any
+from typing import Callable
+from typing import Iterator
 from typing import List
 from typing import Tuple
 from typing import Union
@@ -52,6 +57,7 @@ class AbsHost:
         self.host_obj = None
         self.shell_obj = None
         self.pysftp_obj = None
+        self.pooled = False
 
     def connect(
             self,
@@ -68,6 +74,7 @@ class AbsHost:
         :param kwargs: Optional keyword arguments for SSHClient.connect func call.
         """
         try:
+            self.pooled = False
             self.host_obj = paramiko.SSHClient()
             self.host_obj.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             LOGGER.debug("Connecting to host: %s", str(self.hostname))
@@ -109,6 +116,24 @@ class AbsHost:
                 self.shell_obj.close()
             raise RuntimeError('Rethrowing the SSH exception') from error
 
+    def connect_pooled(
+            self,
+            shell: bool = False,
+            timeout: int = 400,
+            **kwargs) -> None:
+        """
+        Attach to the pooled long lived SSH connection of (hostname, username).
+        Commands executed on host_obj open a new channel on the pooled transport.
+        :param shell: In case required shell invocation.
+        :param timeout: timeout in seconds used if a new connection is established.
+        :param kwargs: Optional keyword arguments for SSHClient.connect func call.
+        """
+        self.host_obj = SSH_POOL.get_client(
+            self.hostname, self.username, self.password, timeout=timeout, **kwargs)
+        self.pooled = True
+        if shell:
+            self.shell_obj = self.host_obj.invoke_shell()
+
     def connect_pysftp(
             self,
             private_key: str = None,
@@ -132,9 +157,9 @@ class AbsHost:
 
     def disconnect(self) -> None:
         """
-        Disconnects the host obj.
+        Disconnects the host obj. Pooled connections are released to the pool, not closed.
         """
-        if self.host_obj:
+        if self.host_obj and not self.pooled:
             self.host_obj.close()
         if self.shell_obj:
             self.shell_obj.close()
@@ -143,6 +168,7 @@ class AbsHost:
         self.host_obj = None
         self.shell_obj = None
         self.pysftp_obj = None
+        self.pooled = False
 
     def reconnect(
             self,
@@ -166,6 +192,199 @@ class AbsHost:
         return False
 
 
+class SSHConnectionPool:
+    """
+    Process wide pool of long lived SSH connections keyed by (hostname, username, port).
+
+    Every pooled paramiko.SSHClient keeps its Transport open with keep-alive packets, so
+    a command only pays for opening a new channel instead of a full TCP, key exchange
+    and authentication handshake. Dead transports (e.g. after node reboot) are detected
+    on checkout and replaced transparently.
+    """
+
+    def __init__(self, keepalive: int = 30) -> None:
+        """
+        Initializer for SSHConnectionPool.
+        :param keepalive: interval in seconds for transport keep-alive packets.
+        """
+        self.keepalive = keepalive
+        self._clients = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_alive(client: paramiko.SSHClient) -> bool:
+        """
+        Check liveness of the transport of a pooled client.
+        :param client: paramiko SSHClient object.
+        :return: True if transport is active and writable.
+        """
+        transport = client.get_transport() if client else None
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+        except (SSHException, EOFError, OSError):
+            return False
+        return True
+
+    def get_client(
+            self,
+            hostname: str,
+            username: str,
+            password: str,
+            timeout: int = 400,
+            **kwargs) -> paramiko.SSHClient:
+        """
+        Get a live pooled client, connecting or reconnecting when required.
+        :param hostname: host name or ip.
+        :param username: user name.
+        :param password: password of the user.
+        :param timeout: connect timeout in seconds.
+        :param kwargs: Optional keyword arguments for SSHClient.connect func call.
+        :return: connected paramiko SSHClient object.
+        """
+        key = (hostname, username, kwargs.get("port", 22))
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            client = self._clients.get(key)
+            if client and self.is_alive(client):
+                return client
+            if client:
+                LOGGER.debug("Pooled SSH connection to %s is stale, reconnecting", hostname)
+                client.close()
+            host = AbsHost(hostname, username, password)
+            host.connect(timeout=timeout, **kwargs)
+            host.host_obj.get_transport().set_keepalive(self.keepalive)
+            self._clients[key] = host.host_obj
+            return host.host_obj
+
+    def invalidate(self, hostname: str, username: str, port: int = 22) -> None:
+        """
+        Close and drop the pooled connection of (hostname, username, port).
+        :param hostname: host name or ip.
+        :param username: user name.
+        :param port: ssh port.
+        """
+        with self._lock:
+            client = self._clients.pop((hostname, username, port), None)
+        if client:
+            client.close()
+
+    def close_all(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+SSH_POOL = SSHConnectionPool()
+atexit.register(SSH_POOL.close_all)
+
+
+class CommandStream:
+    """
+    Iterator over output of a remote command yielding lines (or chunks) as they arrive.
+
+    Data is received from the channel only when the consumer asks for more, so a slow consumer
+    throttles the remote command through the SSH window instead of buffering its output.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, channel: paramiko.Channel, read_lines: bool = True,
+                 stop_pattern: str = None, timeout: int = 400, chunk_size: int = 32768,
+                 stderr_callback: Callable[[str], Any] = None) -> None:
+        """
+        Initializer for CommandStream.
+        :param channel: paramiko channel on which command is executed.
+        :param read_lines: Yield decoded lines else raw bytes chunks.
+        :param stop_pattern: Stop streaming and close channel once a line/chunk matches.
+        :param timeout: Max seconds to wait for new output, None waits forever.
+        :param chunk_size: Max bytes received per read.
+        :param stderr_callback: Called with each stderr line, stderr lines are collected in
+        stderr attribute if not given.
+        """
+        self.channel = channel
+        self.read_lines = read_lines
+        self.stop_pattern = re.compile(stop_pattern) if stop_pattern else None
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.stderr_callback = stderr_callback
+        self.stderr = []
+        self.exit_status = None
+        self.matched = None
+        self._stderr_pending = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the channel, remote command gets SIGPIPE/EOF if still running."""
+        self.channel.close()
+
+    def _drain_stderr(self, final: bool = False) -> None:
+        """Process available stderr lines."""
+        while self.channel.recv_stderr_ready():
+            self._stderr_pending += self.channel.recv_stderr(self.chunk_size)
+        *lines, self._stderr_pending = self._stderr_pending.split(b"\n")
+        if final and self._stderr_pending:
+            lines.append(self._stderr_pending)
+            self._stderr_pending = b""
+        for line in lines:
+            line = line.decode("utf-8", errors="replace")
+            if self.stderr_callback:
+                self.stderr_callback(line)
+            else:
+                self.stderr.append(line)
+
+    def _chunks(self) -> Iterator[bytes]:
+        """Yield stdout chunks as they arrive."""
+        while True:
+            self._drain_stderr()
+            if self.channel.recv_ready():
+                yield self.channel.recv(self.chunk_size)
+            elif self.channel.eof_received or self.channel.closed:
+                break
+            elif not select.select([self.channel], [], [], self.timeout)[0]:
+                raise TimeoutError(f"No output received within {self.timeout} seconds")
+
+    def __iter__(self) -> Iterator[Union[str, bytes]]:
+        pending = b""
+        try:
+            for data in self._chunks():
+                if not self.read_lines:
+                    yield data
+                    if self._stop(data.decode("utf-8", errors="replace")):
+                        return
+                    continue
+                *lines, pending = (pending + data).split(b"\n")
+                for line in lines:
+                    line = line.decode("utf-8", errors="replace")
+                    yield line
+                    if self._stop(line):
+                        return
+            if pending:
+                line = pending.decode("utf-8", errors="replace")
+                yield line
+                self._stop(line)
+            self._drain_stderr(final=True)
+            self.exit_status = self.channel.recv_exit_status()
+        finally:
+            self.close()
+
+    def _stop(self, text: str) -> bool:
+        """Check stop pattern on text."""
+        if self.stop_pattern:
+            self.matched = self.stop_pattern.search(text)
+        return bool(self.matched)
+
+
 class Host(AbsHost):
     """Class for performing system file operation on Host"""
 
@@ -190,6 +409,7 @@ class Host(AbsHost):
         :param timeout: command and connect timeout.
         :param exc: Flag to disable/enable exception raising
         :param read_nbytes: maximum number of bytes to read.
+        :param pooled: Flag to use pooled persistent connection, default True.
         :return: stdout/strerr.
         """
         timer = time.time()
@@ -200,14 +420,14 @@ class Host(AbsHost):
         exc = kwargs.get('exc', True)
         if 'exc' in kwargs.keys():
             kwargs.pop('exc')
+        pooled = kwargs.pop('pooled', True)
         LOGGER.debug("Executing %s", cmd)
-        self.connect(**kwargs)  # fn will raise an exception
-        stdin, stdout, stderr = self.host_obj.exec_command(cmd, timeout=timeout)  # nosec
+        stdin, stdout, stderr = self._exec_command(cmd, timeout, pooled, **kwargs)
         # above is non blocking call and timeout is set for SSL handshake and command
         if check_recv_ready:
-            while time.time() - timer < timeout and not stdout.channel.exit_status_ready():
-                time.sleep(1)  # to avoid perf impact on other commands
-            if time.time() - timer >= timeout:  # as per request by CFT Deployment team
+            # wait on exit status event instead of polling to avoid perf impact
+            if not stdout.channel.status_event.wait(max(0, timeout - (time.time() - timer))):
+                # as per request by CFT Deployment team
                 raise TimeoutError('The script or command was not completed within estimated time')
         exit_status = stdout.channel.recv_exit_status()
         LOGGER.debug(exit_status)
@@ -234,6 +454,82 @@ class Host(AbsHost):
 
         return stdout.read(read_nbytes)
 
+    def execute_cmd_status(self, cmd: str, timeout: int = 400, **kwargs) -> Tuple[int, str, str]:
+        """
+        Execute command on remote machine without raising on non zero exit status.
+        :param cmd: command user wants to execute on host.
+        :param timeout: command and connect timeout.
+        :param pooled: Flag to use pooled persistent connection, default True.
+        :return: exit status, stdout, stderr.
+        """
+        pooled = kwargs.pop('pooled', True)
+        LOGGER.debug("Executing %s", cmd)
+        stdin, stdout, _ = self._exec_command(cmd, timeout, pooled, timeout=timeout, **kwargs)
+        stdin.close()
+        # stdout and stderr are drained together, a command filling the stderr window while
+        # stdout is read would block forever.
+        channel = stdout.channel
+        output, error = [], []
+        while True:
+            if channel.recv_ready():
+                output.append(channel.recv(32768))
+            elif channel.recv_stderr_ready():
+                error.append(channel.recv_stderr(32768))
+            elif (channel.eof_received or channel.closed) and not \
+                    (channel.recv_ready() or channel.recv_stderr_ready()):
+                break
+            elif not select.select([channel], [], [], timeout)[0]:
+                raise socket.timeout(f"No output of {cmd} received within {timeout} seconds")
+        output = b"".join(output).decode("utf-8", errors="replace")
+        error = b"".join(error).decode("utf-8", errors="replace")
+        exit_status = channel.recv_exit_status()
+        LOGGER.debug(exit_status)
+
+        return exit_status, output, error
+
+    def execute_cmd_stream(self, cmd: str, timeout: int = 400, read_lines: bool = True,
+                           stop_pattern: str = None, **kwargs) -> CommandStream:
+        """
+        Execute command on remote machine and stream its output as it arrives.
+        e.g. for line in host.execute_cmd_stream("kubectl logs -f pod", stop_pattern="Ready"):
+        :param cmd: command user wants to execute on host.
+        :param timeout: Max seconds to wait for new output, None waits till the command exits.
+        :param read_lines: Yield decoded lines else raw bytes chunks.
+        :param stop_pattern: Regex to stop streaming once matched, match is saved in matched.
+        :param chunk_size: Max bytes received per read.
+        :param stderr_callback: Called with each stderr line.
+        :param pooled: Flag to use pooled persistent connection, default True.
+        :return: CommandStream object, exit_status is set once output is consumed.
+        """
+        stream_kwargs = {key: kwargs.pop(key) for key in ("chunk_size", "stderr_callback")
+                         if key in kwargs}
+        pooled = kwargs.pop('pooled', True)
+        LOGGER.debug("Executing %s", cmd)
+        _, stdout, _ = self._exec_command(cmd, timeout, pooled, **kwargs)
+        return CommandStream(stdout.channel, read_lines=read_lines, stop_pattern=stop_pattern,
+                             timeout=timeout, **stream_kwargs)
+
+    def _exec_command(self, cmd: str, cmd_timeout: int, pooled: bool = True, **kwargs) -> tuple:
+        """
+        Open a new channel on the (pooled) connection and execute cmd on it.
+        A pooled connection which breaks while opening the channel is re-established once.
+        :param cmd: command user wants to execute on host.
+        :param cmd_timeout: command timeout.
+        :param pooled: Flag to use pooled persistent connection.
+        :return: stdin, stdout, stderr channel files.
+        """
+        if not pooled:
+            self.connect(**kwargs)  # fn will raise an exception
+            return self.host_obj.exec_command(cmd, timeout=cmd_timeout)  # nosec
+        self.connect_pooled(**kwargs)
+        try:
+            return self.host_obj.exec_command(cmd, timeout=cmd_timeout)  # nosec
+        except (SSHException, EOFError, OSError) as error:
+            LOGGER.debug("Pooled connection to %s failed: %s, reconnecting", self.hostname, error)
+            SSH_POOL.invalidate(self.hostname, self.username, kwargs.get("port", 22))
+            self.connect_pooled(**kwargs)
+            return self.host_obj.exec_command(cmd, timeout=cmd_timeout)  # nosec
+
     def path_exists(self, path: str) -> bool:
         """
         Check if file exists.
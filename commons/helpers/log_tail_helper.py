@@ -0,0 +1,197 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Incremental remote log tailing with persisted offsets.
+
+Records the byte offset of a remote log file at a marker point and later fetches only the bytes
+appended after it, filtering them with grep on the remote side, so the log file is never copied
+as a whole.
+"""
+
+import json
+import logging
+import os
+import shlex
+import threading
+from typing import List
+from typing import Union
+
+from commons import commands
+from commons.helpers.host import Host
+from commons.params import LOG_DIR
+from commons.utils.wait_utils import wait_until
+
+LOGGER = logging.getLogger(__name__)
+
+OFFSETS_FILE = os.path.join(LOG_DIR, "remote_log_offsets.json")
+
+
+class RemoteLogTail:
+    """Tail remote log files from persisted byte offsets."""
+
+    _lock = threading.Lock()
+
+    def __init__(self, host: Host, offsets_file: str = OFFSETS_FILE) -> None:
+        """
+        Initializer for RemoteLogTail.
+        :param host: Host/Node object of the node having log files.
+        :param offsets_file: Local json file in which offsets are persisted.
+        """
+        self.host = host
+        self.offsets_file = offsets_file
+
+    def _key(self, path: str, marker: str) -> str:
+        """Key of the offset of (host, path, marker)."""
+        return f"{self.host.hostname}:{path}:{marker}"
+
+    def _load_offsets(self) -> dict:
+        """Load persisted offsets."""
+        if not os.path.exists(self.offsets_file):
+            return {}
+        with open(self.offsets_file, "r", encoding="utf-8") as offsets:
+            return json.load(offsets)
+
+    def _save_offset(self, path: str, marker: str, offset: Union[int, None]) -> None:
+        """Persist offset of (host, path, marker), None removes the offset."""
+        with self._lock:
+            data = self._load_offsets()
+            if offset is None:
+                data.pop(self._key(path, marker), None)
+            else:
+                data[self._key(path, marker)] = offset
+            os.makedirs(os.path.dirname(os.path.abspath(self.offsets_file)), exist_ok=True)
+            tmp_file = f"{self.offsets_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as offsets:
+                json.dump(data, offsets)
+            os.replace(tmp_file, self.offsets_file)
+
+    def get_offset(self, path: str, marker: str = "default") -> Union[int, None]:
+        """
+        Get persisted offset.
+        :param path: Remote log file path.
+        :param marker: Name of the marker.
+        :return: byte offset or None if not marked.
+        """
+        with self._lock:
+            return self._load_offsets().get(self._key(path, marker))
+
+    def get_size(self, path: str) -> int:
+        """Size of the remote file in bytes, 0 if file does not exist."""
+        status, output, _ = self.host.execute_cmd_status(
+            commands.CMD_FILE_SIZE.format(shlex.quote(path)))
+        return int(output.strip()) if status == 0 else 0
+
+    def mark(self, path: str, marker: str = "default") -> int:
+        """
+        Record current end of the remote file as marker.
+        :param path: Remote log file path.
+        :param marker: Name of the marker.
+        :return: byte offset.
+        """
+        offset = self.get_size(path)
+        self._save_offset(path, marker, offset)
+        LOGGER.debug("Marked %s:%s at offset %s as %s", self.host.hostname, path, offset, marker)
+        return offset
+
+    def clear(self, path: str, marker: str = "default") -> None:
+        """Remove persisted offset of marker."""
+        self._save_offset(path, marker, None)
+
+    @staticmethod
+    def _grep(pattern: Union[str, List[str]], fixed: bool = False, invert: bool = False,
+              count: bool = False) -> str:
+        """
+        Build grep filter for pattern(s).
+        Regex patterns use grep -P, which accepts python re syntax like \\d, and takes a single
+        pattern, so multiple patterns are joined in an alternation.
+        """
+        patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+        if not fixed:
+            patterns = ["|".join(f"(?:{pat})" for pat in patterns)]
+        options = "-F" if fixed else "-P"
+        options += " -v" if invert else ""
+        options += " -c" if count else ""
+        return f"grep {options} " + " ".join(f"-e {shlex.quote(pat)}" for pat in patterns)
+
+    def _range_cmd(self, path: str, marker: str) -> tuple:
+        """Command reading bytes appended after marker and the new end offset."""
+        offset = self.get_offset(path, marker) or 0
+        size = self.get_size(path)
+        if size < offset:
+            LOGGER.debug("%s truncated or rotated since %s, reading from start", path, marker)
+            offset = 0
+        cmd = commands.CMD_READ_FROM_OFFSET.format(offset + 1, shlex.quote(path), size - offset)
+        return cmd, size - offset, size
+
+    # pylint: disable=too-many-arguments
+    def read_new(self, path: str, marker: str = "default",
+                 pattern: Union[str, List[str]] = None, fixed: bool = False,
+                 invert: bool = False, advance: bool = True) -> List[str]:
+        """
+        Fetch lines appended after marker, filtered on the remote node.
+        :param path: Remote log file path.
+        :param marker: Name of the marker, not marked files are read from start.
+        :param pattern: Regex (python re syntax) or list of them, lines matching any are returned.
+        :param fixed: Treat pattern as fixed strings.
+        :param invert: Return lines not matching pattern.
+        :param advance: Move marker to the end of the data read.
+        :return: list of lines.
+        """
+        cmd, nbytes, size = self._range_cmd(path, marker)
+        lines = []
+        if nbytes:
+            if pattern:
+                cmd = f"{cmd} | {self._grep(pattern, fixed, invert)}"
+            status, output, error = self.host.execute_cmd_status(cmd)
+            if status not in (0, 1):  # grep returns 1 for no match
+                raise IOError(error)
+            lines = output.splitlines()
+        if advance:
+            self._save_offset(path, marker, size)
+        return lines
+
+    # pylint: disable=too-many-arguments
+    def count_new(self, path: str, pattern: Union[str, List[str]], marker: str = "default",
+                  fixed: bool = False, invert: bool = False) -> int:
+        """
+        Count lines appended after marker which match (or not match if invert) pattern.
+        Marker is not moved.
+        :return: number of lines.
+        """
+        cmd, nbytes, _ = self._range_cmd(path, marker)
+        if not nbytes:
+            return 0
+        cmd = f"{cmd} | {self._grep(pattern, fixed, invert, count=True)}"
+        status, output, error = self.host.execute_cmd_status(cmd)
+        if status not in (0, 1):
+            raise IOError(error)
+        return int(output.strip() or 0)
+
+    # pylint: disable=too-many-arguments
+    def wait_for_pattern(self, path: str, pattern: Union[str, List[str]],
+                         marker: str = "default", timeout: int = 120, interval: int = 2,
+                         fixed: bool = False) -> List[str]:
+        """
+        Poll lines appended after marker till pattern shows up or timeout.
+        :return: matched lines, empty list on timeout.
+        """
+        def _match():
+            return self.read_new(path, marker, pattern=pattern, fixed=fixed)
+
+        return wait_until(_match, timeout=timeout, interval=interval, max_interval=15,
+                          desc=f"{pattern} in {path}", raise_on_timeout=False) or []
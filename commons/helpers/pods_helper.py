@@ -21,19 +21,97 @@ However validation of sub commands and options can be done in command issuing fu
 like send_k8s_cmd.
 """
 
+import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 from typing import Tuple
 
 from commons import commands
 from commons import constants as const
 from commons.helpers.host import Host
+from commons.utils.wait_utils import wait_until
 
 log = logging.getLogger(__name__)
 
 namespace_map = {}
 
+# Pods snapshots shared by all LogicalNode objects of a (hostname, username).
+pods_snapshot_map = {}
+pods_snapshot_lock = threading.Lock()
+
+
+class PodsSnapshot:
+    """Indexed in-memory model of the `kubectl get pods -o json` output."""
+
+    def __init__(self, pods_json: dict) -> None:
+        """
+        Parse kubectl pods json into pods indexed by name, node, ip and container.
+        :param pods_json: Parsed output of `kubectl get pods -o json`.
+        """
+        self.timestamp = time.time()
+        self.pods = []
+        self.containers = {}
+        self.ips = {}
+        self.nodes = {}
+        self.phases = {}
+        self.pods_by_node = {}
+        self.pod_by_ip = {}
+        self.pods_by_container = {}
+        for item in pods_json.get("items", []):
+            name = item["metadata"]["name"]
+            status = item.get("status", {})
+            node = item.get("spec", {}).get("nodeName", "<none>")
+            pod_ip = status.get("podIP", "<none>")
+            self.pods.append(name)
+            self.containers[name] = [cnt["name"] for cnt in item["spec"].get("containers", [])]
+            self.ips[name] = pod_ip
+            self.nodes[name] = node
+            self.phases[name] = status.get("phase")
+            self.pods_by_node.setdefault(node, []).append(name)
+            self.pod_by_ip[pod_ip] = name
+            for cnt in self.containers[name]:
+                self.pods_by_container.setdefault(cnt, []).append(name)
+
+    def age(self) -> float:
+        """Seconds elapsed since snapshot was taken."""
+        return time.time() - self.timestamp
+
+    def get_pods(self, pod_prefix: str = None) -> list:
+        """Pod names containing pod_prefix, all pods if pod_prefix is None."""
+        if pod_prefix is None:
+            return list(self.pods)
+        return [pod for pod in self.pods if pod_prefix in pod]
+
+
+class PodExecResult:
+    """Result of a command executed in a pod container."""
+
+    def __init__(self, pod: str, container: str, cmd: str) -> None:
+        """Initializer for PodExecResult."""
+        self.pod = pod
+        self.container = container
+        self.cmd = cmd
+        self.exit_status = None
+        self.output = None
+        self.error = None
+        self.exception = None
+        self.start_time = None
+        self.duration = None
+
+    @property
+    def status(self) -> bool:
+        """True if command completed without exception and with zero exit status."""
+        return self.exception is None and self.exit_status == 0
+
+    def __repr__(self) -> str:
+        return (f"PodExecResult(pod={self.pod!r}, container={self.container!r}, "
+                f"exit_status={self.exit_status}, duration={self.duration}, "
+                f"exception={self.exception!r})")
+
 
 class LogicalNode(Host):
     """Pods helper class. The Command builder should be written separately and will be
@@ -43,6 +121,66 @@ class LogicalNode(Host):
     kube_commands = ('create', 'apply', 'config', 'get', 'explain',
                      'autoscale', 'patch', 'scale', 'exec')
 
+    # Max age in seconds of pods snapshot used for answering pod queries.
+    pods_snapshot_ttl = 5
+
+    def get_pods_snapshot(self, refresh: bool = False) -> PodsSnapshot:
+        """
+        Get pods snapshot of the cluster, kubectl is executed only if the cached snapshot is
+        older than pods_snapshot_ttl or invalidated.
+        :param refresh: Force a new snapshot.
+        :return: PodsSnapshot object.
+        """
+        key = (self.hostname, self.username)
+        with pods_snapshot_lock:
+            snapshot = pods_snapshot_map.get(key)
+        if refresh or snapshot is None or snapshot.age() > self.pods_snapshot_ttl:
+            output = self.execute_cmd(cmd=commands.KUBECTL_GET_PODS_JSON)
+            snapshot = PodsSnapshot(json.loads(output))
+            with pods_snapshot_lock:
+                pods_snapshot_map[key] = snapshot
+        return snapshot
+
+    def invalidate_pods_snapshot(self) -> None:
+        """Drop cached pods snapshot, to be called after disruptive actions."""
+        with pods_snapshot_lock:
+            pods_snapshot_map.pop((self.hostname, self.username), None)
+
+    def exec_in_pods(self, targets: List[Tuple[str, str, str]], max_workers: int = 8,
+                     timeout: int = 400) -> List[PodExecResult]:
+        """
+        Run kubectl exec for multiple (pod, container, command) targets concurrently, each on
+        its own channel of the pooled SSH connection to this node.
+        :param targets: list of (pod, container, command), container None for default one.
+        :param max_workers: Max concurrent kubectl exec.
+        :param timeout: Per command timeout in seconds.
+        :return: list of PodExecResult in order of targets.
+        """
+        def _exec(result: PodExecResult) -> PodExecResult:
+            suffix = f"-c {result.container} -- {result.cmd}" if result.container \
+                else f"-- {result.cmd}"
+            cmd = commands.KUBECTL_CMD.format("exec", result.pod, const.NAMESPACE, suffix)
+            result.start_time = time.time()
+            try:
+                result.exit_status, result.output, result.error = self.execute_cmd_status(
+                    cmd, timeout=timeout)
+            except Exception as error:  # pylint: disable=broad-except
+                log.error("%s %s on %s/%s: %s", const.EXCEPTION_ERROR,
+                          LogicalNode.exec_in_pods.__name__, result.pod, result.container, error)
+                result.exception = error
+            result.duration = time.time() - result.start_time
+            return result
+
+        results = [PodExecResult(pod, cnt, cmd) for pod, cnt, cmd in targets]
+        if not results:
+            return results
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(results)))) as executor:
+            list(executor.map(_exec, results))
+        for result in results:
+            log.debug("%s/%s: %s exit status %s in %.2f sec", result.pod, result.container,
+                      result.cmd, result.exit_status, result.duration)
+        return results
+
     def get_service_logs(self, svc_name: str, namespace: str, options: '') -> Tuple:
         """Get logs of a pod or service."""
         cmd = commands.FETCH_LOGS.format(svc_name, namespace, options)
@@ -78,6 +216,7 @@ class LogicalNode(Host):
                 cmd)
             resp = self.execute_cmd(cmd, shell=False)
             log.debug(resp)
+            self.invalidate_pods_snapshot()
         except Exception as error:
             log.error("*ERROR* An exception occurred in %s: %s",
                       LogicalNode.shutdown_node.__name__, error)
@@ -85,13 +224,11 @@ class LogicalNode(Host):
 
         return True, "Node shutdown successfully"
 
-    def get_pod_name(self, pod_prefix: str = const.POD_NAME_PREFIX):
+    def get_pod_name(self, pod_prefix: str = const.POD_NAME_PREFIX, refresh: bool = False):
         """Function to get pod name with given prefix."""
-        output = self.execute_cmd(commands.CMD_POD_STATUS +
-                                  " -o=custom-columns=NAME:.metadata.name", read_lines=True)
-        for lines in output:
-            if pod_prefix in lines:
-                return True, lines.strip()
+        pods = self.get_pods_snapshot(refresh=refresh).get_pods(pod_prefix)
+        if pods:
+            return True, pods[0]
         return False, f"pod with prefix \"{pod_prefix}\" not found"
 
     def send_sync_command(self, pod_prefix):
@@ -102,33 +239,36 @@ class LogicalNode(Host):
         """
         log.info("Run sync command on all containers of pods %s", pod_prefix)
         pod_dict = self.get_all_pods_containers(pod_prefix=pod_prefix)
-        if pod_dict:
-            for pod, containers in pod_dict.items():
-                for cnt in containers:
-                    res = self.send_k8s_cmd(
-                        operation="exec", pod=pod, namespace=const.NAMESPACE,
-                        command_suffix=f"-c {cnt} -- sync", decode=True)
-                    log.info("Response for pod %s container %s: %s", pod, cnt, res)
+        targets = [(pod, cnt, "sync") for pod, containers in pod_dict.items()
+                   for cnt in containers]
+        for result in self.exec_in_pods(targets):
+            if not result.status:
+                raise IOError(result.exception or result.error or result.output)
+            log.info("Response for pod %s container %s: %s", result.pod, result.container,
+                     result.output.strip())
 
         return True
 
-    def get_all_pods_containers(self, pod_prefix, pod_list=None):
+    def get_all_pods_containers(self, pod_prefix, pod_list=None, refresh: bool = False):
         """
         Helper function to get all pods with containers of given pod_prefix
         :param pod_prefix: Prefix to define the pod category
         :param pod_list: List of pods
+        :param refresh: Force a new pods snapshot
         :return: Dict
         """
         pod_containers = {}
+        snapshot = self.get_pods_snapshot(refresh=refresh)
         if not pod_list:
             log.info("Get all data pod names of %s", pod_prefix)
-            output = self.execute_cmd(commands.CMD_POD_STATUS +
-                                      " -o=custom-columns=NAME:.metadata.name", read_lines=True)
-            for lines in output:
-                if pod_prefix in lines:
-                    pod_list.append(lines.strip())
+            pod_list = snapshot.get_pods(pod_prefix)
+        elif any(pod not in snapshot.containers for pod in pod_list):
+            snapshot = self.get_pods_snapshot(refresh=True)
 
         for pod in pod_list:
+            if pod in snapshot.containers:
+                pod_containers[pod] = list(snapshot.containers[pod])
+                continue
             cmd = commands.KUBECTL_GET_POD_CONTAINERS.format(pod)
             output = self.execute_cmd(cmd=cmd, read_lines=True)
             output = output[0].split()
@@ -153,10 +293,9 @@ class LogicalNode(Host):
             cmd = commands.KUBECTL_CREATE_REPLICA.format(num_replica, deploy)
             output = self.execute_cmd(cmd=cmd, read_lines=True)
             log.info("Response: %s", output)
-            time.sleep(60)
+            self.invalidate_pods_snapshot()
             log.info("Check if pod of deployment %s exists", deploy)
-            cmd = commands.KUBECTL_GET_POD_DETAILS.format(deploy)
-            output = self.execute_cmd(cmd=cmd, read_lines=True, exc=False)
+            output = self._wait_for_deploy_pods(deploy, exists=bool(num_replica))
             status = True if output else False
             return status, deploy
         except Exception as error:
@@ -164,6 +303,35 @@ class LogicalNode(Host):
                       LogicalNode.create_pod_replicas.__name__, error)
             return False, error
 
+    def _wait_for_deploy_pods(self, deploy: str, exists: bool = True, timeout: int = 60):
+        """
+        Wait till pods of deployment are running and ready (exists=True) or removed
+        (exists=False) or timeout.
+        :param deploy: Name of the deployment
+        :param exists: True to wait for pods to be ready, False to wait for their removal
+        :param timeout: Max wait time in seconds
+        :return: Pods details output
+        """
+        cmd = commands.KUBECTL_GET_POD_DETAILS.format(deploy)
+        output = {}
+
+        def _check():
+            output["resp"] = self.execute_cmd(cmd=cmd, read_lines=True, exc=False)
+            if not exists:
+                return not output["resp"]
+            for line in output["resp"] or [None]:
+                fields = line.split() if isinstance(line, str) else []
+                if len(fields) < 3 or fields[2] != "Running":
+                    return False
+                ready, total = fields[1].split("/")
+                if ready != total:
+                    return False
+            return True
+
+        wait_until(_check, timeout=timeout, interval=5, max_interval=15,
+                   desc=f"pods of {deploy} exists={exists}", raise_on_timeout=False)
+        return output["resp"]
+
     def delete_pod(self, pod_name, force=False):
         """
         Helper function to delete pod gracefully or forcefully using kubectl delete command
@@ -177,6 +345,7 @@ class LogicalNode(Host):
             cmd = commands.K8S_DELETE_POD.format(pod_name) + extra_param
             output = self.execute_cmd(cmd=cmd, read_lines=True)
             log.info("Response: %s", output)
+            self.invalidate_pods_snapshot()
         except Exception as error:
             log.error("*ERROR* An exception occurred in %s: %s",
                       LogicalNode.delete_pod.__name__, error)
@@ -242,10 +411,9 @@ class LogicalNode(Host):
             cmd = commands.KUBECTL_DEL_DEPLOY.format(deploy)
             output = self.execute_cmd(cmd=cmd, read_lines=True)
             log.info("Response: %s", output)
-            time.sleep(60)
+            self.invalidate_pods_snapshot()
             log.info("Check if pod of deployment %s exists", deploy)
-            cmd = commands.KUBECTL_GET_POD_DETAILS.format(deploy)
-            output = self.execute_cmd(cmd=cmd, read_lines=True, exc=False)
+            output = self._wait_for_deploy_pods(deploy, exists=False)
             status = True if output else False
             return status, backup_path, deploy
         except Exception as error:
@@ -268,10 +436,9 @@ class LogicalNode(Host):
             cmd = commands.HELM_ROLLBACK.format(helm_rel, rel_revision)
             output = self.execute_cmd(cmd=cmd, read_lines=True)
             log.info("Response: %s", output)
-            time.sleep(60)
+            self.invalidate_pods_snapshot()
             log.info("Check if pod of deployment %s exists", deployment_name)
-            cmd = commands.KUBECTL_GET_POD_DETAILS.format(deployment_name)
-            output = self.execute_cmd(cmd=cmd, read_lines=True, exc=False)
+            output = self._wait_for_deploy_pods(deployment_name, exists=True)
             status = True if output else False
             return status, helm_rel, rel_revision
         except Exception as error:
@@ -291,10 +458,9 @@ class LogicalNode(Host):
             cmd = commands.KUBECTL_RECOVER_DEPLOY.format(backup_path)
             output = self.execute_cmd(cmd=cmd, read_lines=True)
             log.info("Response: %s", output)
-            time.sleep(60)
+            self.invalidate_pods_snapshot()
             log.info("Check if pod of deployment %s exists", deployment_name)
-            cmd = commands.KUBECTL_GET_POD_DETAILS.format(deployment_name)
-            output = self.execute_cmd(cmd=cmd, read_lines=True, exc=False)
+            output = self._wait_for_deploy_pods(deployment_name, exists=True)
             status = True if output else False
             return status, output
         except Exception as error:
@@ -353,21 +519,15 @@ class LogicalNode(Host):
                       LogicalNode.get_helm_rel_name_rev.__name__, error)
             return False, error
 
-    def get_all_pods_and_ips(self, pod_prefix) -> dict:
+    def get_all_pods_and_ips(self, pod_prefix, refresh: bool = False) -> dict:
         """
         Helper function to get pods name with pod_prefix and their IPs
         :param: pod_prefix: Prefix to define the pod category
+        :param refresh: Force a new pods snapshot
         :return: dict
         """
-        pod_dict = {}
-        output = self.execute_cmd(cmd=commands.KUBECTL_GET_POD_IPS, read_lines=True)
-        for lines in output:
-            if pod_prefix in lines:
-                data = lines.strip()
-                pod_name = data.split()[0]
-                pod_ip = data.split()[1].replace("\n", "")
-                pod_dict[pod_name.strip()] = pod_ip.strip()
-        return pod_dict
+        snapshot = self.get_pods_snapshot(refresh=refresh)
+        return {pod: snapshot.ips[pod] for pod in snapshot.get_pods(pod_prefix)}
 
     def get_container_of_pod(self, pod_name, container_prefix):
         """
@@ -404,22 +564,14 @@ class LogicalNode(Host):
             pod_name = output[0].strip()
         return pod_name
 
-    def get_all_pods(self, pod_prefix=None) -> list:
+    def get_all_pods(self, pod_prefix=None, refresh: bool = False) -> list:
         """
         Helper function to get all pods name with pod_prefix
         :param: pod_prefix: Prefix to define the pod category
+        :param refresh: Force a new pods snapshot
         :return: list
         """
-        pods_list = []
-        log.debug("Executing : %s", commands.KUBECTL_GET_POD_NAMES)
-        output = self.execute_cmd(cmd=commands.KUBECTL_GET_POD_NAMES, read_lines=True)
-        pods = [line.strip().replace("\n", "") for line in output]
-        if pod_prefix is not None:
-            for each in pods:
-                if pod_prefix in each:
-                    pods_list.append(each)
-        else:
-            pods_list = pods
+        pods_list = self.get_pods_snapshot(refresh=refresh).get_pods(pod_prefix)
         log.debug("Pods list : %s", pods_list)
         return pods_list
 
@@ -452,21 +604,15 @@ class LogicalNode(Host):
                                  decode=True)
         return resp
 
-    def get_pods_node_fqdn(self, pod_prefix):
+    def get_pods_node_fqdn(self, pod_prefix, refresh: bool = False):
         """
         Helper function to get pods name with pod_prefix and their node fqdn
         :param: pod_prefix: Prefix to define the pod category
+        :param refresh: Force a new pods snapshot
         :return: dict
         """
-        pod_dict = {}
-        output = self.execute_cmd(cmd=commands.K8S_GET_MGNT, read_lines=True)
-        for line in output:
-            if pod_prefix in line:
-                data = line.strip()
-                pod_name = data.split()[0]
-                node_fqdn = data.split()[6]
-                pod_dict[pod_name.strip()] = node_fqdn.strip()
-        return pod_dict
+        snapshot = self.get_pods_snapshot(refresh=refresh)
+        return {pod: snapshot.nodes[pod] for pod in snapshot.get_pods(pod_prefix)}
 
     def get_pod_hostname(self, pod_name):
         """
@@ -506,6 +652,7 @@ class LogicalNode(Host):
         resp = self.send_k8s_cmd(operation="exec", pod=pod_name, namespace=const.NAMESPACE,
                                  command_suffix=f"-c {container_name} -- {cmd}",
                                  decode=True)
+        self.invalidate_pods_snapshot()
         return resp
 
     def get_all_cluster_processes(self, pod_name, container_name):
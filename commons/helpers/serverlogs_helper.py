@@ -19,6 +19,7 @@
 
 """ This helper file is used to collect logs from Nodes for the given time stamps """
 
+import os
 from datetime import datetime
 from commons.helpers import host
 from commons.utils import config_utils
@@ -29,6 +30,12 @@ fileconf = fileconf_yaml[1]
 now = datetime.now()
 current_time = now.strftime('%b  %#d %H:%M:%S')
 
+# timestamp format ('%b %d %H:%M:%S') -> "Dec 12 16:06:01", year is not logged
+LOG_TIME_FORMAT = "%b %d %H:%M:%S"
+# leap year used for year less timestamps so that "Feb 29" is valid
+LOG_TIME_YEAR = 2000
+COPY_CHUNK_SIZE = 1024 * 1024
+
 class node_data:
     def __init__(self):
         self.ip = None
@@ -42,35 +49,120 @@ def get_node_details(node_name):
     node_obj.passwd = fileconf['node_password']
     return node_obj
 
-def split_file_for_timestamp(st_time, end_time, filename, filepath, test_id):
+def parse_log_timestamp(line, time_format=LOG_TIME_FORMAT):
+    """
+    Parse timestamp from first three fields of a log line.
+    :param line: log line (str or bytes)
+    :param time_format: strptime format of the timestamp fields
+    :return: datetime or None if line does not start with timestamp
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
+    fields = line.split()
+    if len(fields) < 3:
+        return None
+    try:
+        return datetime.strptime("{} {}".format(LOG_TIME_YEAR, " ".join(fields[:3])),
+                                 "%Y " + time_format)
+    except ValueError:
+        return None
+
+def _timestamped_line_at(fobj, pos):
+    """Offset and timestamp of the first timestamped line starting at or after pos."""
+    if pos > 0:
+        fobj.seek(pos - 1)
+        fobj.readline()
+    else:
+        fobj.seek(0)
+    while True:
+        start = fobj.tell()
+        line = fobj.readline()
+        if not line:
+            return start, None
+        timestamp = parse_log_timestamp(line)
+        if timestamp:
+            return start, timestamp
+
+def find_time_offset(fobj, size, target, after=False):
+    """
+    Binary search byte offset of first line with timestamp >= target (> target if after)
+    in a seekable, time sorted log opened in binary mode (local file or sftp file).
+    :param fobj: seekable binary file object
+    :param size: size of the file in bytes
+    :param target: datetime to search
+    :param after: search first line with timestamp strictly after target
+    :return: byte offset, size if no such line
+    """
+    low, high = 0, size
+    while low < high:
+        mid = (low + high) // 2
+        _, timestamp = _timestamped_line_at(fobj, mid)
+        if timestamp is None or timestamp > target or (not after and timestamp == target):
+            high = mid
+        else:
+            low = mid + 1
+    return _timestamped_line_at(fobj, low)[0]
+
+def extract_log_window(fobj, size, st_time, end_time, outfile, sorted_log=True):
+    """
+    Write lines of log between st_time and end_time (inclusive) to outfile.
+    Sorted logs are binary searched and only the window is read, others are scanned.
+    :param fobj: seekable binary file object
+    :param size: size of the file in bytes
+    :param st_time: start timestamp string e.g. "Dec 12 16:06:01"
+    :param end_time: end timestamp string
+    :param outfile: binary file object to write window into
+    :param sorted_log: log lines are sorted on time
+    :return: number of bytes written
+    """
+    start_time = parse_log_timestamp(st_time)
+    end_time = parse_log_timestamp(end_time)
+    written = 0
+    if not sorted_log:
+        fobj.seek(0)
+        in_window = False
+        for line in fobj:
+            timestamp = parse_log_timestamp(line)
+            if timestamp:
+                in_window = start_time <= timestamp <= end_time
+            if in_window:
+                outfile.write(line)
+                written += len(line)
+        return written
+    start = find_time_offset(fobj, size, start_time)
+    end = find_time_offset(fobj, size, end_time, after=True)
+    fobj.seek(start)
+    while start + written < end:
+        chunk = fobj.read(min(COPY_CHUNK_SIZE, end - start - written))
+        if not chunk:
+            break
+        outfile.write(chunk)
+        written += len(chunk)
+    return written
+
+def split_file_for_timestamp(st_time, end_time, filename, filepath, test_id, sorted_log=True):
     # split file for give time stamps and create new file with test_id
     # appended to it
     path = "{}/{}".format(filepath, filename)
-    logfile = open(path, 'r')
-
     newname = "{}_{}".format(test_id, filename)
     newpath = "{}/{}".format(fileconf['log_destination'], newname)
-    newfile = open(newpath, 'w')
-
-    # timestamp format ('%b %#d %H:%M:%S') -> "Dec 12 16:06:01"
-    st_t = st_time.split()
-    en_t = end_time.split()
-    start_time = "{} {} {}".format(st_t[0], st_t[1], st_t[2])
-    end_time = "{} {} {}".format(en_t[0], en_t[1], en_t[2])
-
-    for line in logfile:
-        ls = line.split(' ')
-        # PLEASE CHECK TIMESTAMP IN LOG FILES FIRST, For every file it might be
-        # different
-        timestamp = "{} {} {}".format(ls[0], ls[1], ls[2])
-        if timestamp >= start_time and timestamp <= end_time:
-            newfile.write(line)
-
-    newfile.close()  # close it if done writing into it
-    logfile.close()
+    # PLEASE CHECK TIMESTAMP IN LOG FILES FIRST, For every file it might be
+    # different
+    with open(path, 'rb') as logfile, open(newpath, 'wb') as newfile:
+        extract_log_window(logfile, os.path.getsize(path), st_time, end_time, newfile,
+                           sorted_log=sorted_log)
 
     return newpath
 
+def get_logserver_sftp():
+    """Open sftp session on the pooled connection of log server."""
+    hostobj = host.Host(
+        hostname=fileconf['logserver'],
+        username=fileconf['logserver_username'],
+        password=fileconf['logserver_password'])
+    hostobj.connect_pooled()
+    return hostobj.host_obj.open_sftp()
+
 def process_and_copy_file(
         st_time,
         end_time,
@@ -78,53 +170,44 @@ def process_and_copy_file(
         file_path,
         localpath,
         test_id,
-        sftp):
-    # Copy file from node to test client
+        sftp,
+        logserver_sftp=None):
+    # 1. Extract given time window of file on node, only the window is transferred
     nodepath = "{}/{}".format(file_path, file_name)
-    dest_path = "{}/{}".format(fileconf['log_destination'], file_name)
-    # @TODO - check sftp.get(), this call might be wrong
-    sftp.get(remotepath=nodepath, localpath=dest_path)
-
-    # 1. Fetch give file from node and Split file for given time stamp
-    newfilepath = split_file_for_timestamp(
-        st_time,
-        end_time,
-        file_name,
-        fileconf['log_destination'],
-        test_id)
-
-    # 2. Copy file from node to remote server <<< @TODO need new connection
-    # here !! MISSING !!!
-    logserver = fileconf['logserver']
-    lg_uname = fileconf['logserver_username']
-    lg_passwd = fileconf['logserver_password']
-    remote_path = fileconf['logserver_path']
-    filename = "{}_{}".format(test_id, file_name)
-    rm_path = "{}/{}".format(remote_path, filename)
-
-    hostobj = host.Host(
-        hostname=logserver,
-        username=lg_uname,
-        password=lg_passwd)
-    hostobj.connect()
-    sftp = hostobj.host_obj.open_sftp()
-    sftp.put(localpath=newfilepath, remotepath=rm_path)
+    newname = "{}_{}".format(test_id, file_name)
+    newfilepath = "{}/{}".format(fileconf['log_destination'], newname)
+    size = sftp.stat(nodepath).st_size
+    with sftp.open(nodepath, 'rb') as logfile, open(newfilepath, 'wb') as newfile:
+        extract_log_window(logfile, size, st_time, end_time, newfile)
+
+    # 2. Copy file from test client to log server
+    rm_path = "{}/{}".format(fileconf['logserver_path'], newname)
+    close_logserver = logserver_sftp is None
+    if close_logserver:
+        logserver_sftp = get_logserver_sftp()
+    logserver_sftp.put(localpath=newfilepath, remotepath=rm_path)
+    if close_logserver:
+        logserver_sftp.close()
+
+    return newfilepath
 
 def collect_logs(st_time, end_time, file, node, test_id):
     # error = False #@ TODO - error handling to be done, connection retry
-    # 1. Connect to node
+    # 1. Connect to node, all files of the node are processed on one sftp session
     node_det = get_node_details(node)
     hostobj = host.Host(
         hostname=node_det.ip,
         username=node_det.uname,
         password=node_det.passwd)
-    hostobj.connect()
+    hostobj.connect_pooled()
     sftp = hostobj.host_obj.open_sftp()
+    logserver_sftp = get_logserver_sftp()
     localpath = "{}_{}".format(fileconf['log_destination'], test_id)
 
-    if file is "all":
-        for fname in fileconf['file_list']:
-            file_name = "{}{}".format(file, fileconf['file_exention'])
+    file_list = fileconf['file_list'] if file == "all" else [file]
+    try:
+        for fname in file_list:
+            file_name = "{}{}".format(fname, fileconf['file_exention'])
             file_path = fileconf['file_path_dict'][fname]
             process_and_copy_file(
                 st_time,
@@ -133,21 +216,12 @@ def collect_logs(st_time, end_time, file, node, test_id):
                 file_path,
                 localpath,
                 test_id,
-                sftp)
-    else:
-        file_name = "{}{}".format(file, fileconf['file_exention'])
-        file_path = fileconf['file_path_dict'][file]
-        process_and_copy_file(
-            st_time,
-            end_time,
-            file_name,
-            file_path,
-            localpath,
-            test_id,
-            sftp)
-
-    # Close connection once all file transfers are done
-    sftp.close
+                sftp,
+                logserver_sftp=logserver_sftp)
+    finally:
+        # Close sessions once all file transfers are done
+        sftp.close()
+        logserver_sftp.close()
 
     # @TODO Error handling
 
@@ -159,10 +233,10 @@ def collect_logs_fromserver(
         node='all'):
     # Collect logs for all nodes
 
-    if node is 'all':
+    if node == 'all':
         for node_name in fileconf['node_list']:
             response = collect_logs(
-                st_time, end_time, file_type, node, test_suffix)
+                st_time, end_time, file_type, node_name, test_suffix)
     # collect from one node only
     else:
         response = collect_logs(
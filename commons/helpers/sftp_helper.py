@@ -0,0 +1,290 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Parallel chunked SFTP transfer engine.
+
+Transfers several files per host concurrently and splits large files in chunks which are moved
+over separate SFTP channels of the pooled SSH transport with pipelined requests. Channels open
+on a host are capped at MAX_CHANNELS, below the sshd MaxSessions default of 10, across files,
+chunks and transfer objects. Partial transfers are resumed from a state file kept next to the
+local file and files can optionally be gzip compressed on the fly.
+"""
+
+import json
+import logging
+import os
+import shlex
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List
+from typing import Tuple
+
+import paramiko
+
+from commons.helpers.host import Host
+
+LOGGER = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+BLOCK_SIZE = 32768  # max sftp read/write request size honoured by most servers
+WINDOW_SIZE = 64 * MB
+MAX_CHANNELS = 8  # per host, sshd allows 10 sessions per connection by default
+
+_CHANNEL_LIMITS = {}
+_CHANNEL_LIMITS_LOCK = threading.Lock()
+
+
+def _channel_limit(hostname: str) -> threading.BoundedSemaphore:
+    """Semaphore bounding the channels opened on hostname."""
+    with _CHANNEL_LIMITS_LOCK:
+        if hostname not in _CHANNEL_LIMITS:
+            _CHANNEL_LIMITS[hostname] = threading.BoundedSemaphore(MAX_CHANNELS)
+        return _CHANNEL_LIMITS[hostname]
+
+
+class SFTPTransfer:
+    """Parallel chunked file transfer to/from a host."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, host: Host, max_files: int = 4, streams: int = 4,
+                 chunk_size: int = 64 * MB, resume: bool = True,
+                 compress: bool = False) -> None:
+        """
+        Initializer for SFTPTransfer.
+        :param host: Host object of the remote node.
+        :param max_files: Max files transferred concurrently.
+        :param streams: Max sftp channels used for chunks of a single large file, channels of
+        all files are also bounded by MAX_CHANNELS per host.
+        :param chunk_size: Files larger than chunk_size are transferred in chunks.
+        :param resume: Keep state of completed chunks and resume partial transfers.
+        :param compress: gzip file on the fly on the sender, disables chunking.
+        """
+        self.host = host
+        self.max_files = max_files
+        self.streams = streams
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.compress = compress
+
+    @contextmanager
+    def _channel(self):
+        """Hold one of the MAX_CHANNELS channel slots of host."""
+        with _channel_limit(self.host.hostname):
+            yield
+
+    @contextmanager
+    def _open_sftp(self):
+        """Open a new sftp channel on the pooled transport of host, closed on exit."""
+        with self._channel():
+            self.host.connect_pooled()
+            sftp = paramiko.SFTPClient.from_transport(
+                self.host.host_obj.get_transport(), window_size=WINDOW_SIZE)
+            try:
+                yield sftp
+            finally:
+                sftp.close()
+
+    def _chunks(self, size: int) -> List[Tuple[int, int, int]]:
+        """Split size into (index, offset, length) chunks."""
+        return [(index, offset, min(self.chunk_size, size - offset))
+                for index, offset in enumerate(range(0, size, self.chunk_size))]
+
+    @staticmethod
+    def _load_state(state_path: str, size: int, mtime: int, chunk_size: int) -> set:
+        """Completed chunk indices of previous partial transfer of the same source file."""
+        if not os.path.exists(state_path):
+            return set()
+        with open(state_path, "r", encoding="utf-8") as state_file:
+            state = json.load(state_file)
+        if (state.get("size"), state.get("mtime"), state.get("chunk_size")) != \
+                (size, mtime, chunk_size):
+            return set()
+        return set(state.get("done", []))
+
+    @staticmethod
+    def _save_state(state_path: str, size: int, mtime: int, chunk_size: int,
+                    done: set) -> None:
+        """Persist completed chunk indices."""
+        with open(state_path, "w", encoding="utf-8") as state_file:
+            json.dump({"size": size, "mtime": mtime, "chunk_size": chunk_size,
+                       "done": sorted(done)}, state_file)
+
+    def _run_chunks(self, chunks: list, state_path: str, size: int, mtime: int,
+                    copy_chunk) -> None:
+        """Copy pending chunks on parallel streams updating resume state."""
+        done = self._load_state(state_path, size, mtime, self.chunk_size) \
+            if self.resume else set()
+        pending = [chunk for chunk in chunks if chunk[0] not in done]
+        if done:
+            LOGGER.info("Resuming transfer, %s of %s chunks already copied",
+                        len(chunks) - len(pending), len(chunks))
+        lock = threading.Lock()
+
+        def _copy(chunk):
+            with self._open_sftp() as sftp:
+                copy_chunk(sftp, chunk[1], chunk[2])
+            if self.resume:
+                with lock:
+                    done.add(chunk[0])
+                    self._save_state(state_path, size, mtime, self.chunk_size, done)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.streams, len(pending)))) as pool:
+            list(pool.map(_copy, pending))
+
+    def get(self, remote_path: str, local_path: str) -> int:
+        """
+        Copy remote file to local path.
+        :param remote_path: remote file path.
+        :param local_path: local file path.
+        :return: number of bytes of the file.
+        """
+        if self.compress:
+            return self._get_compressed(remote_path, local_path)
+        with self._open_sftp() as sftp:
+            rstat = sftp.stat(remote_path)
+            if rstat.st_size <= self.chunk_size:
+                sftp.get(remote_path, local_path)
+                return rstat.st_size
+        size, mtime = rstat.st_size, int(rstat.st_mtime)
+        part_path, state_path = f"{local_path}.part", f"{local_path}.part.json"
+        with open(part_path, "ab") as part_file:
+            part_file.truncate(size)
+
+        def _copy_chunk(sftp, offset, length):
+            with sftp.open(remote_path, "rb") as rfile, open(part_path, "r+b") as lfile:
+                lfile.seek(offset)
+                for data in rfile.readv([(off, min(BLOCK_SIZE, offset + length - off))
+                                         for off in range(offset, offset + length,
+                                                          BLOCK_SIZE)]):
+                    lfile.write(data)
+
+        self._run_chunks(self._chunks(size), state_path, size, mtime, _copy_chunk)
+        os.replace(part_path, local_path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        LOGGER.debug("Copied %s:%s to %s", self.host.hostname, remote_path, local_path)
+        return size
+
+    def put(self, local_path: str, remote_path: str) -> int:
+        """
+        Copy local file to remote path.
+        :param local_path: local file path.
+        :param remote_path: remote file path.
+        :return: number of bytes of the file.
+        """
+        if self.compress:
+            return self._put_compressed(local_path, remote_path)
+        lstat = os.stat(local_path)
+        size, mtime = lstat.st_size, int(lstat.st_mtime)
+        with self._open_sftp() as sftp:
+            if size <= self.chunk_size:
+                sftp.put(local_path, remote_path)
+                return size
+            state_path = f"{local_path}.{self.host.hostname}.put.json"
+            if not self.resume or not self._load_state(state_path, size, mtime,
+                                                       self.chunk_size):
+                with sftp.open(remote_path, "wb") as rfile:
+                    rfile.truncate(size)
+
+        def _copy_chunk(sftp, offset, length):
+            with open(local_path, "rb") as lfile, sftp.open(remote_path, "r+b") as rfile:
+                rfile.set_pipelined(True)
+                lfile.seek(offset)
+                rfile.seek(offset)
+                remaining = length
+                while remaining:
+                    data = lfile.read(min(BLOCK_SIZE, remaining))
+                    rfile.write(data)
+                    remaining -= len(data)
+
+        self._run_chunks(self._chunks(size), state_path, size, mtime, _copy_chunk)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        LOGGER.debug("Copied %s to %s:%s", local_path, self.host.hostname, remote_path)
+        return size
+
+    @contextmanager
+    def _exec(self, cmd: str):
+        """Execute cmd on a new channel of the pooled transport, yield stdin, stdout, stderr."""
+        with self._channel():
+            self.host.connect_pooled()
+            stdin, stdout, stderr = self.host.host_obj.exec_command(cmd)  # nosec
+            try:
+                yield stdin, stdout, stderr
+            finally:
+                stdout.channel.close()
+
+    def _get_compressed(self, remote_path: str, local_path: str) -> int:
+        """Stream gzip compressed remote file and decompress on the fly."""
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        written = 0
+        with self._exec(f"gzip -c -1 {shlex.quote(remote_path)}") as (_, stdout, stderr), \
+                open(local_path, "wb") as lfile:
+            for data in iter(lambda: stdout.read(MB), b""):
+                data = decompressor.decompress(data)
+                lfile.write(data)
+                written += len(data)
+            lfile.write(decompressor.flush())
+            if stdout.channel.recv_exit_status() != 0:
+                raise IOError(stderr.read().decode("utf-8", errors="replace"))
+        return written
+
+    def _put_compressed(self, local_path: str, remote_path: str) -> int:
+        """Stream local file gzip compressed on the fly to remote gunzip."""
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        size = 0
+        with self._exec(f"gunzip -c > {shlex.quote(remote_path)}") as (stdin, stdout, stderr), \
+                open(local_path, "rb") as lfile:
+            for data in iter(lambda: lfile.read(MB), b""):
+                stdin.write(compressor.compress(data))
+                size += len(data)
+            stdin.write(compressor.flush())
+            stdin.channel.shutdown_write()
+            if stdout.channel.recv_exit_status() != 0:
+                raise IOError(stderr.read().decode("utf-8", errors="replace"))
+        return size
+
+    def _transfer_files(self, func, pairs: List[Tuple[str, str]]) -> dict:
+        """Run func on (source, destination) pairs concurrently."""
+        def _transfer(pair):
+            try:
+                return pair[0], (True, func(*pair))
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.error("Failed to copy %s to %s: %s", pair[0], pair[1], error)
+                return pair[0], (False, error)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_files, len(pairs)))) as pool:
+            return dict(pool.map(_transfer, pairs))
+
+    def get_files(self, pairs: List[Tuple[str, str]]) -> dict:
+        """
+        Copy multiple remote files concurrently.
+        :param pairs: list of (remote path, local path).
+        :return: dict of remote path to (status, size or error).
+        """
+        return self._transfer_files(self.get, pairs)
+
+    def put_files(self, pairs: List[Tuple[str, str]]) -> dict:
+        """
+        Copy multiple local files concurrently.
+        :param pairs: list of (local path, remote path).
+        :return: dict of local path to (status, size or error).
+        """
+        return self._transfer_files(self.put, pairs)
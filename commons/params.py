@@ -110,6 +110,7 @@ USER_JSON = '_usersdata'
 USER_META_JSON = '_user_metadata'
 UPLOADED_FILES = "uploadInfo.csv"
 DELETE_OP_FILE_NAME = "deleteInfo.csv"
+DI_MANIFEST_DB = "di_manifest.db"
 COM_DELETE_OP_FILENAME = "combinedDeleteInfo.csv"
 UPLOAD_DONE_FILE = UPLOADED_FILES
 UPLOAD_FINISHED_FILENAME = "upload_done.txt"
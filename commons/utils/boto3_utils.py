@@ -0,0 +1,189 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Process wide boto3 client and resource factory.
+
+boto3 clients are thread safe, so one client is built per (service, endpoint, credentials,
+region, config) and shared by all the callers of the process, which then reuse its warm
+keep-alive connection pool. Resources are not thread safe, a new resource object is returned
+on each call but it is backed by the shared client.
+"""
+
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import boto3
+from botocore.config import Config
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_POOL_CONNECTIONS = 50
+MAX_CLIENTS = 512
+
+
+def _key_value(value):
+    """Hashable representation of a boto3 client argument."""
+    if isinstance(value, Config):
+        # pylint: disable=protected-access
+        return tuple(sorted((opt, repr(val)) for opt, val in
+                            value._user_provided_options.items()))
+    return value
+
+
+class Boto3Factory:  # pylint: disable=too-many-instance-attributes
+    """Credential keyed cache of boto3 clients."""
+
+    def __init__(self, max_clients: int = MAX_CLIENTS,
+                 max_pool_connections: int = MAX_POOL_CONNECTIONS) -> None:
+        """
+        Initializer for Boto3Factory.
+        :param max_clients: Max cached clients, least recently used are evicted.
+        :param max_pool_connections: Default connection pool size of clients.
+        """
+        self.max_clients = max_clients
+        self.max_pool_connections = max_pool_connections
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._session = None
+        self._clients = OrderedDict()
+        self._resource_classes = {}
+        self._owners = {}
+
+    def _check_fork(self) -> None:
+        """Drop clients and session inherited from the parent process."""
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._session = None
+            self._clients.clear()
+            self._resource_classes.clear()
+
+    def get_client(self, service_name: str, **kwargs):
+        """
+        Get shared client, built on first use with boto3.client(service_name, **kwargs).
+        :param service_name: Service name e.g. s3, iam.
+        :param kwargs: Keyword arguments of boto3.client e.g. endpoint_url, aws_access_key_id.
+        :return: boto3 client.
+        """
+        base_config = Config(max_pool_connections=self.max_pool_connections)
+        config = kwargs.get("config")
+        kwargs["config"] = base_config.merge(config) if config else base_config
+        key = (service_name,) + tuple(sorted((arg, _key_value(val))
+                                             for arg, val in kwargs.items()))
+        with self._lock:
+            self._check_fork()
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+            if self._session is None:
+                self._session = boto3.session.Session()
+            # botocore updates options of config in place, keep the ones of the key intact.
+            client = self._session.client(
+                service_name, **dict(kwargs, config=copy.deepcopy(kwargs["config"])))
+            self._clients[key] = client
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+            LOGGER.debug("Created %s client for %s", service_name, kwargs.get("endpoint_url"))
+        return client
+
+    def get_resource(self, service_name: str, **kwargs):
+        """
+        Get new resource object backed by the shared client of kwargs.
+        :param service_name: Service name e.g. s3, iam.
+        :param kwargs: Keyword arguments of boto3.resource.
+        :return: boto3 resource.
+        """
+        client = self.get_client(service_name, **kwargs)
+        with self._lock:
+            resource_cls = self._resource_classes.get(service_name)
+            if resource_cls is None:
+                resource_cls = self._session.resource(
+                    service_name, **dict(kwargs, config=copy.deepcopy(kwargs.get("config")))
+                ).__class__
+                self._resource_classes[service_name] = resource_cls
+        return resource_cls(client=client)
+
+    def evict(self, access_key: str) -> int:
+        """
+        Drop clients of access key, to be called once the credentials are deleted.
+        :param access_key: Access key id.
+        :return: number of evicted clients.
+        """
+        with self._lock:
+            keys = [key for key in self._clients
+                    if ("aws_access_key_id", access_key) in key[1:]]
+            for key in keys:
+                del self._clients[key]
+        return len(keys)
+
+    def register(self, user_name: str, access_key: str) -> None:
+        """
+        Record access key of account or iam user, for evict_user once the user is deleted.
+        :param user_name: Account or iam user name.
+        :param access_key: Access key id.
+        """
+        if user_name and access_key:
+            with self._lock:
+                self._owners.setdefault(user_name, set()).add(access_key)
+
+    def evict_user(self, user_name: str) -> int:
+        """
+        Drop clients of all the registered access keys of deleted account or iam user.
+        :param user_name: Account or iam user name.
+        :return: number of evicted clients.
+        """
+        with self._lock:
+            access_keys = self._owners.pop(user_name, set())
+            return sum(self.evict(access_key) for access_key in access_keys)
+
+    def clear(self) -> None:
+        """Drop all cached clients."""
+        with self._lock:
+            self._clients.clear()
+            self._owners.clear()
+
+
+BOTO3_FACTORY = Boto3Factory()
+
+
+def get_client(service_name: str, **kwargs):
+    """Shared boto3 client of the process wide factory."""
+    return BOTO3_FACTORY.get_client(service_name, **kwargs)
+
+
+def get_resource(service_name: str, **kwargs):
+    """New boto3 resource backed by a shared client of the process wide factory."""
+    return BOTO3_FACTORY.get_resource(service_name, **kwargs)
+
+
+def evict_credentials(access_key: str) -> int:
+    """Drop shared boto3 clients of deleted access key."""
+    return BOTO3_FACTORY.evict(access_key)
+
+
+def register_credentials(user_name: str, access_key: str) -> None:
+    """Record access key of account or iam user for evict_user."""
+    BOTO3_FACTORY.register(user_name, access_key)
+
+
+def evict_user(user_name: str) -> int:
+    """Drop shared boto3 clients of deleted account or iam user."""
+    return BOTO3_FACTORY.evict_user(user_name)
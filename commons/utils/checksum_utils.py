@@ -0,0 +1,198 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""In-process file checksum engine with a result cache.
+
+Files are read in large blocks into a reused buffer and every requested algorithm is updated
+in the same pass. hashlib releases the GIL while hashing large blocks, so sets of files are
+hashed on several cores with a thread pool. Digests are cached on (path, size, mtime, ctime,
+inode), so files which are not modified are read only once. Files modified within the last
+MIN_CACHE_AGE seconds are not cached, a rewrite of the same size within the timestamp
+granularity would not change the key.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List
+from typing import Union
+
+LOGGER = logging.getLogger(__name__)
+
+BLOCK_SIZE = 8 * 1024 * 1024
+MAX_CACHED_FILES = 4096
+MIN_CACHE_AGE = 2  # seconds since last modification before digests of a file are cached
+
+
+def algo_name(hash_algo: str) -> str:
+    """hashlib name of hash algo e.g. SHA-256 -> sha256."""
+    return hash_algo.lower().replace("-", "")
+
+
+class ChecksumCache:
+    """Digests of files keyed by (path, size, mtime, ctime, inode)."""
+
+    def __init__(self, max_files: int = MAX_CACHED_FILES) -> None:
+        """
+        Initializer for ChecksumCache.
+        :param max_files: Max cached files, least recently used are evicted.
+        """
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self._files = OrderedDict()
+
+    @staticmethod
+    def file_key(file_path: str) -> tuple:
+        """Cache key of the current content of file."""
+        stat = os.stat(file_path)
+        return (os.path.realpath(file_path), stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns,
+                stat.st_ino)
+
+    def get(self, key: tuple, name: str):
+        """Cached value of name for key or None."""
+        with self._lock:
+            values = self._files.get(key)
+            if values is None or name not in values:
+                return None
+            self._files.move_to_end(key)
+            return values[name]
+
+    def put(self, key: tuple, values: dict) -> None:
+        """
+        Cache values of key, stale entries of the same path are dropped.
+        Values of files modified within MIN_CACHE_AGE seconds are not cached.
+        """
+        if time.time_ns() - max(key[2], key[3]) < MIN_CACHE_AGE * 10 ** 9:
+            return
+        with self._lock:
+            for old_key in [old for old in self._files if old[0] == key[0] and old != key]:
+                del self._files[old_key]
+            self._files.setdefault(key, {}).update(values)
+            self._files.move_to_end(key)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+
+    def invalidate(self, file_path: str = None) -> None:
+        """Drop cached digests of file, all files if None."""
+        with self._lock:
+            if file_path is None:
+                self._files.clear()
+                return
+            path = os.path.realpath(file_path)
+            for key in [key for key in self._files if key[0] == path]:
+                del self._files[key]
+
+
+CHECKSUM_CACHE = ChecksumCache()
+
+
+def _read_blocks(file_path: str, block_size: int = BLOCK_SIZE):
+    """Yield memoryview blocks of file, the buffer is reused between blocks."""
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f_obj:
+        while True:
+            size = f_obj.readinto(buffer)
+            if not size:
+                break
+            yield view[:size]
+
+
+def file_digests(file_path: str, algos: Union[str, List[str]] = "md5",
+                 use_cache: bool = True) -> Dict[str, bytes]:
+    """
+    Digests of file for all algos, computed in a single pass over the data.
+    :param file_path: Path of the file.
+    :param algos: hash algo or list of them e.g. md5, sha256, SHA-256.
+    :param use_cache: Use cached digests of not modified files.
+    :return: dict of algo to digest bytes.
+    """
+    algos = [algos] if isinstance(algos, str) else list(algos)
+    names = {algo: algo_name(algo) for algo in algos}
+    key = ChecksumCache.file_key(file_path)
+    digests = {}
+    if use_cache:
+        for name in set(names.values()):
+            digest = CHECKSUM_CACHE.get(key, name)
+            if digest is not None:
+                digests[name] = digest
+    missing = {name: hashlib.new(name) for name in set(names.values()) if name not in digests}
+    if missing:
+        LOGGER.debug("Hashing %s with %s", file_path, ", ".join(missing))
+        for block in _read_blocks(file_path):
+            for hash_obj in missing.values():
+                hash_obj.update(block)
+        computed = {name: hash_obj.digest() for name, hash_obj in missing.items()}
+        CHECKSUM_CACHE.put(key, computed)
+        digests.update(computed)
+    return {algo: digests[name] for algo, name in names.items()}
+
+
+def file_digest(file_path: str, hash_algo: str = "md5", use_cache: bool = True) -> bytes:
+    """Digest of file, see file_digests."""
+    return file_digests(file_path, hash_algo, use_cache)[hash_algo]
+
+
+def file_part_digests(file_path: str, part_size: int, hash_algo: str = "sha256",
+                      use_cache: bool = True) -> List[bytes]:
+    """
+    Digests of consecutive part_size parts of file.
+    :param file_path: Path of the file.
+    :param part_size: Size of the parts in bytes.
+    :param hash_algo: hash algo of the parts.
+    :param use_cache: Use cached digests of not modified files.
+    :return: list of digest bytes, one per part.
+    """
+    name = f"{algo_name(hash_algo)}/{part_size}"
+    key = ChecksumCache.file_key(file_path)
+    digests = CHECKSUM_CACHE.get(key, name) if use_cache else None
+    if digests is None:
+        digests = []
+        with open(file_path, "rb", buffering=0) as f_obj:
+            for part in iter(lambda: f_obj.read(part_size), b""):
+                digests.append(hashlib.new(algo_name(hash_algo), part).digest())
+        CHECKSUM_CACHE.put(key, {name: digests})
+    return list(digests)
+
+
+def files_digests(file_paths: List[str], algos: Union[str, List[str]] = "md5",
+                  max_workers: int = None, use_cache: bool = True) -> List[Dict[str, bytes]]:
+    """
+    Digests of a set of files hashed concurrently.
+    :param file_paths: List of file paths.
+    :param algos: hash algo or list of them.
+    :param max_workers: Max files hashed concurrently, default number of cpus.
+    :param use_cache: Use cached digests of not modified files.
+    :return: list of file_digests results in the order of file_paths.
+    """
+    if not file_paths:
+        return []
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(file_paths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: file_digests(path, algos, use_cache),
+                                 file_paths))
+
+
+def invalidate(file_path: str = None) -> None:
+    """Drop cached digests of file, all files if None."""
+    CHECKSUM_CACHE.invalidate(file_path)
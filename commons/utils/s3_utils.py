@@ -21,11 +21,14 @@ import base64
 import datetime
 import hashlib
 import hmac
+import io
 import json
 import logging
+import mmap
 import os
 import time
 import urllib
+from functools import lru_cache
 from hashlib import md5
 from hashlib import sha256
 from random import shuffle
@@ -35,6 +38,7 @@ import xmltodict
 
 from commons import constants as const
 from commons.utils import assert_utils
+from commons.utils import checksum_utils
 from config import S3_CFG
 
 LOGGER = logging.getLogger(__name__)
@@ -109,8 +113,9 @@ def sign(key, msg):
     return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
 
 
+@lru_cache(maxsize=256)
 def get_v4_signature_key(key, date_stamp, region_name, service_name):
-    """Get the V4 signature key."""
+    """Get the V4 signature key, cached per (key, date, region, service)."""
     kdate = sign(('AWS4' + key).encode('utf-8'), date_stamp)
     kregion = sign(kdate, region_name)
     kservice = sign(kregion, service_name)
@@ -224,13 +229,10 @@ def poll(target, *args, condition=None, **kwargs) -> Any:
 def calc_checksum(file_path, part_size=0):
     """Calculate a checksum using encryption algorithm."""
     try:
-        hash_digests = []
-        with open(file_path, 'rb') as f_obj:
-            if part_size and os.stat(file_path).st_size > part_size:
-                for chunk in iter(lambda: f_obj.read(part_size), b''):
-                    hash_digests.append(sha256(chunk).digest())
-            else:
-                hash_digests.append(sha256(f_obj.read()).digest())
+        if part_size and os.stat(file_path).st_size > part_size:
+            hash_digests = checksum_utils.file_part_digests(file_path, part_size, "sha256")
+        else:
+            hash_digests = [checksum_utils.file_digest(file_path, "sha256")]
 
         return sha256(b''.join(hash_digests)).hexdigest() + '-' + str(len(hash_digests))
     except OSError as error:
@@ -248,25 +250,296 @@ def calc_contentmd5(data) -> str:
     return base64.b64encode(md5(data).digest()).decode('utf-8')  # nosec - s3 ETag based on md5.
 
 
+class MultipartETag:
+    """
+    Streaming multipart ETag calculator.
+
+    Object data fed in order with update() is split on the part layout and hashed on the fly,
+    so only one md5 state and the per part digests are kept in memory.
+    """
+
+    def __init__(self, part_size=None, part_sizes=None):
+        """
+        Initializer for MultipartETag.
+
+        :param part_size: Fixed part size in bytes, the last part takes the remainder.
+        :param part_sizes: Explicit (e.g. unaligned or precalculated) part sizes in bytes in part
+        number order, used in place of part_size.
+        """
+        if part_sizes is None and not part_size:
+            raise ValueError("part_size or part_sizes is required")
+        self.part_size = part_size
+        self.part_sizes = None if part_sizes is None else [int(size) for size in part_sizes]
+        self.md5_digests = []
+        self._hash = None
+        self._remaining = 0
+
+    def _next_part(self):
+        index = len(self.md5_digests)
+        if self.part_sizes is None:
+            self._remaining = self.part_size
+        elif index < len(self.part_sizes):
+            self._remaining = self.part_sizes[index]
+        else:
+            raise ValueError(f"Data exceeds part layout of {len(self.part_sizes)} parts")
+        self._hash = md5()  # nosec - s3 ETag based on md5.
+
+    def _end_part(self):
+        self.md5_digests.append(self._hash.digest())
+        self._hash = None
+
+    def update(self, data):
+        """Hash next bytes of the object."""
+        view = memoryview(data)
+        while len(view):
+            if self._hash is None:
+                self._next_part()
+            block = view[:self._remaining]
+            self._hash.update(block)
+            self._remaining -= len(block)
+            view = view[len(block):]
+            if not self._remaining:
+                self._end_part()
+
+    def finish(self):
+        """
+        End the last part, parts of the layout not reached by data are empty.
+
+        :return: Expected multipart ETag.
+        """
+        if self._hash is not None:
+            self._end_part()
+        if self.part_sizes is not None:
+            empty = md5().digest()  # nosec
+            self.md5_digests.extend([empty] * (len(self.part_sizes) - len(self.md5_digests)))
+        elif not self.md5_digests:
+            self.md5_digests.append(md5().digest())  # nosec
+        return self.etag
+
+    @property
+    def part_md5s(self):
+        """md5 hexdigest of the parts in part number order."""
+        return [digest.hex() for digest in self.md5_digests]
+
+    @property
+    def etag(self):
+        """Multipart ETag of the parts hashed so far."""
+        multipart_etag = md5(b''.join(self.md5_digests)).hexdigest()  # nosec
+        return f'"{multipart_etag}-{len(self.md5_digests)}"'
+
+
+def calc_multipart_etag(source, part_size=None, part_sizes=None, block_size=8388608) -> tuple:
+    """
+    Calculate per part md5 and the multipart ETag of an object in a single sequential pass.
+
+    :param source: Path of object file or binary stream having read(), e.g. StreamingBody.
+    :param part_size: Fixed part size in bytes.
+    :param part_sizes: Explicit list of part sizes in bytes in part number order.
+    :param block_size: Size of the reads.
+    :return: (List of part md5 hexdigests, expected multipart ETag).
+    """
+    calculator = MultipartETag(part_size, part_sizes)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f_obj:
+            for block in iter(lambda: f_obj.read(block_size), b''):
+                calculator.update(block)
+    else:
+        for block in iter(lambda: source.read(block_size), b''):
+            calculator.update(block)
+    etag = calculator.finish()
+    return calculator.part_md5s, etag
+
+
 def get_multipart_etag(parts):
     """
     Calculate expected ETag for a multipart upload.
 
+    Parts of get_aligned_parts/get_unaligned_parts/get_precalculated_parts covering the file
+    from its start are hashed with a single sequential read of the file.
     :param parts: List of dict with the format {part_number: (data_bytes, content_md5), ...}
     """
+    part_list = [parts[part_number] for part_number in sorted(parts.keys())]
+    if part_list and all(isinstance(part, LazyPart) and part.file_path for part in part_list) \
+            and part_list[0].offset == 0 and \
+            all(part.file_path == prev.file_path and part.offset == prev.offset + prev.length
+                for prev, part in zip(part_list, part_list[1:])):
+        calculator = MultipartETag(part_sizes=[part.length for part in part_list])
+        remaining = sum(part.length for part in part_list)
+        with open(part_list[0].file_path, "rb") as f_obj:
+            while remaining:
+                block = f_obj.read(min(8388608, remaining))
+                if not block:
+                    break
+                calculator.update(block)
+                remaining -= len(block)
+        etag = calculator.finish()
+        for part, digest in zip(part_list, calculator.md5_digests):
+            part._md5 = digest  # pylint: disable=protected-access
+        return etag
     md5_digests = []
-    for part_number in sorted(parts.keys()):
+    for part in part_list:
         # comparing ETag with s3 response so calculating it based on md5.
-        md5_digests.append(md5(parts[part_number][0]).digest())  # nosec
+        md5_digests.append(part.md5_digest if isinstance(part, LazyPart)
+                           else md5(part[0]).digest())  # nosec
     multipart_etag = md5(b''.join(md5_digests)).hexdigest() + '-' + str(len(md5_digests))  # nosec
     return f'"{multipart_etag}"'
 
 
+class FileSlice(io.RawIOBase):
+    """Read only, seekable file object over a slice of a memory mapped file."""
+
+    def __init__(self, file_path, offset, length):
+        """
+        Initializer for FileSlice.
+
+        :param file_path: Path of the file.
+        :param offset: Start of the slice in bytes.
+        :param length: Length of the slice in bytes.
+        """
+        super().__init__()
+        self._mmap = None
+        self._start = self._pos = offset
+        self._end = offset + length
+        if length:
+            with open(file_path, "rb") as fptr:
+                self._mmap = mmap.mmap(fptr.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = max(0, min(len(buffer), self._end - self._pos))
+        if size:
+            buffer[:size] = self._mmap[self._pos:self._pos + size]
+            self._pos += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: self._start, io.SEEK_CUR: self._pos, io.SEEK_END: self._end}[whence]
+        self._pos = max(self._start, base + offset)
+        return self._pos - self._start
+
+    def tell(self):
+        return self._pos - self._start
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        super().close()
+
+
+class LazyPart:
+    """
+    Multipart upload part produced on demand, indexable like a [data, content_md5] part.
+
+    Part data is read from a slice of the file (or a chunk generator) only when accessed and
+    digests are calculated incrementally on first use, so parts dicts of large objects do not
+    hold the object in memory. upload_part can stream the part with open().
+    """
+
+    def __init__(self, file_path=None, offset=0, length=0, chunks=None):
+        """
+        Initializer for LazyPart.
+
+        :param file_path: Path of object file.
+        :param offset: Start of the part in the file.
+        :param length: Size of the part in bytes.
+        :param chunks: Callable returning an iterable of bytes of the part, used in place of
+        file_path e.g. data generators.
+        """
+        self.file_path = file_path
+        self.offset = offset
+        self.length = length
+        self._chunks = chunks
+        self._md5 = None
+        self._sha256 = None
+
+    @classmethod
+    def from_chunks(cls, chunks, length=None):
+        """LazyPart of the bytes yielded by chunks(), chunks should be repeatable."""
+        return cls(length=length, chunks=chunks)
+
+    def iter_chunks(self, block_size=1048576):
+        """Yield part data in blocks of block_size bytes."""
+        if self._chunks is not None:
+            yield from self._chunks()
+            return
+        with self.open() as fptr:
+            yield from iter(lambda: fptr.read(block_size), b"")
+
+    def open(self):
+        """Seekable file object of the part data."""
+        if self._chunks is not None:
+            return io.BytesIO(self.data)
+        return io.BufferedReader(FileSlice(self.file_path, self.offset, self.length))
+
+    @property
+    def data(self) -> bytes:
+        """Part data, read on each access."""
+        if self._chunks is not None:
+            return b"".join(self._chunks())
+        with self.open() as fptr:
+            return fptr.read()
+
+    @property
+    def md5_digest(self) -> bytes:
+        """md5 digest of the part data."""
+        if self._md5 is None:
+            hash_md5 = md5()  # nosec - s3 ETag based on md5.
+            for chunk in self.iter_chunks():
+                hash_md5.update(chunk)
+            self._md5 = hash_md5.digest()
+        return self._md5
+
+    @property
+    def content_md5(self) -> str:
+        """Content-MD5 header value of the part."""
+        return base64.b64encode(self.md5_digest).decode('utf-8')
+
+    @property
+    def sha256_digest(self) -> bytes:
+        """sha256 digest of the part data."""
+        if self._sha256 is None:
+            hash_sha256 = sha256()
+            for chunk in self.iter_chunks():
+                hash_sha256.update(chunk)
+            self._sha256 = hash_sha256.digest()
+        return self._sha256
+
+    def __getitem__(self, index):
+        if index in (0, -2):
+            return self.data
+        if index in (1, -1):
+            return self.content_md5
+        raise IndexError("LazyPart index out of range")
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        yield self.data
+        yield self.content_md5
+
+    def __repr__(self):
+        return f"LazyPart({self.file_path!r}, offset={self.offset}, length={self.length})"
+
+
+def _shuffle_parts(parts) -> dict:
+    """Parts dict in random part order."""
+    keys = list(parts.keys())
+    shuffle(keys)
+    return {k: parts[k] for k in keys}
+
+
 def get_aligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False) -> dict:
     r"""
     Get aligned parts.
 
-    Create the upload parts dict with aligned part size(limitation: not supported more than 10G).
+    Create the upload parts dict with aligned part size, parts are LazyPart read on demand.
     https://www.gbmb.org/mb-to-bytes
     Megabytes (MB)	Bytes (B) decimal	Bytes (B) binary
     1 MB	        1,000,000 Bytes	    1,048,576 Bytes
@@ -280,21 +553,13 @@ def get_aligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False
     try:
         obj_size = os.stat(file_path).st_size
         parts = {}
-        part_size = int(int(obj_size) / int(chunk_size)) // int(total_parts)
-        with open(file_path, "rb") as fptr:
-            i = 1
-            while True:
-                data = fptr.read(chunk_size * part_size)
-                if not data:
-                    break
-                LOGGER.info("data length %s", str(len(data)))
-                parts[i] = [data, calc_contentmd5(data)]
-                i += 1
-        if random:
-            keys = list(parts.keys())
-            shuffle(keys)
-            parts = {k: parts[k] for k in keys}
-        return parts
+        part_size = chunk_size * (int(int(obj_size) / int(chunk_size)) // int(total_parts))
+        if part_size:
+            for i, offset in enumerate(range(0, obj_size, part_size), 1):
+                length = min(part_size, obj_size - offset)
+                LOGGER.info("data length %s", str(length))
+                parts[i] = LazyPart(file_path, offset, length)
+        return _shuffle_parts(parts) if random else parts
     except OSError as error:
         LOGGER.error(str(error))
         raise error from OSError
@@ -302,7 +567,7 @@ def get_aligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False
 
 def get_unaligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False) -> dict:
     """
-    Create the upload parts dict with unaligned part size(limitation: not supported more than 10G).
+    Create the upload parts dict with unaligned part size, parts are LazyPart read on demand.
 
     https://www.gbmb.org/mb-to-bytes
     Megabytes (MB)	Bytes (B) decimal	Bytes (B) binary
@@ -323,21 +588,15 @@ def get_unaligned_parts(file_path, total_parts=1, chunk_size=5242880, random=Fal
         part_size = int(int(obj_size) / int(chunk_size)) // int(total_parts)
         unaligned = [104857, 209715, 314572, 419430, 524288,
                      629145, 734003, 838860, 943718, 1048576]
-        with open(file_path, "rb") as file_pointer:
-            j = 1
-            while True:
-                shuffle(unaligned)
-                data = file_pointer.read((chunk_size + unaligned[0]) * part_size)
-                if not data:
-                    break
-                LOGGER.info("data_len %s", str(len(data)))
-                parts[j] = [data, calc_contentmd5(data)]
-                j += 1
-        if random:
-            keys = list(parts.keys())
-            shuffle(keys)
-            parts = {e: parts[e] for e in keys}
-        return parts
+        offset, j = 0, 1
+        while part_size and offset < obj_size:
+            shuffle(unaligned)
+            length = min((chunk_size + unaligned[0]) * part_size, obj_size - offset)
+            LOGGER.info("data_len %s", str(length))
+            parts[j] = LazyPart(file_path, offset, length)
+            offset += length
+            j += 1
+        return _shuffle_parts(parts) if random else parts
     except OSError as error:
         LOGGER.error(str(error))
         raise error from OSError
@@ -345,7 +604,7 @@ def get_unaligned_parts(file_path, total_parts=1, chunk_size=5242880, random=Fal
 
 def get_precalculated_parts(file_path, part_list, chunk_size=1048576) -> dict:
     """
-    Split the source file into the specified part sizes.
+    Split the source file into the specified part sizes, parts are LazyPart read on demand.
 
     :param file_path: Path of object file.
     :param part_list: List of dict with keys 'part_size' (in bytes) and 'count'
@@ -358,10 +617,12 @@ def get_precalculated_parts(file_path, part_list, chunk_size=1048576) -> dict:
     shuffle(total_part_list)
     parts = {}
     try:
-        with open(file_path, "rb") as file_pointer:
-            for i, part_size in enumerate(total_part_list, 1):
-                data = file_pointer.read(int(part_size * chunk_size))
-                parts[i] = [data, calc_contentmd5(data)]
+        obj_size = os.stat(file_path).st_size
+        offset = 0
+        for i, part_size in enumerate(total_part_list, 1):
+            length = max(0, min(int(part_size * chunk_size), obj_size - offset))
+            parts[i] = LazyPart(file_path, offset, length)
+            offset += length
         return parts
     except OSError as error:
         LOGGER.error(str(error))
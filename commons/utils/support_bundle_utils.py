@@ -26,6 +26,7 @@ import logging
 import time
 from commons.helpers.node_helper import Node
 from commons.helpers.pods_helper import LogicalNode
+from commons.helpers.sftp_helper import SFTPTransfer
 from commons import commands as cm_cmd
 from commons import constants as cm_const
 from commons.utils import assert_utils
@@ -77,7 +78,7 @@ def create_support_bundle_individual_cmd(node, username, password, remote_dir, l
     tar_sb_cmd = "tar -cvf {} {}".format(remote_sb_path, remote_dir)
     node_obj.execute_cmd(tar_sb_cmd)
     LOGGER.debug("Copying %s to %s", remote_sb_path, local_sb_path)
-    node_obj.copy_file_to_local(remote_sb_path, local_sb_path)
+    SFTPTransfer(node_obj).get(remote_sb_path, local_sb_path)
 
     return True, local_sb_path
 
@@ -149,7 +150,7 @@ def create_support_bundle_single_cmd(local_dir, bundle_name, comp_list=None,
                 local_sb_path = os.path.join(local_dir, sb_tar_file)
                 tar_sb_cmd = "tar -cvf {} {}".format(remote_sb_path, bundle_dir)
                 node_list[node].execute_cmd(tar_sb_cmd)
-                node_list[node].copy_file_to_local(remote_sb_path, local_sb_path)
+                SFTPTransfer(node_list[node]).get(remote_sb_path, local_sb_path)
             break
     else:
         LOGGER.error("Timeout while generating support bundle")
@@ -180,6 +181,7 @@ def collect_crash_files(local_dir):
     flag = False
 
     for node in range(num_nodes):
+        crash_files = []
         for crash_dir in dir_list:
             file_list = node_list[node].list_dir(crash_dir)
             if file_list:
@@ -187,7 +189,9 @@ def collect_crash_files(local_dir):
                 for file in file_list:
                     remote_path = os.path.join(crash_dir, file)
                     local_path = os.path.join(local_dir, file)
-                    node_list[node].copy_file_to_local(remote_path, local_path)
+                    crash_files.append((remote_path, local_path))
+        if crash_files:
+            SFTPTransfer(node_list[node]).get_files(crash_files)
     if flag:
         LOGGER.info("Crash files are generated and copied at %s", local_dir)
     else:
@@ -220,7 +224,7 @@ def collect_support_bundle_k8s(local_dir_path: str, scripts_path: str = cm_const
             LOGGER.info("Support bundle generated: %s", file)
             remote_path = os.path.join(scripts_path, file)
             local_path = os.path.join(local_dir_path, file)
-            m_node_obj.copy_file_to_local(remote_path, local_path)
+            SFTPTransfer(m_node_obj).get(remote_path, local_path)
 
     if flg:
         LOGGER.info("Support bundle %s generated and copied to %s path.",
@@ -251,6 +255,7 @@ def collect_crash_files_k8s(local_dir_path: str):
     if m_node_obj.path_exists(crash_dir):
         m_node_obj.remove_dir(crash_dir)
 
+    crash_files = []
     for pod in pod_list:
         LOGGER.info("Checking crash files for %s pod", pod)
         resp = m_node_obj.send_k8s_cmd(operation="exec", pod=pod, namespace=cm_const.NAMESPACE,
@@ -265,7 +270,9 @@ def collect_crash_files_k8s(local_dir_path: str):
             m_node_obj.execute_cmd(cmd=cm_cmd.K8S_CP_PV_FILE_TO_LOCAL_CMD
                                    .format(pod, resp, remote_path))
             local_path = os.path.join(local_dir_path, file2)
-            m_node_obj.copy_file_to_local(remote_path, local_path)
+            crash_files.append((remote_path, local_path))
+    if crash_files:
+        SFTPTransfer(m_node_obj).get_files(crash_files)
 
     if flg:
         LOGGER.info("Crash files are generated and copied to %s", local_dir_path)
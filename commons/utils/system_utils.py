@@ -19,6 +19,7 @@
 #
 """Module to maintain system utils."""
 
+import base64
 import logging
 import os
 import sys
@@ -34,11 +35,11 @@ import glob
 from typing import Tuple
 from subprocess import Popen, PIPE
 from hashlib import md5
-from pathlib import Path
 from botocore.response import StreamingBody
 from paramiko import SSHClient, AutoAddPolicy
 from commons import commands
 from commons import params
+from commons.utils import checksum_utils
 from commons.constants import AWS_CLI_ERROR
 
 if sys.platform == 'win32':
@@ -304,24 +305,19 @@ def calculate_checksum(
     hash_algo = kwargs.get("hash_algo", "md5")
     if not os.path.exists(file_path):
         return False, "Please pass proper file path"
-    if hash_algo == "md5":
-        if binary_bz64:
-            cmd = "openssl md5 -binary {} | base64".format(file_path)
+    if options and hash_algo == "md5" and not binary_bz64:
+        # md5sum options change the tool output, keep using the tool.
+        cmd = "md5sum {} {}".format(options, file_path)
+        LOGGER.debug("Executing cmd: %s", cmd)
+        result = run_local_cmd(cmd)
+    else:
+        # Same output as of openssl/md5sum/sha*sum tools, computed in process and cached.
+        digest = checksum_utils.file_digest(file_path, hash_algo)
+        if hash_algo == "md5" and binary_bz64:
+            output = base64.b64encode(digest).decode() + "\n"
         else:
-            cmd = "md5sum {} {}".format(options, file_path)
-    if hash_algo == "SHA-1":
-        cmd = "sha1sum {}".format(file_path)
-    if hash_algo == "SHA-224":
-        cmd = "sha224sum {}".format(file_path)
-    if hash_algo == "SHA-256":
-        cmd = "sha256sum {}".format(file_path)
-    if hash_algo == "SHA-384":
-        cmd = "sha384sum {}".format(file_path)
-    if hash_algo == "SHA-512":
-        cmd = "sha512sum {}".format(file_path)
-
-    LOGGER.debug("Executing cmd: %s", cmd)
-    result = run_local_cmd(cmd)
+            output = "{}  {}\n".format(digest.hex(), file_path)
+        result = True, str(output.encode())
     LOGGER.debug("Output: %s", str(result))
     if kwargs.get("filter_resp", None) and binary_bz64:
         result = (result[0], filter_bin_md5(result[1]))
@@ -335,7 +331,7 @@ def calc_checksum(object_ref: object, hash_algo: str = 'md5'):
     :param hash_algo: md5 or sha1
     :return:
     """
-    read_sz = 8192
+    read_sz = checksum_utils.BLOCK_SIZE
     csum = None
     file_hash = md5()  # nosec
     if hash_algo != 'md5':
@@ -347,17 +343,7 @@ def calc_checksum(object_ref: object, hash_algo: str = 'md5'):
             chunk = object_ref.read(amt=read_sz)
         return file_hash.hexdigest()
     if os.path.exists(object_ref):
-        size = Path(object_ref).stat().st_size
-
-        with open(object_ref, 'rb') as file_ptr:
-            if size < read_sz:
-                buf = file_ptr.read(size)
-            else:
-                buf = file_ptr.read(read_sz)
-            while buf:
-                file_hash.update(buf)
-                buf = file_ptr.read(read_sz)
-            csum = file_hash.hexdigest()
+        csum = checksum_utils.file_digest(object_ref, hash_algo).hex()
 
     return csum
 
@@ -0,0 +1,136 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Wait/poll utility with deadlines and adaptive backoff.
+
+Replaces fixed worst case sleeps with polling of a predicate: the wait ends as soon as the
+condition is true, the poll interval grows exponentially (with jitter) up to max_interval and
+the time each condition took to become true is recorded for diagnostics.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any
+from typing import Callable
+
+LOGGER = logging.getLogger(__name__)
+
+# Observed wait durations in seconds keyed by wait description.
+WAIT_STATS = {}
+_WAIT_STATS_LOCK = threading.Lock()
+
+
+class WaitTimeoutError(TimeoutError):
+    """Raised when a condition does not become true before the deadline."""
+
+    def __init__(self, desc: str, timeout: float, attempts: int, last_result: Any = None,
+                 last_error: Exception = None) -> None:
+        """
+        Create a WaitTimeoutError.
+        :param desc: Description of the awaited condition.
+        :param timeout: Timeout in seconds.
+        :param attempts: Number of predicate evaluations.
+        :param last_result: Last value returned by predicate.
+        :param last_error: Last exception raised by predicate.
+        """
+        super().__init__(f"Timed out after {timeout} seconds waiting for {desc} "
+                         f"({attempts} attempts, last result: {last_result!r}, "
+                         f"last error: {last_error!r})")
+        self.desc = desc
+        self.timeout = timeout
+        self.attempts = attempts
+        self.last_result = last_result
+        self.last_error = last_error
+
+
+def record_wait(desc: str, elapsed: float) -> None:
+    """Record time taken by condition desc to become true."""
+    with _WAIT_STATS_LOCK:
+        WAIT_STATS.setdefault(desc, []).append(elapsed)
+
+
+def get_wait_stats() -> dict:
+    """
+    Summary of recorded waits.
+    :return: dict of description to count, min, max and total seconds.
+    """
+    with _WAIT_STATS_LOCK:
+        return {desc: {"count": len(vals), "min": min(vals), "max": max(vals),
+                       "total": sum(vals)} for desc, vals in WAIT_STATS.items()}
+
+
+def backoff_intervals(interval: float, max_interval: float, backoff: float = 2.0,
+                      jitter: float = 0.1):
+    """
+    Generate poll intervals growing exponentially from interval to max_interval.
+    :param interval: First poll interval in seconds.
+    :param max_interval: Upper bound of poll interval in seconds.
+    :param backoff: Multiplier applied after each poll, 1 for fixed interval.
+    :param jitter: Random +/- fraction applied to each interval.
+    """
+    while True:
+        yield max(0.0, interval * (1 + random.uniform(-jitter, jitter)))  # nosec
+        interval = min(interval * backoff, max_interval)
+
+
+# pylint: disable=too-many-arguments
+def wait_until(predicate: Callable[..., Any], *args, timeout: float = 300,
+               interval: float = 1, max_interval: float = 30, backoff: float = 2.0,
+               jitter: float = 0.1, desc: str = None, raise_on_timeout: bool = True,
+               ignore_exceptions: tuple = (Exception,), **kwargs) -> Any:
+    """
+    Poll predicate(*args, **kwargs) until it returns a truthy value or timeout elapses.
+    :param predicate: Function evaluating the condition.
+    :param timeout: Deadline in seconds.
+    :param interval: First poll interval in seconds.
+    :param max_interval: Upper bound of poll interval in seconds.
+    :param backoff: Multiplier applied to interval after each poll, 1 for fixed interval.
+    :param jitter: Random +/- fraction applied to each interval.
+    :param desc: Description of the condition used in logs and wait stats.
+    :param raise_on_timeout: Raise WaitTimeoutError on timeout else return last result.
+    :param ignore_exceptions: Exceptions of predicate treated as condition not met.
+    :return: First truthy value returned by predicate.
+    """
+    desc = desc or getattr(predicate, "__name__", str(predicate))
+    start_time = time.monotonic()
+    deadline = start_time + timeout
+    attempts = 0
+    result = last_error = None
+    for delay in backoff_intervals(interval, max_interval, backoff, jitter):
+        attempts += 1
+        try:
+            result = predicate(*args, **kwargs)
+            last_error = None
+        except ignore_exceptions as error:
+            LOGGER.debug("Waiting for %s: %s", desc, error)
+            result, last_error = None, error
+        if result:
+            elapsed = time.monotonic() - start_time
+            record_wait(desc, elapsed)
+            LOGGER.debug("%s met after %.2f seconds and %s attempts", desc, elapsed, attempts)
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+    LOGGER.error("Timed out after %s seconds waiting for %s", timeout, desc)
+    if raise_on_timeout:
+        raise WaitTimeoutError(desc, timeout, attempts, result, last_error)
+    return result
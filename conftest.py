@@ -47,7 +47,9 @@ from commons import cortxlogging
 from commons import params
 from commons import report_client
 from commons import constants as const
+from commons.helpers.health_helper import HEALTH_PROBE_TTL
 from commons.helpers.health_helper import Health
+from commons.helpers.health_helper import invalidate_health_probes
 from commons.utils import assert_utils
 from commons.utils import config_utils
 from commons.utils import jira_utils
@@ -59,6 +61,7 @@ from core.runner import get_jira_credential
 from libs.di.di_mgmt_ops import ManagementOPs
 from libs.di.di_run_man import RunDataCheckManager
 from libs.di.fi_adapter import S3FailureInjection
+from libs.s3.s3_account_pool import S3AccountPool
 
 FAILURES_FILE = "failures.txt"
 LOG_DIR = 'log'
@@ -139,6 +142,34 @@ def session_data(tmp_path_factory, worker_id):
     return data
 
 
+@pytest.fixture(scope="session")
+def s3_account_pool(request, tmp_path_factory, worker_id):
+    """
+    Session level pool of pre-provisioned s3 accounts and buckets.
+    The pool state is kept in the temp directory shared by all workers.
+    """
+    root_tmp_dir = tmp_path_factory.getbasetemp()
+    if worker_id != "master":
+        root_tmp_dir = root_tmp_dir.parent
+    pool = S3AccountPool(str(root_tmp_dir), size=int(request.config.option.s3_pool_size),
+                         buckets=int(request.config.option.s3_pool_buckets))
+    pool.open()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope='function')
+def s3_account_lease(s3_account_pool):
+    """
+    Lease an s3 account with buckets from the pool, it is returned and recycled after test.
+    Use it in the test method argument as test_demo(s3_account_lease), the account dict has
+    user_name, password, accesskey, secretkey and buckets.
+    """
+    account = s3_account_pool.lease()
+    yield account
+    s3_account_pool.release(account)
+
+
 @pytest.fixture()
 def csm_user(worker_id):
     """
@@ -247,6 +278,14 @@ def pytest_addoption(parser):
         "--use_ssl", action="store", default=True,
         help="Decide whether to use HTTPS/SSL connection for S3 endpoint."
     )
+    parser.addoption(
+        "--s3_pool_size", action="store", default=4,
+        help="Number of free s3 accounts kept ready by s3 account pool."
+    )
+    parser.addoption(
+        "--s3_pool_buckets", action="store", default=2,
+        help="Number of buckets of each s3 account pool account."
+    )
 
 
 def read_test_list_csv() -> List:
@@ -783,7 +822,7 @@ def check_cortx_cluster_health():
         health = Health(hostname=hostname,
                         username=node['username'],
                         password=node['password'])
-        result = health.check_node_health()
+        result = health.check_node_health(max_age=HEALTH_PROBE_TTL)
         assert_utils.assert_true(result[0],
                                  f'Cluster Node {hostname} failed in health check. Reason: {result}')
         health.disconnect()
@@ -802,7 +841,7 @@ def check_cluster_storage():
         health = Health(hostname=hostname,
                         username=node['username'],
                         password=node['password'])
-        ha_total, ha_avail, ha_used = health.get_sys_capacity()
+        ha_total, ha_avail, ha_used = health.get_sys_capacity(max_age=HEALTH_PROBE_TTL)
         ha_used_percent = round((ha_used / ha_total) * 100, 1)
         assert ha_used_percent < 98.0, f'Cluster Node {hostname} failed space check.'
         health.disconnect()
@@ -876,6 +915,10 @@ def pytest_runtest_logreport(report: "TestReport") -> None:
     :param report:
     :return:
     """
+    if report.failed or report.when == 'teardown':
+        # A test (even a passing one, e.g. pod kill or node restart) may have changed the
+        # cluster state, the health check before the next test has to probe the cluster.
+        invalidate_health_probes()
     if Globals.LOCAL_RUN:
         if report.when == 'teardown':
             log = report.caplog
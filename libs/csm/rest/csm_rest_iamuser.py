@@ -28,6 +28,7 @@ from commons.constants import Rest as const
 from commons import constants as cons
 from commons.constants import S3_ENGINE_RGW
 from commons.exceptions import CTException
+from commons.utils import boto3_utils
 from commons.utils import config_utils
 from config import CMN_CFG, CSM_REST_CFG
 from libs.csm.rest.csm_rest_csmuser import RestCsmUser
@@ -108,6 +109,7 @@ class RestIamUser(RestTestLib):
             # Fetching api response
             response = self.restapi.rest_call(
                 "delete", endpoint=endpoint, headers=self.headers)
+            boto3_utils.evict_user(user)
         return response
 
     def create_and_verify_iam_user_response_code(self,
@@ -429,6 +431,7 @@ class RestIamUser(RestTestLib):
                 self.log.error("Request Body= %s ", response.request.body)
                 raise CTException(err.CSM_REST_DELETE_REQUEST_FAILED,
                                   msg="Delete IAM users request failed.")
+            boto3_utils.evict_user(iam_user)
         return response
 
     @staticmethod
@@ -525,6 +528,9 @@ class RestIamUser(RestTestLib):
         response = self.restapi.rest_call("post", endpoint=endpoint, json_dict=payload,
                                           headers=self.headers)
         self.log.info("IAM user request successfully sent...")
+        if response.status_code == HTTPStatus.CREATED:
+            for key in response.json().get("keys", []):
+                boto3_utils.register_credentials(key.get("user"), key.get("access_key"))
         return response
 
     @RestTestLib.authenticate_and_login
@@ -574,6 +580,7 @@ class RestIamUser(RestTestLib):
         response = self.restapi.rest_call("delete", endpoint=endpoint, json_dict=payload,
                                           headers=header)
         self.log.info("Delete IAM user request successfully sent...")
+        boto3_utils.evict_user(uid)
         return response
 
     @RestTestLib.authenticate_and_login
@@ -669,6 +676,7 @@ class RestIamUser(RestTestLib):
         response = self.restapi.rest_call("delete", endpoint=endpoint, json_dict=payload,
                                           headers=self.headers)
         self.log.info("Remove key from IAM user request successfully sent...")
+        boto3_utils.evict_credentials(payload["access_key"])
         return response
 
     def verify_create_iam_user_rgw(self, user_type="valid", expected_response=HTTPStatus.CREATED,
@@ -26,6 +26,7 @@ import commons.errorcodes as err
 from commons.constants import Rest as const
 from commons.constants import S3_ENGINE_RGW
 from commons.exceptions import CTException
+from commons.utils import boto3_utils
 from commons.utils import config_utils
 from libs.csm.rest.csm_rest_test_lib import RestTestLib
 from libs.csm.rest.csm_rest_iamuser import RestIamUser
@@ -158,6 +159,7 @@ class RestS3user(RestTestLib):
                 response = self.restapi.rest_call("delete", endpoint=endpoint, headers=self.headers)
                 status = response.status_code != const.SUCCESS_STATUS or response.ok is not True
                 time.sleep(5)  # delay for next call.
+        boto3_utils.evict_user(username)
         return response
 
     def verify_list_s3account_details(self, expect_no_user=False):
@@ -527,6 +529,8 @@ class RestS3user(RestTestLib):
 
         if resp.status_code == HTTPStatus.CREATED.value:
             self.recently_created_s3_account_user = resp.json()
+            boto3_utils.register_credentials(resp.json().get("account_name"),
+                                             resp.json().get("access_key"))
         return resp
 
     # pylint: disable=too-many-statements
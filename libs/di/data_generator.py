@@ -18,11 +18,13 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 #
 """Generate test data for S3 I/O with desired compression, duplication and formats.
-Size could be as small as 1 byte to 1 GB.
+Content is a stream of fixed size blocks derived from (seed, block index), so objects of any
+size are streamed, any byte range is regenerated on demand and digests are computed without
+keeping the object in memory.
 """
+import io
 import os
 import logging
-import array
 import random
 import zlib
 import hashlib
@@ -30,6 +32,8 @@ import string
 from typing import Union
 from typing import Tuple
 from typing import Any
+from typing import Dict
+from typing import List
 from Crypto.Cipher import AES
 from pathlib import Path
 from commons import params
@@ -45,6 +49,8 @@ U_LIMIT = 10 ** 6
 CMPR_RATIOS = (1, 2, 3, 4, 5, 6, 7, 8)
 SMALL_BLOCK_SIZES = [4 * KB, 8 * KB, 16 * KB, 32 * KB, 64 * KB, 128 * KB]
 MEDIUM_BLOCK_SIZES = [4 * MB, 8 * MB, 16 * MB, 21 * MB, 32 * MB, 64 * MB, 128 * MB]
+BLOCK_SIZE = MB
+FILLER = CMN_BUF.encode('utf-8')
 
 LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +73,8 @@ class DataGenerator:
     buf, csum = d.generate(1024 * 1024, seed=seed)
     print(csum)
     d.save_buf_to_file(buf, 1024 * 1024, "test-1")
+    stream = d.open_stream(5 * 1024 * 1024 * 1024, seed=seed)
+    part = d.read_range(5 * 1024 * 1024 * 1024, seed, offset=4096, length=1024)
     """
 
     def __init__(self,
@@ -78,63 +86,106 @@ class DataGenerator:
         self.secret = '0123456789abcdef' * 2
         self.iv = '0123456789abcdef'
 
+    def _cipher_key(self, seed: int) -> bytes:
+        """AES key of seed, blocks of different seeds are independent."""
+        return hashlib.sha256((self.secret + str(seed)).encode('utf-8')).digest()
+
+    def block(self,
+              seed: int,
+              index: int,
+              datatype: int = DEFAULT_DATA_TYPE,
+              block_size: int = BLOCK_SIZE) -> bytes:
+        """Content of block index of the objects of seed.
+        Uncompressible part of the block is the AES-CTR key stream at the offset of the block,
+        so any block is generated without the blocks before it. Rest of the block is filler.
+        """
+        if datatype == ZEROED_DATA_TYPE:
+            return bytes(block_size)
+        if block_size % AES.block_size:
+            raise ValueError(f"block size {block_size} is not a multiple of {AES.block_size}")
+        rand_size = int(block_size * (1.0 - self.compressibility / 100.0))
+        cipher = AES.new(self._cipher_key(seed), AES.MODE_CTR, nonce=b'',
+                         initial_value=index * (block_size // AES.block_size))
+        return cipher.encrypt(bytes(rand_size)) + FILLER[:block_size - rand_size]
+
+    def iter_blocks(self,
+                    size: int,
+                    seed: int,
+                    offset: int = 0,
+                    length: int = None,
+                    datatype: int = DEFAULT_DATA_TYPE,
+                    block_size: int = BLOCK_SIZE):
+        """Yield content of byte range [offset, offset + length) of an object of size bytes.
+        Blocks are generated on demand from (seed, block index), at most one block is kept.
+        """
+        end = size if length is None else min(size, offset + length)
+        while offset < end:
+            index, start = divmod(offset, block_size)
+            chunk = self.block(seed, index, datatype, block_size)[
+                start:min(block_size, end - index * block_size)]
+            yield chunk
+            offset += len(chunk)
+
+    def read_range(self,
+                   size: int,
+                   seed: int,
+                   offset: int,
+                   length: int,
+                   datatype: int = DEFAULT_DATA_TYPE) -> bytes:
+        """Regenerate byte range [offset, offset + length) of an object of size bytes."""
+        return b''.join(self.iter_blocks(size, seed, offset, length, datatype))
+
+    def digests(self,
+                size: int,
+                seed: int,
+                algos: Union[str, List[str]] = 'sha1',
+                datatype: int = DEFAULT_DATA_TYPE) -> Dict[str, str]:
+        """Hex digests of the object for all algos, computed while streaming its blocks."""
+        algos = [algos] if isinstance(algos, str) else list(algos)
+        hashes = {algo: hashlib.new(algo) for algo in algos}
+        for chunk in self.iter_blocks(size, seed, datatype=datatype):
+            for hash_obj in hashes.values():
+                hash_obj.update(chunk)
+        return {algo: hash_obj.hexdigest() for algo, hash_obj in hashes.items()}
+
+    def open_stream(self,
+                    size: int,
+                    seed: int,
+                    datatype: int = DEFAULT_DATA_TYPE,
+                    algos: Union[str, List[str]] = None) -> 'DataStream':
+        """Seekable read only file object of the object content.
+        Digests of algos are computed on the same pass as the reads, see DataStream.
+        """
+        return DataStream(self, size, seed, datatype, algos)
+
     def generate(self,
                  size: int,
                  datatype: int = DEFAULT_DATA_TYPE,
-                 seed: int = None) -> Union[Tuple[str, Any], Tuple[Union[int, bytes], Any]]:
+                 seed: int = None) -> Tuple[bytes, str]:
 
-        """Assume size is less than 5GB.
+        """Generate object of size bytes in memory, returns content and its sha1.
+        Content is deterministic for a seed, a random seed is used if not given.
         Keeping de-dupe and compression ratio separate for avoiding complexity in buffer
         stream.
 
             compressibility (in %) = 100 - (1.0/compression_ratio * 100)
 
+        Use iter_blocks, open_stream and digests for large objects.
         """
+        if seed is None:
+            seed = self.get_random_seed()
         csum = hashlib.sha1()
-        if size == 0:
-            buf = ''
-            csum.update(buf)
-            chksum = csum.hexdigest()
-            return buf, chksum
-
-        if datatype == DEFAULT_DATA_TYPE:
-            # Ignoring de-dupe ratio for blobs.
-            if self.compression_ratio >= 1:
-                compressibility = int(100 - (1 / self.compression_ratio * 100))
-                buf = self.__get_data(size, compressibility, seed)
-        buf = buf.encode('utf-8')[:size]  # hack until better solution is found.
-        csum.update(buf)
-        chksum = csum.hexdigest()
-        return buf, chksum
+        chunks = []
+        for chunk in self.iter_blocks(size, seed, datatype=datatype):
+            csum.update(chunk)
+            chunks.append(chunk)
+        return b''.join(chunks), csum.hexdigest()
 
     @staticmethod
     def get_random_seed(lower: int = 0,
                         upper: int = U_LIMIT) -> int:
         return random.randint(lower, upper)
 
-    def __get_data(self, size, compressibility, seed=None):
-        buf = self.__get_uncompressible_buffer(compressibility, size, seed)
-        return str(buf) + self.__get_buf(size - len(buf))  # todo can be improved
-
-    def __get_buf(self, size):
-        if size <= 0:
-            return ''
-
-        if size > len(CMN_BUF):
-            return CMN_BUF + self.__get_buf(size - MB)
-        else:
-            return CMN_BUF[:size]
-
-    def __get_uncompressible_buffer(self, compressibility, size, seed=None):
-        if not seed:
-            unc_buf = os.urandom(size)
-            return unc_buf[0: int((size * (1.0 - compressibility / 100.0)))]
-        else:
-            buf = array.array('l', [seed] * size).tobytes()
-            buf = self.encrypt_buf(buf)
-            buf = buf[0: int((size * (1.0 - compressibility / 100.0)))]
-            return buf
-
     def encrypt_buf(self, buf):
         blksz = 16
         sz = len(buf)
@@ -149,13 +200,13 @@ class DataGenerator:
             buf = buf[:sz]
         return buf
 
-    def save_buf_to_file(self,
-                         fbuf: Any,
-                         csum: str,
-                         size: int,
-                         data_folder_prefix: str,
-                         min_sz: int = 5,
-                         max_sz: int = 10) -> str:
+    def get_object_name(self,
+                        csum: str,
+                        min_sz: int = 5,
+                        max_sz: int = 10) -> str:
+        """Random file/object name with a file format extension, embeds csum if enabled.
+        csum is any tag of the content, e.g. its sha1 or the seed and size it is generated from.
+        """
         name = ''
         ext = random.sample(all_extensions, 1)[0]
         for i in range(random.randrange(min_sz, max_sz)):
@@ -163,6 +214,16 @@ class DataGenerator:
         if self.append_csum_file_name:
             name += '_' + csum
         name += '_' + 'cx' + ext
+        return name
+
+    def save_buf_to_file(self,
+                         fbuf: Any,
+                         csum: str,
+                         size: int,
+                         data_folder_prefix: str,
+                         min_sz: int = 5,
+                         max_sz: int = 10) -> str:
+        name = self.get_object_name(csum, min_sz, max_sz)
         if size < 1024:
             iosize = 1024
         elif (size >= 1024) & (size < 1024 * 1024):
@@ -234,6 +295,80 @@ class DataGenerator:
         return buffer
 
 
+class DataStream(io.RawIOBase):
+    """Seekable read only file object over the blocks of a generated object.
+    Content read for the first time is hashed with algos, so an upload computes the digests
+    of the object without another pass. Bytes skipped by seeks are hashed by hexdigests.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, generator: DataGenerator, size: int, seed: int,
+                 datatype: int = DEFAULT_DATA_TYPE,
+                 algos: Union[str, List[str]] = None) -> None:
+        super().__init__()
+        self.generator = generator
+        self.size = size
+        self.seed = seed
+        self.datatype = datatype
+        self._pos = 0
+        self._block = (None, b'')
+        algos = [algos] if isinstance(algos, str) else list(algos or [])
+        self._hashes = {algo: hashlib.new(algo) for algo in algos}
+        self._hashed = 0
+
+    def hexdigests(self) -> Dict[str, str]:
+        """Hex digests of the whole object for algos of the stream."""
+        for chunk in self.generator.iter_blocks(self.size, self.seed, self._hashed,
+                                                datatype=self.datatype):
+            self._update_hashes(self._hashed, chunk)
+        return {algo: hash_obj.hexdigest() for algo, hash_obj in self._hashes.items()}
+
+    def _update_hashes(self, offset: int, data) -> None:
+        """Hash data read at offset if it extends the hashed prefix of the object."""
+        if offset <= self._hashed < offset + len(data):
+            data = data[self._hashed - offset:]
+            for hash_obj in self._hashes.values():
+                hash_obj.update(data)
+            self._hashed += len(data)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._pos = offset
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast('B')
+        count = 0
+        while count < len(view) and self._pos < self.size:
+            index, start = divmod(self._pos, BLOCK_SIZE)
+            if self._block[0] != index:
+                self._block = (index, self.generator.block(self.seed, index, self.datatype))
+            size = min(len(view) - count, BLOCK_SIZE - start, self.size - self._pos)
+            view[count:count + size] = self._block[1][start:start + size]
+            if self._hashes:
+                self._update_hashes(self._pos, view[count:count + size])
+            count += size
+            self._pos += size
+        return count
+
+
 if __name__ == '__main__':
     # Test Data Generator here.
     d = DataGenerator(c_ratio=1)
@@ -43,8 +43,15 @@ framework. It acts as a hash cache storing the server state on client side.
             ]
         }
 }
+
+ Each user's state is a json snapshot in the above format plus an append-only journal of
+ mutations (json lines) next to it. A mutation appends one record to the journal and updates
+ an in-memory index of buckets and files, the journal is folded into the snapshot every
+ COMPACT_EVERY records. Loading a user reads the snapshot and replays the journal tail, which
+ also recovers mutations of a process that did not compact before exiting.
 """
 import os
+import json
 import logging
 import threading
 import random
@@ -59,6 +66,9 @@ C_LEVEL_TOP = 1
 C_LEVEL_USER = 2
 C_LEVEL_BUCKET = 3
 
+JOURNAL_SUFFIX = '.journal'
+COMPACT_EVERY = 10000  # journal records folded into the snapshot at a time
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -98,15 +108,86 @@ class DataManager(object):
         fpath = os.path.join(p_home, user + params.USER_META_JSON)
         if not os.path.exists(fpath):
             raise CortxTestException('It is expected that the json path should be created by now')
-        config_utils.create_content_json(fpath, data, ensure_ascii=True)
+        tpath = config_utils.create_content_json(fpath + '.tmp', data, ensure_ascii=True)
+        os.replace(tpath, fpath)
+        # Snapshot has all the data now, journal records are already in it.
+        open(fpath + JOURNAL_SUFFIX, 'wb').close()
+        self.state.pop(user, None)
+
+    @staticmethod
+    def _apply(meta, record):
+        """Apply a journal record to the user's data and index."""
+        if record.get('op') != 'add':
+            LOGGER.warning('Skipped unknown journal record %s', record)
+            return
+        bucket, fdict = record['bucket'], record['file']
+        if bucket not in meta['index']:
+            bkt_container = dict(name=bucket, s3prefix='', files=list())
+            meta['data']['buckets'].append(bkt_container)
+            meta['index'][bucket] = (bkt_container, dict())
+        bkt_container, files = meta['index'][bucket]
+        if fdict['name'] in files:
+            files[fdict['name']].update(fdict)
+        else:
+            files[fdict['name']] = fdict
+            bkt_container['files'].append(fdict)
+
+    def _load_user(self, user):
+        """Return in-memory state of user, journal records not seen yet are replayed.
+        State is reloaded from the snapshot when another process replaced it.
+        """
+        fpath = self.prepare_file_data(user)
+        jpath = fpath + JOURNAL_SUFFIX
+        stat = os.stat(fpath)
+        meta = self.state.get(user)
+        if meta is None or meta['pid'] != os.getpid() or \
+                meta['snapshot'] != (stat.st_ino, stat.st_mtime_ns):
+            data = config_utils.read_content_json(fpath=fpath)
+            if not data or user != data['name']:
+                data = self.get_container(level=C_LEVEL_USER)
+                data['name'] = user
+            meta = dict(data=data, index=dict(), offset=0, records=0, pid=os.getpid(),
+                        snapshot=(stat.st_ino, stat.st_mtime_ns))
+            for bkt in data['buckets']:
+                meta['index'][bkt['name']] = (bkt, {f['name']: f for f in bkt['files']})
+            self.state[user] = meta
+        size = os.path.getsize(jpath) if os.path.exists(jpath) else 0
+        if size > meta['offset']:
+            with open(jpath, 'rb') as jfile:
+                jfile.seek(meta['offset'])
+                for line in jfile:
+                    if not line.endswith(b'\n'):
+                        break  # record of an interrupted write
+                    try:
+                        self._apply(meta, json.loads(line))
+                    except (ValueError, KeyError) as fault:
+                        LOGGER.warning('Skipped corrupt journal record of %s: %s', user, fault)
+                    meta['offset'] += len(line)
+                    meta['records'] += 1
+        return meta
+
+    def _compact(self, user, meta):
+        """Write snapshot of in-memory state, in-memory index is kept."""
+        records = meta['records']
+        self.store_file_data(meta['data'], user)
+        stat = os.stat(os.path.join(params.META_DATA_HOME, user + params.USER_META_JSON))
+        meta.update(offset=0, records=0, snapshot=(stat.st_ino, stat.st_mtime_ns))
+        self.state[user] = meta
+        LOGGER.info(f'Compacted {records} metadata records of user {user}')
+
+    def compact(self, user):
+        """Fold the journal of user into the json snapshot."""
+        with self.wlock:
+            meta = self._load_user(user)
+            if meta['records']:
+                self._compact(user, meta)
 
     def get_all_buckets_data_for_user(self, user):
         if user is None:
             raise ValueError('user is mandatory')
 
-        fpath = self.prepare_file_data(user)
-        # improve with ijson lib
-        data = config_utils.read_content_json(fpath=fpath)
+        with self.wlock:
+            data = self._load_user(user)['data']
         if data:
             if user != data['name']:
                 return None
@@ -169,36 +250,29 @@ class DataManager(object):
         return container, False  # anyway return an empty container
 
     def add_file_to_bucket(self, user, bucket, file_dict):
-        """The updates within process will be in-memory and then persisted to json."""
+        """The update is appended to the user's journal and applied to in-memory state."""
         file_obj, checksum = file_dict['name'], file_dict['checksum']
         size, seed, mtime = file_dict['size'], file_dict['seed'], file_dict['mtime']
-        data = dict()
         if bucket is not None:
             with self.wlock:
                 fpath = self.prepare_file_data(user)
-                data = config_utils.read_content_json(fpath=fpath)
-                if not data or user != data['name']:
-                    data = self.get_container(level=C_LEVEL_USER)
-                    data['name'] = user
-                bkt_container, flag = self._get_bucket_container_from_buckets(data, bucket, user)
-
-                # usage files = self.get_files_within_bucket(bkt_container, user, bucket)
-                fdict = self.get_file_within_bucket(file_obj, bkt_container, bucket)
-                if not fdict:
-                    # format of fdict is name=a.txt, chksum=abcd, seed=1, size=1024
-                    fdict = dict(name=file_obj, checksum=checksum,
-                                 sz=size, seed=seed, mtime=mtime)
-                    bkt_container['files'].append(fdict)
-                else:
-                    fdict['checksum'] = checksum
-                    fdict['sz'] = size
-                    fdict['seed'] = seed
-                    fdict['mtime'] = mtime
-
-                if not flag:
-                    data['buckets'].append(bkt_container)
-
-                self.store_file_data(data, user)
+                # format of fdict is name=a.txt, chksum=abcd, seed=1, size=1024
+                fdict = dict(name=file_obj, checksum=checksum,
+                             sz=size, seed=seed, mtime=mtime)
+                record = json.dumps(dict(op='add', bucket=bucket, file=fdict),
+                                    ensure_ascii=True) + '\n'
+                with open(fpath + JOURNAL_SUFFIX, 'a+b') as jfile:
+                    if jfile.seek(0, os.SEEK_END):
+                        jfile.seek(-1, os.SEEK_END)
+                        if jfile.read(1) != b'\n':
+                            # Terminate the torn record of an interrupted write, replay skips
+                            # it as corrupt instead of merging it with this record.
+                            record = '\n' + record
+                    jfile.write(record.encode('utf-8'))
+                # Replaying the tail applies this record, and records of other writers.
+                meta = self._load_user(user)
+                if meta['records'] >= COMPACT_EVERY:
+                    self._compact(user, meta)
 
     def delete_file_from_bucket(self):
         raise NotImplementedError('coming soon')
@@ -19,23 +19,21 @@
 """The module validates the S3 bucket's data uploaded by Seagate's s3bench.
 The data can be verified after interleaved executions as well.
 """
-import os
 import queue
 import logging
 import csv
-import hashlib
 import re
 import base64
-from pathlib import Path
+from libs.di.data_generator import DataGenerator
 from libs.di.di_base import _init_s3_conn
-from commons.params import DOWNLOAD_HOME
+from libs.di.di_verifier import StreamVerifier
+from libs.s3.s3_bucket_listing import BucketLister
 from commons.worker import Workers
 from commons.constants import NWORKERS
 from typing import List
 
 LOGGER = logging.getLogger(__name__)
 
-pool = list()
 FailedFiles = list()
 FailedFilesCSV = "FailedFiles.csv"
 
@@ -56,29 +54,20 @@ def compare_checksum_after_download(user_name: str,
     access_key = keys[0]
     secret_key = keys[1]
     s3 = _init_s3_conn(access_key, secret_key, user_name)
-    test_bucket = s3.Bucket(bucket)
-    for ix in range(nworkers):
-        try:
-            if not os.path.exists(os.path.join(DOWNLOAD_HOME, "ps", str(ix))):
-                _path = os.mkdirs(os.path.join(DOWNLOAD_HOME, "ps", str(ix)))
-        except (OSError, Exception) as fault:
-            LOGGER.error(str(fault))
-            LOGGER.error(f"Error while creating directory for process {ix}")
-
     workers = Workers()
     workers.start_workers(nworkers=nworkers)
     counter = 0
-    for my_bucket_object in test_bucket.objects.all():
+    for obj_key in BucketLister(s3.meta.client).iter_keys(bucket):
         workQ = queue.Queue()
         workQ.func = download_and_compare
         kwargs = dict()
-        kwargs['key'] = key = my_bucket_object.key
+        kwargs['key'] = key = obj_key
         pat = re.compile('^.*_([A-Z2-7]+)_[0-9]+$')
         match = re.search(pat, key)
         if match:
             checksum = match.group(1)
-        kwargs['s3'] = pool[counter % nworkers]
-        kwargs['bucket'] = 'test-bucket1'
+        kwargs['s3'] = s3
+        kwargs['bucket'] = bucket
         kwargs['objcsum'] = checksum
         kwargs['accesskey'] = keys[0]
         kwargs['secret'] = keys[1]
@@ -103,7 +92,8 @@ def download_and_compare(kwargs):
     prefix = s3bench's default or user specified
     Go lang b32encoded sha512 checksum is dismantled and padded to decode from python
     seqno is a numeric value.
-
+    Objects written by the DI data generator (work item has seed and size) are compared with
+    their regenerated content instead.
     """
     try:
         s3 = kwargs.get('s3')
@@ -111,11 +101,21 @@ def download_and_compare(kwargs):
         pid = kwargs.get('pid')
         bucket = kwargs.get('bucket')
         objcsum = kwargs.get('objcsum')
-        cwd = DOWNLOAD_HOME
-        objectpath = os.path.join(cwd, "ps", str(pid), key)
         LOGGER.info(f'Send download request for {key}')
+        verifier = StreamVerifier(s3.meta.client)
         try:
-            s3.meta.client.download_file(bucket, key, objectpath)
+            # Object is hashed (or compared with its regenerated content) as it is received,
+            # it is not written to the disk.
+            if kwargs.get('seed') is not None:
+                matched, csum = verifier.verify_seed(
+                    bucket, key, int(kwargs['seed']), int(kwargs['size']),
+                    DataGenerator(c_ratio=int(kwargs.get('c_ratio', 2))))
+            else:
+                if len(objcsum) % 8:  # check the length of hash to find the padding needed
+                    if len(objcsum) % 8 == 7:
+                        objcsum = objcsum + '='
+                objhash = base64.b32decode(objcsum)
+                matched, csum = verifier.verify_digest(bucket, key, objhash, hash_algo='sha512')
             LOGGER.info(f'download object successful : {key}')
         except Exception as e:
             LOGGER.exception(e)
@@ -123,40 +123,14 @@ def download_and_compare(kwargs):
             LOGGER.error(f'Download failed for {kwargs} with exception {e}')
             FailedFiles.append(kwargs)
         else:
-            if len(objcsum) % 8:  # check the length of hash to find the padding needed
-                if len(objcsum) % 8 == 7:
-                    objcsum = objcsum + '='
-            objsum_dec = objcsum
-            objhash = base64.b32decode(objsum_dec)
-            print("Downloaded '{}' from '{}'".format(objectpath, bucket))
-            filepath = objectpath
-            sz = Path(filepath).stat().st_size
-            read_sz = 8192
-            csum = None
-            with open(filepath, 'rb') as fp:
-                file_hash = hashlib.sha512()
-                if sz < read_sz:
-                    buf = fp.read(sz)
-                else:
-                    buf = fp.read(read_sz)
-                while buf:
-                    file_hash.update(buf)
-                    buf = fp.read(read_sz)
-                csum = file_hash.digest()
-                try:
-                    os.unlink(filepath)
-                except (OSError, Exception) as fault:
-                    LOGGER.error('Unlink unsuccessful with fault %s using rm.', fault)
-                    rmLocalObject = "rm -rf " + str(filepath)
-                    os.system(rmLocalObject)
-
-            if objhash == csum.strip():
+            print("Downloaded '{}' from '{}' in process {}".format(key, bucket, pid))
+            if matched:
                 LOGGER.info("download object checksum {} matches provided c"
-                            "hecksum {} for file {}".format(csum, objcsum, objectpath))
+                            "hecksum {} for file {}".format(csum, objcsum, key))
             else:
                 LOGGER.error(
                     "download object checksum {} does not matches provided "
-                    "checksum {} for file {}".format(csum, objcsum, objectpath))
+                    "checksum {} for file {}".format(csum, objcsum, key))
                 FailedFiles.append(kwargs)
     except Exception as fault:
         LOGGER.exception(fault)
@@ -29,8 +29,7 @@ import random
 import time
 from multiprocessing import Manager
 
-import boto3
-
+from commons.utils import boto3_utils
 from config.s3 import S3_CFG
 from libs.di import di_lib
 from libs.di import di_params
@@ -73,8 +72,9 @@ def destructive_step():
         secret_key = keys[1]
 
         try:
-            s3 = boto3.resource('s3', aws_access_key_id=access_key, aws_secret_access_key=secret_key,
-                                endpoint_url=S3_CFG["s3_url"])
+            s3 = boto3_utils.get_resource('s3', aws_access_key_id=access_key,
+                                          aws_secret_access_key=secret_key,
+                                          endpoint_url=S3_CFG["s3_url"])
         except Exception as e:
             logger.info(
                 f'could not create s3 object for user {user_name} with access key {access_key} secret key {secret_key} exception:{e}')
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Manifest of the objects uploaded by DI tests, stored in SQLite.
+
+Upload processes write their objects in batched transactions, the database is in WAL mode so
+readers do not block writers and concurrent writers wait on each other only for a commit.
+Objects are indexed by user, bucket, key and status, so queries like all live objects of a
+bucket do not scan the manifest.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable
+from typing import List
+
+from commons import params
+
+LOGGER = logging.getLogger(__name__)
+
+STATUS_LIVE = "live"
+STATUS_DELETED = "deleted"
+BUSY_TIMEOUT = 60  # seconds a writer waits for the write lock
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    user TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    checksum TEXT,
+    seed INTEGER,
+    size INTEGER,
+    status TEXT NOT NULL DEFAULT 'live',
+    mtime REAL,
+    PRIMARY KEY (user, bucket, key)
+);
+CREATE INDEX IF NOT EXISTS objects_status ON objects (status, user, bucket);
+CREATE INDEX IF NOT EXISTS objects_bucket ON objects (bucket, status);
+"""
+_COLUMNS = ("user", "bucket", "key", "checksum", "seed", "size", "status", "mtime")
+
+
+class ManifestStore:
+    """Indexed store of uploaded objects shared by DI upload and download processes."""
+
+    def __init__(self, path: str = params.DI_MANIFEST_DB) -> None:
+        """
+        Initializer for ManifestStore.
+        :param path: Path of the SQLite database, created if missing.
+        """
+        self.path = path
+        self._local = threading.local()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection of the calling thread and process."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def add_objects(self, rows: Iterable) -> int:
+        """
+        Add or replace objects in a single transaction.
+        :param rows: [user, bucket, key, checksum] rows or dicts, optional seed, size, status,
+        mtime.
+        :return: number of rows written.
+        """
+        values = []
+        for row in rows:
+            if not isinstance(row, dict):
+                row = dict(zip(_COLUMNS, row))
+            values.append((row["user"], row["bucket"], row["key"], row.get("checksum"),
+                           row.get("seed"), row.get("size"), row.get("status", STATUS_LIVE),
+                           row.get("mtime", time.time())))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?)", values)
+        LOGGER.debug("Added %s objects to DI manifest %s", len(values), self.path)
+        return len(values)
+
+    def set_status(self, objects: Iterable, status: str = STATUS_DELETED) -> int:
+        """
+        Update status of objects e.g. mark them deleted.
+        :param objects: (user, bucket, key) tuples.
+        :param status: New status.
+        :return: number of updated objects.
+        """
+        with self.conn:
+            cursor = self.conn.executemany(
+                "UPDATE objects SET status = ?, mtime = ? WHERE user = ? AND bucket = ? AND "
+                "key = ?", ((status, time.time(), *obj[:3]) for obj in objects))
+        return cursor.rowcount
+
+    @staticmethod
+    def _where(users: List[str] = None, bucket: str = None, key: str = None,
+               status: str = STATUS_LIVE) -> tuple:
+        """SQL condition and arguments of a query, None matches all."""
+        clauses, args = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            args.append(status)
+        if users is not None:
+            users = [users] if isinstance(users, str) else list(users)
+            clauses.append(f"user IN ({', '.join('?' * len(users))})")
+            args.extend(users)
+        if bucket is not None:
+            clauses.append("bucket = ?")
+            args.append(bucket)
+        if key is not None:
+            clauses.append("key = ?")
+            args.append(key)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def iter_objects(self, users: List[str] = None, bucket: str = None, key: str = None,
+                     status: str = STATUS_LIVE):
+        """
+        Yield objects as dicts, rows are fetched from the database as they are consumed.
+        :param users: user name or list of them.
+        :param bucket: bucket name.
+        :param key: object key.
+        :param status: object status, default live objects.
+        """
+        where, args = self._where(users, bucket, key, status)
+        cursor = self.conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM objects{where}", args)
+        for row in cursor:
+            yield dict(zip(_COLUMNS, row))
+
+    def count(self, users: List[str] = None, bucket: str = None,
+              status: str = STATUS_LIVE) -> int:
+        """Number of objects, see iter_objects."""
+        where, args = self._where(users, bucket, None, status)
+        return self.conn.execute(f"SELECT COUNT(*) FROM objects{where}", args).fetchone()[0]
+
+    def close(self) -> None:
+        """Close connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
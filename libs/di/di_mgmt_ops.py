@@ -20,7 +20,6 @@
 """Management operations needed during the DI tests."""
 
 import time
-import random
 import logging
 import json
 from http import HTTPStatus
@@ -29,9 +28,8 @@ from config import DI_CFG
 from commons.utils import assert_utils
 from libs.s3 import cortxcli_test_lib as cctl
 from libs.csm.rest.csm_rest_s3user import RestS3user
-from libs.s3.s3_restapi_test_lib import S3AccountOperationsRestAPI
-from libs.s3.iam_test_lib import IamTestLib
-from libs.di.di_base import _init_s3_conn
+from libs.s3.s3_bulk_provision import BulkProvisioner
+from libs.s3.s3_bulk_provision import ProvisionSpec
 
 LOGGER = logging.getLogger(__name__)
 
@@ -48,52 +46,12 @@ class ManagementOPs:
         :param nusers: number of iam users to create
         :return: Dictionary of IAM users details
         """
-        iam_users = dict()
-        # Create S3 user
-        iam_users.update(
-            {'user_name': 's3' + cls.user_prefix + str(random.randint(100, 1000))})  # nosec
-        iam_users.update({'emailid': iam_users['user_name'] + cls.email_suffix})
-        iam_users.update(
-            {'password': DI_CFG["DiUserConfig"]["s3_account"]["password"]})
-        s3acc_obj = S3AccountOperationsRestAPI()
-        resp = s3acc_obj.create_s3_account(
-            user_name=iam_users['user_name'],
-            email_id=iam_users['emailid'],
-            passwd=iam_users['password'])
-        assert_utils.assert_true(resp[0], resp[1])
-        LOGGER.info("Created s3 account %s", iam_users['user_name'])
-        iam_users.update({'accesskey': resp[1]["access_key"]})
-        iam_users.update({'secretkey': resp[1]["secret_key"]})
-
-        # Create IAM users
-        time_stamp = time.strftime("%Y%m%d_%H%M%S")
-        users = {
-            "iam_{}{}_{}".format(
-                cls.user_prefix,
-                i,
-                time_stamp): dict() for i in range(
-                1,
-                nusers + 1)}
-        iam_obj = IamTestLib(
-            access_key=iam_users['accesskey'],
-            secret_key=iam_users['secretkey'])
-        iam_user_passwd = DI_CFG["DiUserConfig"]["iam_user"]["password"]
-        for i in range(1, nusers + 1):
-            udict = dict()
-            user = "iam_{}{}_{}".format(cls.user_prefix, i, time_stamp)
-            email = user + cls.email_suffix
-            udict.update({'emailid': email})
-            udict.update({'user_name': user})
-            udict.update({'password': iam_user_passwd})
-            resp = iam_obj.create_user(user)
-            assert_utils.assert_true(resp[0], resp[1])
-            resp = iam_obj.create_access_key(user)
-            LOGGER.info(resp)
-            assert_utils.assert_true(resp[0], resp[1])
-            udict.update({'accesskey': resp[1]["AccessKey"]["AccessKeyId"]})
-            udict.update({'secretkey': resp[1]["AccessKey"]["SecretAccessKey"]})
-            users.update({user: udict})
-        iam_users.update({'iam_users': users})
+        spec = ProvisionSpec(accounts=1, iam_users=nusers, prefix='s3' + cls.user_prefix,
+                             account_password=DI_CFG["DiUserConfig"]["s3_account"]["password"],
+                             iam_password=DI_CFG["DiUserConfig"]["iam_user"]["password"],
+                             email_suffix=cls.email_suffix)
+        iam_users = list(BulkProvisioner().provision(spec).values())[0]
+        LOGGER.info("Created s3 account %s with %s iam users", iam_users['user_name'], nusers)
         return iam_users
 
     @classmethod
@@ -108,14 +66,17 @@ class ManagementOPs:
         :return:
         """
         LOGGER.info(f"Creating Cortx s3 account users with {use_cortx_cli}")
-        if use_cortx_cli:
-            s3acc_obj = cctl.CortxCliTestLib()
-            s3acc_obj.open_connection()
-        else:
-            s3acc_obj = RestS3user()
+        s3_user_passwd = DI_CFG["DiUserConfig"]["s3_account"]["password"]
+        if not use_cortx_cli:
+            spec = ProvisionSpec(accounts=nusers, prefix=cls.user_prefix,
+                                 account_password=s3_user_passwd, email_suffix=cls.email_suffix)
+            users = BulkProvisioner().provision(spec)
+            LOGGER.debug("Users %s created for I/O", users)
+            return users
+        s3acc_obj = cctl.CortxCliTestLib()
+        s3acc_obj.open_connection()
         ts = time.strftime("%Y%m%d_%H%M%S")
         users = {"{}{}_{}".format(cls.user_prefix, i, ts): dict() for i in range(1, nusers + 1)}
-        s3_user_passwd = DI_CFG["DiUserConfig"]["s3_account"]["password"]
         for i in range(1, nusers + 1):
             udict = dict()
             user = "{}{}_{}".format(cls.user_prefix, i, ts)
@@ -123,17 +84,9 @@ class ManagementOPs:
             udict.update({'user_name': user})
             udict.update({'emailid': email})
             udict.update({'password': s3_user_passwd})
-            if use_cortx_cli:
-                result, acc_details = s3acc_obj.create_account_cortxcli(
-                    user, email, s3_user_passwd)
-                assert_utils.assert_true(result, 'S3 account user not created.')
-            else:
-                resp = s3acc_obj.create_an_account(
-                    user, s3_user_passwd)
-                assert_utils.assert_equal(
-                    resp.status_code, 201,
-                    'S3 account user not created.')
-                acc_details = json.loads(resp.text)
+            result, acc_details = s3acc_obj.create_account_cortxcli(
+                user, email, s3_user_passwd)
+            assert_utils.assert_true(result, 'S3 account user not created.')
 
             LOGGER.info("Created s3 account %s", user)
             udict.update({'accesskey': acc_details["access_key"]})
@@ -160,26 +113,27 @@ class ManagementOPs:
 
         buckets = {"user{}".format(i): list() for i in range(1, nbuckets + 1)}
 
+        if not use_cortxcli:
+            # Buckets of all the users are created concurrently.
+            tasks = []
+            for k in users:
+                users[k]["buckets"] = []
+                tasks.extend((users[k], '{}bucket{}'.format(k.replace('_', '-'), i))
+                             for i in range(1, nbuckets + 1))
+            BulkProvisioner().create_buckets(tasks)
+            return users
+
         # create 10 buckets per user
         for k in users:
-            if use_cortxcli:
-                cli.login_cortx_cli(k, users[k]["password"])
-                bkts = [
-                    cli.create_bucket_cortx_cli('{}bucket{}'.format(
-                        k.replace('_', '-'), i))[1] for i in range(
-                        1, nbuckets + 1)]
-                bkts_lst = [i.split(" ")[2].split(
-                    '\nBucket')[0] for i in bkts if 'created' in i]
-                buckets[k] = bkts_lst
-                cli.logout_cortx_cli()
-            else:
-                access_key = users[k].get("accesskey")
-                secret_key = users[k].get("secretkey")
-                s3_obj = _init_s3_conn(access_key, secret_key, k)
-                bkts_lst = [
-                    s3_obj.create_bucket(Bucket='{}bucket{}'.format(
-                        k.replace('_', '-'), i)).name for i in range(
-                        1, nbuckets + 1)]
+            cli.login_cortx_cli(k, users[k]["password"])
+            bkts = [
+                cli.create_bucket_cortx_cli('{}bucket{}'.format(
+                    k.replace('_', '-'), i))[1] for i in range(
+                    1, nbuckets + 1)]
+            bkts_lst = [i.split(" ")[2].split(
+                '\nBucket')[0] for i in bkts if 'created' in i]
+            buckets[k] = bkts_lst
+            cli.logout_cortx_cli()
             users[k]["buckets"] = bkts_lst
         return users
 
@@ -265,6 +219,16 @@ class ManagementOPs:
         users = cls.create_buckets(nbuckets=maxbuckets, users=users)
         return users
 
+    @classmethod
+    def delete_users_and_buckets(cls, users):
+        """
+        Removes buckets (with their objects), iam users and s3 account users created by
+        create_account_users/create_iam_users/create_buckets, concurrently.
+        :param users: user dict of account users.
+        :return:
+        """
+        BulkProvisioner().teardown(users)
+
     @classmethod
     def create_s3_user_csm_rest(cls, user_name, passwd):
         """Function creates s3 user using REST API.
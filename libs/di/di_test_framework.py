@@ -25,7 +25,6 @@ import logging
 import csv
 import hashlib
 import multiprocessing as mp
-import boto3
 import re
 import time
 import errno
@@ -34,6 +33,7 @@ from boto3.s3.transfer import TransferConfig
 from commons import worker
 from libs.di import di_params
 from libs.di.di_mgmt_ops import ManagementOPs
+from commons.utils import boto3_utils
 from commons.utils import config_utils
 from commons import params
 from commons import cortxlogging
@@ -60,8 +60,9 @@ class Uploader(object):
         buckets = [user_name + '-' + timestamp + '-bucket' + str(i) for i in range(2)]
 
         try:
-            s3 = boto3.resource('s3', aws_access_key_id=access_key, aws_secret_access_key=secret_key,
-                                endpoint_url=params.S3_ENDPOINT, verify=False)
+            s3 = boto3_utils.get_resource('s3', aws_access_key_id=access_key,
+                                          aws_secret_access_key=secret_key,
+                                          endpoint_url=params.S3_ENDPOINT, verify=False)
             LOGGER.info("S3 resource created for %s", user_name)
         except Exception as e:
             LOGGER.info(
@@ -158,9 +159,9 @@ class DIChecker(object):
             access_key = keys[0]
             secret_key = keys[1]
             try:
-                s3 = boto3.resource('s3', aws_access_key_id=access_key,
-                                    aws_secret_access_key=secret_key,
-                                    endpoint_url=params.S3_ENDPOINT, verify=False)
+                s3 = boto3_utils.get_resource('s3', aws_access_key_id=access_key,
+                                              aws_secret_access_key=secret_key,
+                                              endpoint_url=params.S3_ENDPOINT, verify=False)
             except Exception as e:
                 LOGGER.error(
                     f'could not create s3 object for user {user_name} with access '
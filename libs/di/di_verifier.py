@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Verify integrity of S3 objects while they are downloaded.
+
+The get_object body is read in large chunks and hashed as it arrives, nothing is written to
+the client disk. Objects written by the DI data generator can also be verified against their
+regenerated content, which needs only the seed and size of the object, no stored checksum.
+"""
+
+import hashlib
+import logging
+from typing import Tuple
+from typing import Union
+
+from commons.utils.checksum_utils import BLOCK_SIZE
+from commons.utils.checksum_utils import algo_name
+from libs.di.data_generator import DEFAULT_DATA_TYPE
+from libs.di.data_generator import DataGenerator
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StreamVerifier:
+    """Hash or compare S3 objects as they are streamed from get_object."""
+
+    def __init__(self, s3_client, read_size: int = BLOCK_SIZE) -> None:
+        """
+        Initializer for StreamVerifier.
+        :param s3_client: boto3 s3 client.
+        :param read_size: Bytes read from the response body at a time.
+        """
+        self.s3_client = s3_client
+        self.read_size = read_size
+
+    def iter_object(self, bucket: str, key: str, **kwargs):
+        """Yield chunks of the object as they are received."""
+        body = self.s3_client.get_object(Bucket=bucket, Key=key, **kwargs)["Body"]
+        try:
+            for chunk in iter(lambda: body.read(self.read_size), b''):
+                yield chunk
+        finally:
+            body.close()
+
+    def digest(self, bucket: str, key: str, hash_algo: str = "md5", **kwargs) -> Tuple[bytes, int]:
+        """
+        Digest of an object computed while it is downloaded.
+        :param bucket: Name of the bucket.
+        :param key: Key of the object.
+        :param hash_algo: hash algo e.g. md5, sha512.
+        :param kwargs: Optional get_object arguments e.g. VersionId, Range.
+        :return: digest bytes and size of the object.
+        """
+        hash_obj = hashlib.new(algo_name(hash_algo))
+        size = 0
+        for chunk in self.iter_object(bucket, key, **kwargs):
+            hash_obj.update(chunk)
+            size += len(chunk)
+        return hash_obj.digest(), size
+
+    def verify_digest(self, bucket: str, key: str, expected: Union[str, bytes],
+                      hash_algo: str = "md5", **kwargs) -> Tuple[bool, str]:
+        """
+        Compare digest of a downloaded object with the expected digest.
+        :param expected: Expected digest, hex string or bytes.
+        :return: True and hex digest of the object if it matches the expected digest.
+        """
+        digest, size = self.digest(bucket, key, hash_algo, **kwargs)
+        expected = expected.hex() if isinstance(expected, bytes) else expected.strip().lower()
+        if digest.hex() == expected:
+            LOGGER.info("%s checksum %s of %s/%s (%s bytes) matches", hash_algo, digest.hex(),
+                        bucket, key, size)
+            return True, digest.hex()
+        LOGGER.error("%s checksum %s of %s/%s (%s bytes) does not match expected %s", hash_algo,
+                     digest.hex(), bucket, key, size, expected)
+        return False, digest.hex()
+
+    # pylint: disable=too-many-arguments
+    def verify_seed(self, bucket: str, key: str, seed: int, size: int,
+                    generator: DataGenerator = None, datatype: int = DEFAULT_DATA_TYPE,
+                    **kwargs) -> Tuple[bool, int]:
+        """
+        Compare a downloaded object with the content regenerated from its seed.
+        :param seed: Seed the object was generated with.
+        :param size: Size the object was generated with.
+        :param generator: DataGenerator the object was generated with, compression ratio
+        must match.
+        :param datatype: datatype the object was generated with.
+        :return: True and size if content matches, else False and offset of first mismatch.
+        """
+        generator = generator or DataGenerator()
+        expected = generator.open_stream(size, seed, datatype)
+        offset = 0
+        for chunk in self.iter_object(bucket, key, **kwargs):
+            wanted = expected.read(len(chunk))
+            if chunk != wanted:
+                mismatch = next((ix for ix, (got, exp) in enumerate(zip(chunk, wanted))
+                                 if got != exp), min(len(chunk), len(wanted)))
+                LOGGER.error("%s/%s does not match seed %s at offset %s", bucket, key, seed,
+                             offset + mismatch)
+                return False, offset + mismatch
+            offset += len(chunk)
+        if offset != size:
+            LOGGER.error("%s/%s is %s bytes, expected %s", bucket, key, offset, size)
+            return False, offset
+        LOGGER.info("%s/%s (%s bytes) matches seed %s", bucket, key, size, seed)
+        return True, size
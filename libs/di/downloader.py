@@ -24,12 +24,12 @@ import os
 import logging
 import csv
 import queue
-import hashlib
-from pathlib import Path
 from commons import params
 from commons import worker
-from commons.utils import system_utils
 from libs.di import di_base
+from libs.di import di_manifest
+from libs.di.data_generator import DataGenerator
+from libs.di.di_verifier import StreamVerifier
 from libs.di.di_mgmt_ops import ManagementOPs
 from libs.di import uploader
 
@@ -43,23 +43,14 @@ class DataIntegrityValidator:
 
     @staticmethod
     def download_and_compare_chksum(kwargs):
-        """ Download file with s3cmd "s3://bucket/ObjectPath" test_output_file
-            compare downloaded file's md5sum with prior stored
+        """ Stream object "s3://bucket/ObjectPath" and compare its md5sum with prior stored,
+            or its content with the content regenerated from seed and size if given.
         """
         try:
             user = kwargs.get('user')
             objectpath = kwargs.get('objectpath')
             bucket = kwargs.get('bucket')
             objcsum = kwargs.get('objcsum')
-            cwd = params.DOWNLOAD_HOME
-            basepath = os.path.join(cwd, user)
-            objpth = os.path.join(cwd, user, objectpath)
-            try:
-                if not os.path.exists(basepath):
-                    system_utils.mkdirs(basepath)
-            except (OSError, Exception) as fault:
-                LOGGER.error(f"Error {fault} while creating directory for user {user}")
-
             try:
                 s3 = DataIntegrityValidator.s3_objects[user]
             except Exception as fault:
@@ -67,8 +58,16 @@ class DataIntegrityValidator:
                 LOGGER.error(f'No S3 Connection for user {kwargs} in S3 sessions list {fault}')
                 LOGGER.error(f"Won't be able to download object {kwargs} without connection")
                 return
+            verifier = StreamVerifier(s3.meta.client)
             try:
-                s3.meta.client.download_file(bucket, objectpath, objpth)
+                # Object is hashed (or compared with its regenerated content) as it is
+                # received, it is not written to the disk.
+                if kwargs.get('seed') is not None:
+                    matched, result = verifier.verify_seed(
+                        bucket, objectpath, int(kwargs['seed']), int(kwargs['size']),
+                        DataGenerator(c_ratio=int(kwargs.get('c_ratio', 2))))
+                else:
+                    matched, result = verifier.verify_digest(bucket, objectpath, objcsum)
                 LOGGER.info(f'downloaded object : {kwargs}')
             except Exception as e:
                 print(e)
@@ -76,39 +75,16 @@ class DataIntegrityValidator:
                 DataIntegrityValidator.failed_files_server_error.append(kwargs)
             else:
                 print("Downloaded file '{}' from '{}'".format(objectpath, bucket))
-                filepath = objpth
-                sz = Path(filepath).stat().st_size
-                read_sz = 8192
-                csum = None
-                with open(filepath, 'rb') as fp:
-                    file_hash = hashlib.md5()
-                    if sz < read_sz:
-                        buf = fp.read(sz)
-                    else:
-                        buf = fp.read(read_sz)
-                    while buf:
-                        file_hash.update(buf)
-                        buf = fp.read(read_sz)
-                    csum = file_hash.hexdigest()
-                    try:
-                        os.unlink(filepath)
-                    except (OSError, Exception) as fault:
-                        LOGGER.error('Fault %s occurred duing unlink. Trying rm command', fault)
-                        rmLocalObject = "rm -rf " + str(filepath)
-                        os.system(rmLocalObject)
-
-                if objcsum == csum.strip():
+                if matched:
                     LOGGER.info(
-                        "download object checksum {} matches provided checksum {} for file {}".format(csum, objcsum,
+                        "download object checksum {} matches provided checksum {} for file {}".format(result, objcsum,
                                                                                                       objectpath))
                 else:
                     LOGGER.error(
-                        "download object checksum {} does not matches provided checksum {} for file {}".format(csum,
+                        "download object checksum {} does not matches provided checksum {} for file {}".format(result,
                                                                                                                objcsum,
                                                                                                                objectpath))
                     DataIntegrityValidator.failed_files.append(kwargs)
-                    if os.path.exists(filepath):
-                        os.remove(filepath)
         except Exception as fault:
             LOGGER.exception(fault)
             LOGGER.error(f'Exception occurred for item {kwargs} with exception {fault}')
@@ -116,72 +92,57 @@ class DataIntegrityValidator:
     @classmethod
     def verify_data_integrity(cls, users):
         """
-        UploadInfo File format supported is
+        Live objects of the users are read from the DI manifest, e.g.
         #user7,user7-8844buckets0,naPcn6qP47SkUPkxbP_PtJUVF1iv.json,7e2db9e2f7621db0ddfde4d294e92eca
-        Downloads the file and compare checksum.
+        Streams the objects and compare checksum.
         :return:
         """
         workers = worker.Workers()
         workers.start_workers()
         cls.s3_objects = di_base.init_s3_connections(users=users)
-        deletedFiles = list()
-        uploadedFiles = list()
-        deletedDict = dict()
         summary = dict()
-        with open(params.UPLOADED_FILES, newline='') as f:
-            reader = csv.reader(f)
-            # uploadedFiles = list(reader)
-            uploadedFiles = [el for el in list(reader) if el[0] in users.keys()]
-
-        if len(uploadedFiles) == 0:
+        store = di_manifest.ManifestStore()
+        user_names = list(users.keys())
+        if store.count(users=user_names, status=None) == 0:
             print("uploaded data not found, exiting script")
             LOGGER.info("uploaded data not found, exiting script")
             workers.end_workers()
             return
 
         if os.path.exists(params.DELETE_OP_FILE_NAME):
+            # Deletes recorded in the delete info csv are applied to the manifest.
             with open(params.DELETE_OP_FILE_NAME, newline='') as f:
-                reader = csv.reader(f)
-                deletedFiles = list(reader)
-        summary['deleted_files'] = len(deletedFiles)
-
-        for f in deletedFiles:
-            if len(f) == 4:
-                deletedDict[(f[0], f[1], f[2])] = f[3]
-            else:
-                LOGGER.error("Skipped considering deleted file {}".format(f))
-
-        for i in range(1, params.NUSERS + 1):
-            try:
-                if not os.path.exists(os.path.join(params.DOWNLOAD_HOME,
-                                                   ManagementOPs.user_prefix + str(i))):
-                    system_utils.mkdirs(os.path.join(params.DOWNLOAD_HOME,
-                                                     ManagementOPs.user_prefix + str(i)))
-            except (OSError, Exception) as exe:
-                LOGGER.error(f"Error {exe} while creating directory for user {i}")
-
-        for ix, ent in enumerate(uploadedFiles, 1):
-            if (ent[0], ent[1], ent[2]) in deletedDict:
-                continue
+                deletedFiles = list(csv.reader(f))
+            for f in deletedFiles:
+                if len(f) != 4:
+                    LOGGER.error("Skipped considering deleted file {}".format(f))
+            store.set_status([f for f in deletedFiles if len(f) == 4],
+                             di_manifest.STATUS_DELETED)
+        summary['deleted_files'] = store.count(users=user_names,
+                                               status=di_manifest.STATUS_DELETED)
+
+        ix = 0
+        for ix, ent in enumerate(store.iter_objects(users=user_names), 1):
             workQ = queue.Queue()
             workQ.func = cls.download_and_compare_chksum
             kwargs = dict()
-            kwargs['user'] = ent[0]
-            kwargs['objectpath'] = ent[2]
-            kwargs['bucket'] = ent[1]
-            kwargs['objcsum'] = ent[3]
-            kwargs['accesskey'] = users.get(ent[0])['accesskey']
-            kwargs['secret'] = users.get(ent[0])['secretkey']
+            kwargs['user'] = ent['user']
+            kwargs['objectpath'] = ent['key']
+            kwargs['bucket'] = ent['bucket']
+            kwargs['objcsum'] = ent['checksum']
+            if ent['seed'] is not None and ent['size'] is not None:
+                # Content is compared with the bytes regenerated from seed and size.
+                kwargs['seed'] = ent['seed']
+                kwargs['size'] = ent['size']
+            kwargs['accesskey'] = users.get(ent['user'])['accesskey']
+            kwargs['secret'] = users.get(ent['user'])['secretkey']
             workQ.put(kwargs)
             workers.wenque(workQ)
             LOGGER.info(f"Enqueued item {ix} for download and checksum compare")
-            # if workQ is not None:
-            #    workQ.join()
-            # workQ = None
         LOGGER.info(f"processed items {ix} for data integrity check")
 
         summary['failed_files'] = len(cls.failed_files) + len(cls.failed_files_server_error)
-        summary['uploaded_files'] = ix
+        summary['uploaded_files'] = ix + summary['deleted_files']
         summary['checksum_verified'] = summary['uploaded_files'] - summary['deleted_files']
 
         if len(cls.failed_files) > 0:
@@ -21,12 +21,9 @@
 """Multithreaded and greenlet based Upload tasks. Upload files and data blobs."""
 
 import os
-import sys
 import queue
 import random
 import logging
-import csv
-import hashlib
 import time
 import multiprocessing as mp
 from multiprocessing import Manager, Event
@@ -37,14 +34,9 @@ from commons import params
 from libs.di import di_base
 from libs.di import data_man
 from libs.di import data_generator
+from libs.di import di_manifest
 from commons.params import USER_JSON
 
-try:
-    if sys.platform in ['linux', 'linux2']:
-        import fcntl
-except ModuleNotFoundError as error:
-    logging.error(error)
-
 uploadObjects = []
 LOGGER = logging.getLogger(__name__)
 
@@ -98,14 +90,11 @@ class Uploader:
                 f"processed items {ix} to upload for user {user}")
         workers.end_workers()
         LOGGER.info('Upload Workers shutdown completed successfully')
+        self.change_manager.compact(user)
         if len(uploadObjects) > 0:
-            with open(params.UPLOADED_FILES, 'a', newline='') as fp:
-                wr = csv.writer(
-                    fp, quoting=csv.QUOTE_NONE, delimiter=',', quotechar='',
-                    escapechar='\\')
-                fcntl.flock(fp, fcntl.LOCK_EX)
-                wr.writerows(uploadObjects)
-                fcntl.flock(fp, fcntl.LOCK_UN)
+            # Objects of the process are added to the manifest in a single transaction.
+            di_manifest.ManifestStore().add_objects(uploadObjects)
+            uploadObjects.clear()
         LOGGER.info(f'Upload completed for user {user}')
 
     def _upload(self, kwargs):
@@ -122,32 +111,32 @@ class Uploader:
         seed = data_generator.DataGenerator.get_random_seed()
         size = random.sample(data_generator.SMALL_BLOCK_SIZES, 1)[0]
         gen = data_generator.DataGenerator(c_ratio=2)
-        buf, csum = gen.generate(size, seed=seed)
-        file_path = gen.save_buf_to_file(buf, csum, 1024 * 1024, prefix)
+        # Object is streamed from the generator, md5 is computed while it is uploaded. Name
+        # embeds seed and size instead of the sha1 of the content, which would take another
+        # generation pass, the content is regenerated from them for verification.
+        tag = f'{seed}-{size}' if gen.append_csum_file_name else None
+        obj_name = gen.get_object_name(tag)
+        obj_path = os.path.join(prefix, obj_name)
+        stream = gen.open_stream(size, seed, algos='md5')
         s3 = s3connections[random.randint(0, pool_len - 1)]
         try:
-            s3.meta.client.upload_file(str(file_path),
-                                       bucket,
-                                       os.path.basename(file_path),
-                                       Config=Uploader.tsfrConfig)
-            print(f'uploaded file {file_path} for user {user_name}')
+            s3.meta.client.upload_fileobj(stream,
+                                          bucket,
+                                          obj_name,
+                                          Config=Uploader.tsfrConfig)
+            print(f'uploaded file {obj_path} for user {user_name}')
         except Exception as e:
             LOGGER.info(
-                f'{file_path} in bucket {bucket} Upload caught exception: {e}')
+                f'{obj_path} in bucket {bucket} Upload caught exception: {e}')
         else:
-            LOGGER.info(f'{file_path} in bucket {bucket} Upload Done')
-            with open(file_path, 'rb') as fp:
-                md5sum = hashlib.md5(fp.read()).hexdigest()
-            obj_name = os.path.basename(file_path)
-            stat_info = os.stat(file_path)
-            row_data = [user_name, bucket, obj_name, md5sum]
+            LOGGER.info(f'{obj_path} in bucket {bucket} Upload Done')
+            md5sum = stream.hexdigests()['md5']
+            row_data = [user_name, bucket, obj_name, md5sum, seed, size]
             uploadObjects.append(row_data)
             file_object = dict(name=obj_name, checksum=md5sum, seed=seed,
-                               size=size, mtime=stat_info.st_mtime)
+                               size=size, mtime=time.time())
             self.change_manager.add_file_to_bucket(
                 user_name, bucket, file_object)
-            if os.path.exists(file_path):
-                os.remove(file_path)
 
     def start(self, users, buckets, files_count, prefs, stop_event, future_obj=None):
         LOGGER.info(f'Starting uploads for users {users}')
@@ -33,6 +33,7 @@ from commons.constants import Rest as Const
 from commons.exceptions import CTException
 from commons.utils import system_utils
 from commons.utils import assert_utils
+from commons.helpers.fanout_helper import call_on_nodes
 from commons.helpers.health_helper import Health
 from config import CMN_CFG, HA_CFG
 from config.s3 import S3_CFG
@@ -758,15 +759,13 @@ class HALibs:
     def check_cluster_health():
         """Check the cluster health"""
         LOGGER.info("Check cluster status for all nodes.")
-        nodes = CMN_CFG["nodes"]
-        for node in nodes:
-            hostname = node['hostname']
-            health = Health(hostname=hostname,
-                            username=node['username'],
-                            password=node['password'])
-            result = health.check_node_health()
+        health_objs = [Health(hostname=node['hostname'], username=node['username'],
+                              password=node['password']) for node in CMN_CFG["nodes"]]
+        results = call_on_nodes(Health.check_node_health, hosts=health_objs, raise_error=True)
+        for health in health_objs:
+            result = results[health.hostname].output
             assert_utils.assert_true(result[0],
-                                     f'Cluster Node {hostname} failed in '
+                                     f'Cluster Node {health.hostname} failed in '
                                      f'health check. Reason: {result}')
             health.disconnect()
         LOGGER.info("Cluster status is healthy.")
@@ -40,9 +40,10 @@ from commons import pswdmanager
 from commons.constants import Rest as Const
 from commons.exceptions import CTException
 from commons.helpers.pods_helper import LogicalNode
+from commons.utils import checksum_utils
 from commons.utils import config_utils
 from commons.utils import system_utils
-from commons.utils.system_utils import run_local_cmd
+from commons.utils.wait_utils import wait_until
 from config import CMN_CFG, HA_CFG
 from config.s3 import S3_BLKBOX_CFG
 from config.s3 import S3_CFG
@@ -811,16 +812,19 @@ class HAK8s:
                 return False, "K8S cluster status has Failures"
         if pod_list is None:
             pod_list = pod_obj.get_all_pods(pod_prefix=common_const.POD_NAME_PREFIX)
-        for pod_name in pod_list:
-            res = pod_obj.send_k8s_cmd(
-                operation="exec", pod=pod_name, namespace=common_const.NAMESPACE,
-                command_suffix=f"-c {common_const.HAX_CONTAINER_NAME} -- "
-                               f"{common_cmd.MOTR_STATUS_CMD}", decode=True)
+        results = pod_obj.exec_in_pods(
+            [(pod_name, common_const.HAX_CONTAINER_NAME, common_cmd.MOTR_STATUS_CMD)
+             for pod_name in pod_list])
+        for result in results:
+            if not result.status:
+                raise IOError(result.exception or result.error or result.output)
+            res = result.output.strip()
             for line in res.split("\n"):
                 if common_const.MOTR_CLIENT not in line:
                     if "failed" in line or "offline" in line or "unknown" in line:
-                        LOGGER.error("Response for data pod %s's hctl status: %s", pod_name, res)
-                        return False, f"Cortx HCTL status has Failures in pod {pod_name}"
+                        LOGGER.error("Response for data pod %s's hctl status: %s",
+                                     result.pod, res)
+                        return False, f"Cortx HCTL status has Failures in pod {result.pod}"
         return True, "K8s and cortx both cluster up and clean."
 
     @staticmethod
@@ -831,12 +835,8 @@ class HAK8s:
         :param compare: Flag to compare checksums of files
         :return: List of md5 content or bool for md5 comparison
         """
-        md5_list = []
-        for file in file_list:
-            cmd = common_cmd.MD5SUM.format("-t", file)
-            resp = run_local_cmd(cmd=cmd)
-            md5 = (resp[1].split())[0]
-            md5_list.append(md5.replace("b'", ""))
+        md5_list = [digests["md5"].hex() for digests in
+                    checksum_utils.files_digests(file_list, "md5")]
 
         if not compare:
             return md5_list
@@ -849,18 +849,20 @@ class HAK8s:
         :param timeout: Timeout value
         :return: bool, response
         """
-        resp = False
+        status = {"resp": False}
         LOGGER.info("Polling cluster status")
         start_time = int(time.time())
-        while timeout > int(time.time()) - start_time:
-            time.sleep(60)
-            resp = self.check_cluster_status(pod_obj)
-            if resp[0]:
-                LOGGER.info("Cortx cluster is up")
-                break
+
+        def _cluster_up():
+            status["resp"] = self.check_cluster_status(pod_obj)
+            return status["resp"][0]
+
+        if wait_until(_cluster_up, timeout=timeout, interval=10, max_interval=60,
+                      desc="cortx cluster up", raise_on_timeout=False):
+            LOGGER.info("Cortx cluster is up")
 
         LOGGER.debug("Time taken by cluster restart is %s seconds", int(time.time()) - start_time)
-        return resp
+        return status["resp"]
 
     @staticmethod
     def restore_pod(pod_obj, restore_method, restore_params: dict = None):
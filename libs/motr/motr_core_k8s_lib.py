@@ -181,12 +181,13 @@ class MotrCoreK8s():
             decode=True)
         return node_name
 
-    def m0crate_run(self, local_file_path, remote_file_path, cortx_node):
+    def m0crate_run(self, local_file_path, remote_file_path, cortx_node, timeout=None):
         """
         To run the m0crate utility on specified cortx_node
         param: local_file_path: Absolute workload file(yaml) path on the client
         param: remote_file_path: Absolute workload file(yaml) path on the master node
         param: cortx_node: Node where the m0crate utility will run
+        param: timeout: Max seconds to wait for new output of m0crate, None waits till it exits
         """
         pod_node = self.get_node_pod_dict()[cortx_node]
         result = self.node_obj.copy_file_to_remote(local_file_path, remote_file_path)
@@ -204,15 +205,22 @@ class MotrCoreK8s():
                              {}".format(local_file_path, common_const.HAX_CONTAINER_NAME,
                                         result[1]))
         cmd = common_cmd.K8S_POD_INTERACTIVE_CMD.format(pod_node, m0crate_run_cmd)
-        result, error1, ret = system_utils.run_remote_cmd_wo_decision(cmd,
-                                                                      self.master_node,
-                                                                      self.master_uname,
-                                                                      self.master_passwd)
-        log.info("%s , %s", result, error1)
-        if ret:
-            assert False, "Failed with return code {}, Please check the logs".format(ret)
-        assert not any((error_str in error1.decode("utf-8") for error_str in
-                        ['error', 'ERROR', 'Error'])), "Errors found in output {}".format(error1)
+        errors = []
+
+        def _check_error(line):
+            log.info(line)
+            if any(error_str in line for error_str in ['error', 'ERROR', 'Error']):
+                errors.append(line)
+
+        # Stream output as it is generated instead of buffering the whole m0crate run
+        stream = self.node_obj.execute_cmd_stream(cmd, timeout=timeout,
+                                                  stderr_callback=_check_error)
+        for line in stream:
+            log.info(line)
+        if stream.exit_status:
+            assert False, "Failed with return code {}, Please check the logs".format(
+                stream.exit_status)
+        assert not errors, "Errors found in output {}".format(errors)
 
     def dd_cmd(self, b_size, count, file, node):
         """
@@ -31,7 +31,6 @@ import shutil
 import signal
 import string
 import time
-from threading import Thread
 from typing import List
 from string import Template
 import requests.exceptions
@@ -40,6 +39,7 @@ import yaml
 from commons import commands as common_cmd
 from commons import constants as common_const
 from commons import pswdmanager
+from commons.helpers.fanout_helper import call_on_nodes
 from commons.helpers.pods_helper import LogicalNode
 from commons.params import LOG_DIR
 from commons.params import LATEST_LOG_FOLDER
@@ -363,23 +363,18 @@ class ProvDeployK8sCortxLib:
         if len(worker_node_list) == 0:
             return False, "Minimum one worker node needed for deployment"
 
+        def _prereq_worker_node(node):
+            pre_req_resp = self.prereq_vm(node)
+            assert_utils.assert_true(pre_req_resp[0], pre_req_resp[1])
+            system_disk = system_disk_dict[node.hostname]
+            self.prereq_git(node, git_tag)
+            self.copy_sol_file(node, sol_file_path, self.deploy_cfg["k8s_dir"])
+            # system disk will be used mount /mnt/fs-local-volume on worker node
+            self.execute_prereq_cortx(node, self.deploy_cfg["k8s_dir"], system_disk)
+
         def _operation_on_worker_node():
-            for node in worker_node_list:
-                pre_req_resp = self.prereq_vm(node)
-                assert_utils.assert_true(pre_req_resp[0], pre_req_resp[1])
-                system_disk = system_disk_dict[node.hostname]
-                self.prereq_git(node, git_tag)
-                self.copy_sol_file(node, sol_file_path, self.deploy_cfg["k8s_dir"])
-                # system disk will be used mount /mnt/fs-local-volume on worker node
-                self.execute_prereq_cortx(node, self.deploy_cfg["k8s_dir"], system_disk)
-
-            thread_list = []
-            for each in worker_node_list:
-                worker_thread = Thread(target=self.pull_cortx_image, args=(each,))
-                worker_thread.start()
-                thread_list.append(worker_thread)
-            for each in thread_list:
-                each.join()
+            call_on_nodes(_prereq_worker_node, hosts=worker_node_list, raise_error=True)
+            call_on_nodes(self.pull_cortx_image, hosts=worker_node_list)
 
         def _post_deploy_check(resp):
             if not resp[1]:
@@ -33,6 +33,7 @@ from commons import commands as common_commands
 from commons import constants as cmn_cons
 from commons import errorcodes as err
 from commons.exceptions import CTException
+from commons.helpers.log_tail_helper import RemoteLogTail
 from commons.helpers.node_helper import Node
 from commons.utils import system_utils as sys_utils
 from commons.utils.config_utils import get_config
@@ -898,19 +899,17 @@ class RASTestLib(RASCoreLib):
         """
         common_cfg = RAS_VAL["ras_sspl_alert"]
 
-        LOGGER.info("Fetching sspl log file")
-        time.sleep(common_cfg["sleep_val"])
-        LOGGER.debug("Reading the sspl log file")
-        read_resp = self.node_utils.read_file(filepath, "/tmp/local_sspl.log")
-        LOGGER.debug(read_resp)
         LOGGER.info("Checking expected strings are in sspl log file")
-        resp = self.validate_alert_log(filepath, exp_string)
-        LOGGER.debug("%s : %s", resp[1], exp_string)
+        log_tail = RemoteLogTail(self.node_utils)
+        log_tail.clear(filepath)
+        resp = log_tail.wait_for_pattern(filepath, exp_string, timeout=common_cfg["sleep_val"])
+        LOGGER.debug("%s : %s", resp, exp_string)
         LOGGER.info("Fetched sspl disk space alert")
         LOGGER.info("Removing sspl log file from the Node")
         self.node_utils.remove_file(filename=filepath)
+        log_tail.clear(filepath)
 
-        return resp[0]
+        return bool(resp)
 
     def verify_alert(
             self,
@@ -971,8 +970,8 @@ class RASTestLib(RASCoreLib):
 
     def verify_the_logs(self, file_path: str, pattern_lst: str) -> list:
         """
-        Function generated warning message on server and download the
-        remote file and verifies the log
+        Function generated warning message on server and verifies the
+        remote log file on the node
 
         :param str file_path: remote file path
         :param list pattern_lst: pattern need to search in file
@@ -987,30 +986,23 @@ class RASTestLib(RASCoreLib):
             common_cfg["sspl_config"],
             common_cfg["disk_usage_val"])
         time.sleep(common_cfg["max_wait_time"])
-        file_name = file_path.split("/")[-1]
-        local_file_path = os.path.join(os.getcwd(),
-                                       file_name)
         time.sleep(10)
         self.health_obj.restart_pcs_resource(common_cfg["sspl_resource_id"])
         LOGGER.info("Sleeping for 120 seconds after restarting sspl services")
         time.sleep(common_cfg["sleep_val"])
-        self.node_utils.copy_file_to_local(file_path, local_file_path)
-        LOGGER.info("Downloaded remote file %s", local_file_path)
-        if not os.path.exists(local_file_path):
+        if not self.node_utils.path_exists(file_path):
             resp_lst.append(False)
             return resp_lst
-        # Read the remote file contents
-        with open(local_file_path, "r", encoding="utf-8") as f_pointer:
-            for line in f_pointer:
-                if any(x in line for x in pattern_lst):
-                    resp_lst.append(True)
-                else:
-                    resp_lst.append(False)
+        # Count matching and non matching lines on the node instead of downloading the file
+        log_tail = RemoteLogTail(self.node_utils)
+        log_tail.clear(file_path)
+        matched = log_tail.count_new(file_path, pattern_lst, fixed=True)
+        unmatched = log_tail.count_new(file_path, pattern_lst, fixed=True, invert=True)
+        LOGGER.info("Lines matching %s: %s, not matching: %s", pattern_lst, matched, unmatched)
+        resp_lst.extend([True] * matched + [False] * unmatched)
         LOGGER.info("Removing sspl log file from the Node")
         self.node_utils.remove_file(filename=file_path)
 
-        os.remove(local_file_path)
-
         return resp_lst
 
     def sspl_log_collect(self) -> Tuple[bool, tuple]:
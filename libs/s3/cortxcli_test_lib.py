@@ -39,6 +39,7 @@ import time
 from config import CMN_CFG
 from commons import errorcodes as err
 from commons.exceptions import CTException
+from commons.utils import boto3_utils
 from libs.csm.cli.cortx_cli_s3_accounts import CortxCliS3AccountOperations
 from libs.csm.cli.cortx_cli_s3_buckets import CortxCliS3BucketOperations
 from libs.csm.cli.cortxcli_iam_user import CortxCliIamUser
@@ -456,6 +457,7 @@ class _S3AccountOperations(CortxCliS3AccountOperations):
             else:
                 self.login_cortx_cli()
             response = super().delete_s3account_cortx_cli(account_name)
+            boto3_utils.evict_user(account_name)
 
         except Exception as error:
             LOGGER.error("Error in %s: %s",
@@ -599,6 +601,7 @@ class _IamUser(CortxCliIamUser):
         """
         try:
             status, response = super().delete_iam_user(user_name)
+            boto3_utils.evict_user(user_name)
         except Exception as error:
             LOGGER.error("Error in %s: %s",
                          _IamUser.delete_user_cortxcli.__name__,
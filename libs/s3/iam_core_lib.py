@@ -26,6 +26,8 @@ import logging
 from typing import Union
 import boto3
 from botocore.exceptions import ClientError
+
+from commons.utils import boto3_utils
 from config.s3 import S3_CFG
 
 LOGGER = logging.getLogger(__name__)
@@ -66,18 +68,18 @@ class IAMRest:
 
         try:
             if init_iam_connection:
-                self.iam = boto3.client("iam",
-                                        use_ssl=self.use_ssl,
-                                        verify=self.iam_cert_path,
-                                        aws_access_key_id=access_key,
-                                        aws_secret_access_key=secret_key,
-                                        endpoint_url=endpoint_url)
-                self.iam_resource = boto3.resource("iam",
-                                                   use_ssl=self.use_ssl,
-                                                   verify=self.iam_cert_path,
-                                                   aws_access_key_id=access_key,
-                                                   aws_secret_access_key=secret_key,
-                                                   endpoint_url=endpoint_url)
+                self.iam = boto3_utils.get_client("iam",
+                                                  use_ssl=self.use_ssl,
+                                                  verify=self.iam_cert_path,
+                                                  aws_access_key_id=access_key,
+                                                  aws_secret_access_key=secret_key,
+                                                  endpoint_url=endpoint_url)
+                self.iam_resource = boto3_utils.get_resource("iam",
+                                                             use_ssl=self.use_ssl,
+                                                             verify=self.iam_cert_path,
+                                                             aws_access_key_id=access_key,
+                                                             aws_secret_access_key=secret_key,
+                                                             endpoint_url=endpoint_url)
             else:
                 LOGGER.info("Skipped: create iam client, resource object with boto3.")
         except (ClientError, Exception) as error:
@@ -128,6 +130,7 @@ class IamLib(IAMRest):
         """
         response = self.iam.create_access_key(UserName=user_name)
         LOGGER.debug(response)
+        boto3_utils.register_credentials(user_name, response["AccessKey"]["AccessKeyId"])
 
         return response
 
@@ -145,6 +148,7 @@ class IamLib(IAMRest):
         response = self.iam.delete_access_key(
             AccessKeyId=access_key_id, UserName=user_name)
         LOGGER.debug(response)
+        boto3_utils.evict_credentials(access_key_id)
 
         return response
 
@@ -157,6 +161,7 @@ class IamLib(IAMRest):
         """
         response = self.iam.delete_user(UserName=user_name)
         LOGGER.debug(response)
+        boto3_utils.evict_user(user_name)
 
         return response
 
@@ -24,10 +24,9 @@
 import logging
 import time
 from botocore.exceptions import ClientError
-import boto3
-import boto3.exceptions
 from commons import errorcodes as err
 from commons.exceptions import CTException
+from commons.utils import boto3_utils
 from commons.utils.s3_utils import poll
 from commons.utils.system_utils import format_iam_resp
 from config.s3 import S3_CFG
@@ -437,10 +436,13 @@ class IamTestLib(IamLib):
         :return: (Boolean, response)
         """
         LOGGER.info("Performing s3 operations using temp auth credentials.")
-        s3_resource = boto3.resource("s3", use_ssl=self.use_ssl, verify=self.iam_cert_path,
-                                     aws_access_key_id=access_key, aws_secret_access_key=secret_key,
-                                     endpoint_url=S3_CFG["s3_url"], region_name=S3_CFG["region"],
-                                     aws_session_token=session_token)
+        s3_resource = boto3_utils.get_resource("s3", use_ssl=self.use_ssl,
+                                               verify=self.iam_cert_path,
+                                               aws_access_key_id=access_key,
+                                               aws_secret_access_key=secret_key,
+                                               endpoint_url=S3_CFG["s3_url"],
+                                               region_name=S3_CFG["region"],
+                                               aws_session_token=session_token)
         try:
             LOGGER.info("Creating a Bucket")
             bucket = s3_resource.create_bucket(Bucket=bucket_name)
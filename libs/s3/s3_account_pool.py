@@ -0,0 +1,289 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Pool of pre-provisioned s3 accounts and buckets leased by tests.
+
+The pool state (accounts, free, leased and dirty entries) of a target is kept in a json file
+shared by all the xdist workers and guarded by a file lock. A lease takes a warm account from
+the free list, a released account is cleaned (buckets and iam users removed, pool buckets
+recreated) by a background thread and put back in the free list. The last session to close the
+pool removes all its accounts.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from filelock import FileLock
+
+from config import S3_CFG
+from libs.s3.iam_test_lib import IamTestLib
+from libs.s3.s3_bulk_provision import BulkProvisioner
+from libs.s3.s3_bulk_provision import ProvisionSpec
+from libs.s3.s3_core_lib import S3Lib
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _empty_state() -> dict:
+    return {"sessions": 0, "provisioning": 0, "accounts": {}, "free": [], "leased": {},
+            "dirty": [], "cleaning": {}}
+
+
+class S3AccountPool:
+    """Warm set of s3 accounts with buckets shared by the workers of a test session."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, pool_dir: str, size: int = 4, buckets: int = 2, workers: int = 8,
+                 account_password: str = None, target: str = None) -> None:
+        """
+        Initializer for S3AccountPool.
+        :param pool_dir: Directory shared by all the workers, holds the pool state.
+        :param size: Number of free accounts kept ready.
+        :param buckets: Buckets of each account.
+        :param workers: Max concurrent provision/clean requests.
+        :param account_password: Password of the accounts.
+        :param target: S3 endpoint of the pool, default S3_CFG s3_url.
+        """
+        self.size = size
+        self.buckets = buckets
+        self.workers = workers
+        self.account_password = account_password or S3_CFG["CliConfig"]["s3_account"]["password"]
+        target = target or S3_CFG["s3_url"]
+        name = hashlib.md5(target.encode()).hexdigest()[:12]  # nosec
+        self.state_path = os.path.join(pool_dir, f"s3_account_pool_{name}.json")
+        self.lock = FileLock(self.state_path + ".lock")
+        # FileLock is held per process, threads of a worker are serialized separately.
+        self._thread_lock = threading.Lock()
+        self.owner = f"{os.environ.get('PYTEST_XDIST_WORKER', 'master')}:{os.getpid()}"
+        self.provisioner = BulkProvisioner(workers=workers)
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._cleaner = None
+
+    def _update(self, func):
+        """Apply func to the pool state under the file lock, return its result."""
+        with self._thread_lock, self.lock:
+            state = _empty_state()
+            if os.path.exists(self.state_path):
+                with open(self.state_path, "r", encoding="utf-8") as state_file:
+                    state.update(json.load(state_file))
+            result = func(state)
+            tmp_path = f"{self.state_path}.{os.getpid()}"
+            with open(tmp_path, "w", encoding="utf-8") as state_file:
+                json.dump(state, state_file)
+            os.replace(tmp_path, self.state_path)
+        return result
+
+    def _provision(self, count: int) -> dict:
+        """Create count accounts with the pool buckets, names are unique across workers."""
+        spec = ProvisionSpec(accounts=count, buckets=self.buckets,
+                             prefix=f"pool{uuid.uuid4().hex[:8]}_",
+                             account_password=self.account_password)
+        try:
+            return self.provisioner.provision(spec)
+        except Exception:
+            # Accounts created before the failure are not in the pool state, remove them here.
+            created = {name: account for name, account in list(self.provisioner.credentials.items())
+                       if name.startswith(spec.prefix)}
+            if created:
+                LOGGER.error("Provisioning s3 pool accounts failed, removing %s created accounts",
+                             len(created))
+                try:
+                    self.provisioner.teardown(created)
+                except Exception as error:  # pylint: disable=broad-except
+                    LOGGER.error("Failed to remove s3 accounts %s: %s", list(created), error)
+            raise
+
+    def open(self) -> None:
+        """Join the pool, fill it and start the background cleaner."""
+        def _join(state):
+            state["sessions"] += 1
+
+        self._update(_join)
+        self._cleaner = threading.Thread(target=self._clean_loop, daemon=True)
+        self._cleaner.start()
+        self._wakeup.set()
+
+    def fill(self) -> int:
+        """Provision accounts till size accounts are free, return the number created."""
+        def _reserve(state):
+            count = max(0, self.size - len(state["free"]) - len(state["dirty"]) -
+                        len(state["cleaning"]) - state["provisioning"])
+            state["provisioning"] += count
+            return count
+
+        count = self._update(_reserve)
+        if not count:
+            return 0
+        accounts = {}
+        try:
+            accounts = self._provision(count)
+        finally:
+            def _add(state):
+                state["provisioning"] -= count
+                state["accounts"].update(accounts)
+                state["free"].extend(accounts)
+
+            self._update(_add)
+        LOGGER.info("Added %s accounts to s3 account pool", len(accounts))
+        return len(accounts)
+
+    def lease(self) -> dict:
+        """
+        Lease a free account, an account is provisioned if none is free.
+        :return: account details with user_name, password, accesskey, secretkey, buckets.
+        """
+        def _take(state):
+            if not state["free"]:
+                return None
+            name = state["free"].pop(0)
+            state["leased"][name] = self.owner
+            return state["accounts"][name]
+
+        account = self._update(_take)
+        if account is None:
+            LOGGER.warning("s3 account pool is empty, provisioning an account")
+            accounts = self._provision(1)
+
+            def _add(state):
+                state["accounts"].update(accounts)
+                state["leased"].update({name: self.owner for name in accounts})
+
+            self._update(_add)
+            account = list(accounts.values())[0]
+        self._wakeup.set()
+        LOGGER.debug("Leased s3 account %s", account["user_name"])
+        return copy.deepcopy(account)
+
+    def release(self, account: dict) -> None:
+        """Return a leased account, it is cleaned and recycled in background."""
+        def _return(state):
+            if state["leased"].pop(account["user_name"], None) is not None:
+                state["dirty"].append(account["user_name"])
+
+        self._update(_return)
+        self._wakeup.set()
+
+    def clean(self, account: dict) -> None:
+        """
+        Remove buckets and iam users of account, recreate pool buckets.
+        Pool buckets are recreated, not only emptied, so policy, acl, tagging, versioning and
+        object lock settings of a lease do not leak into the next one.
+        """
+        s3_obj = S3Lib(account["accesskey"], account["secretkey"],
+                       endpoint_url=S3_CFG["s3_url"], s3_cert_path=S3_CFG["s3_cert_path"])
+        for bucket in s3_obj.s3_client.list_buckets().get("Buckets", []):
+            s3_obj.delete_bucket(bucket["Name"], force=True)
+        pool_buckets, account["buckets"] = account["buckets"], []
+        self.provisioner.create_buckets([(account, bucket) for bucket in pool_buckets])
+        iam_obj = IamTestLib(access_key=account["accesskey"], secret_key=account["secretkey"])
+        users = [user["UserName"] for user in iam_obj.list_users()[1]]
+        if users:
+            iam_obj.delete_users_with_access_key(users)
+
+    def _clean_claimed(self) -> int:
+        """Clean the dirty accounts claimed by this worker, broken accounts are retired."""
+        def _claim(state):
+            names, state["dirty"] = state["dirty"], []
+            state["cleaning"].update({name: self.owner for name in names})
+            return {name: state["accounts"][name] for name in names}
+
+        claimed = self._update(_claim)
+        if not claimed:
+            return 0
+
+        def _clean(account):
+            try:
+                self.clean(account)
+                return True
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.error("Retiring s3 account %s: %s", account["user_name"], error)
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(claimed))) as executor:
+            results = dict(zip(claimed, executor.map(_clean, claimed.values())))
+        retired = {name: claimed[name] for name, result in results.items() if not result}
+
+        def _recycle(state):
+            for name, result in results.items():
+                state["cleaning"].pop(name, None)
+                if result:
+                    state["accounts"][name] = claimed[name]
+                    state["free"].append(name)
+                else:
+                    state["accounts"].pop(name, None)
+
+        self._update(_recycle)
+        if retired:
+            try:
+                self.provisioner.teardown(retired)
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.error("Failed to remove retired s3 accounts: %s", error)
+        return len(claimed)
+
+    def _clean_loop(self) -> None:
+        """Clean released accounts and keep the pool filled till stopped."""
+        while not self._stop.is_set():
+            self._wakeup.wait(timeout=5)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self._clean_claimed()
+                self.fill()
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.error("s3 account pool maintenance failed: %s", error)
+
+    def close(self) -> None:
+        """Leave the pool, the last session removes all the accounts of the pool."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._cleaner:
+            self._cleaner.join()
+
+        def _leave(state):
+            for name in [name for name, owner in state["leased"].items() if owner == self.owner]:
+                state["leased"].pop(name)
+                state["dirty"].append(name)
+            state["sessions"] -= 1
+            if state["sessions"] > 0:
+                return {}
+            accounts = dict(state["accounts"])
+            state.clear()
+            state.update(_empty_state())
+            return accounts
+
+        accounts = self._update(_leave)
+        if accounts:
+            LOGGER.info("Removing %s accounts of s3 account pool", len(accounts))
+            self.provisioner.teardown(accounts)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
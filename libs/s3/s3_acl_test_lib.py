@@ -23,10 +23,10 @@
 
 import copy
 import logging
-import boto3
 from botocore.exceptions import ClientError
 from commons import errorcodes as err
 from commons.exceptions import CTException
+from commons.utils import boto3_utils
 from commons.utils.s3_utils import poll
 from config.s3 import S3_CFG
 from libs.s3 import ACCESS_KEY, SECRET_KEY
@@ -510,7 +510,7 @@ class S3AclTestLib(Acl):
         """
         LOGGER.info("Retrieving %s acl attrs using %s, %s.", bucket_name, access_key, secret_key)
         s3_cert_path = S3_CFG['s3_cert_path'] if S3_CFG["validate_certs"] else False
-        s3_iam_resource = boto3.resource(
+        s3_iam_resource = boto3_utils.get_resource(
             "s3",
             verify=s3_cert_path,
             aws_access_key_id=access_key,
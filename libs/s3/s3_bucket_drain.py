@@ -0,0 +1,207 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Python Library using boto3 module to drain (empty) buckets of any size.
+
+Keys, versions and delete markers are listed page by page and removed with concurrent
+1000 key delete_objects requests, so memory use does not grow with the number of objects.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_DELETE_KEYS = 1000  # max keys of a single delete_objects request
+
+
+class DrainStats:
+    """Progress metrics of a bucket drain."""
+
+    def __init__(self, bucket_name: str) -> None:
+        """Initializer for DrainStats."""
+        self.bucket_name = bucket_name
+        self.listed = 0
+        self.deleted = 0
+        self.errors = 0
+        self.batches = 0
+        self.uploads_aborted = 0
+        self.start_time = time.time()
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **counts) -> None:
+        """Increment counters thread safely e.g. add(deleted=1000, batches=1)."""
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+            self.duration = time.time() - self.start_time
+
+    @property
+    def rate(self) -> float:
+        """Deleted keys per second."""
+        return self.deleted / self.duration if self.duration else 0.0
+
+    def __repr__(self) -> str:
+        return (f"DrainStats(bucket={self.bucket_name!r}, listed={self.listed}, "
+                f"deleted={self.deleted}, errors={self.errors}, batches={self.batches}, "
+                f"uploads_aborted={self.uploads_aborted}, duration={self.duration:.2f}, "
+                f"rate={self.rate:.1f}/s)")
+
+
+class BucketDrain:
+    """Empty a bucket with paginated listing and concurrent batched deletes."""
+
+    def __init__(self, s3_client, workers: int = 8, batch_size: int = MAX_DELETE_KEYS,
+                 progress_interval: int = 30) -> None:
+        """
+        Initializer for BucketDrain.
+        :param s3_client: boto3 s3 client.
+        :param workers: Max concurrent delete_objects/abort_multipart_upload requests.
+        :param batch_size: Keys per delete_objects request, max 1000.
+        :param progress_interval: Seconds between progress logs.
+        """
+        self.s3_client = s3_client
+        self.workers = workers
+        self.batch_size = min(batch_size, MAX_DELETE_KEYS)
+        self.progress_interval = progress_interval
+
+    def is_versioned(self, bucket_name: str) -> bool:
+        """True if versioning is or was enabled on the bucket."""
+        return bool(self.s3_client.get_bucket_versioning(Bucket=bucket_name).get("Status"))
+
+    def iter_batches(self, bucket_name: str, versions: bool = True, prefix: str = ""):
+        """
+        Yield delete_objects batches of the bucket, one listing page at a time.
+        :param bucket_name: Name of the bucket.
+        :param versions: List object versions and delete markers else latest keys only.
+        :param prefix: Only keys starting with prefix.
+        """
+        batch = []
+        if versions:
+            pages = self.s3_client.get_paginator("list_object_versions").paginate(
+                Bucket=bucket_name, Prefix=prefix,
+                PaginationConfig={"PageSize": self.batch_size})
+            for page in pages:
+                for entry in page.get("Versions", []) + page.get("DeleteMarkers", []):
+                    batch.append({"Key": entry["Key"], "VersionId": entry["VersionId"]})
+                    if len(batch) == self.batch_size:
+                        yield batch
+                        batch = []
+        else:
+            pages = self.s3_client.get_paginator("list_objects_v2").paginate(
+                Bucket=bucket_name, Prefix=prefix,
+                PaginationConfig={"PageSize": self.batch_size})
+            for page in pages:
+                for entry in page.get("Contents", []):
+                    batch.append({"Key": entry["Key"]})
+                    if len(batch) == self.batch_size:
+                        yield batch
+                        batch = []
+        if batch:
+            yield batch
+
+    def _delete_batch(self, bucket_name: str, batch: list, stats: DrainStats) -> None:
+        """Delete a batch of keys, keys failed on first attempt are retried once."""
+        response = self.s3_client.delete_objects(
+            Bucket=bucket_name, Delete={"Objects": batch, "Quiet": True})
+        errors = response.get("Errors", [])
+        if errors:
+            retry = [{key: err[key] for key in ("Key", "VersionId") if key in err}
+                     for err in errors]
+            errors = self.s3_client.delete_objects(
+                Bucket=bucket_name, Delete={"Objects": retry, "Quiet": True}).get("Errors", [])
+            for err in errors[:5]:
+                LOGGER.error("Failed to delete %s/%s: %s", bucket_name, err.get("Key"),
+                             err.get("Message"))
+        stats.add(deleted=len(batch) - len(errors), errors=len(errors), batches=1)
+
+    def abort_multipart_uploads(self, bucket_name: str, stats: DrainStats = None) -> int:
+        """
+        Abort all in progress multipart uploads of the bucket.
+        :param bucket_name: Name of the bucket.
+        :param stats: DrainStats to be updated.
+        :return: number of aborted uploads.
+        """
+        stats = stats or DrainStats(bucket_name)
+        aborted = stats.uploads_aborted
+
+        def _abort(upload):
+            self.s3_client.abort_multipart_upload(
+                Bucket=bucket_name, Key=upload["Key"], UploadId=upload["UploadId"])
+            stats.add(uploads_aborted=1)
+
+        pages = self.s3_client.get_paginator("list_multipart_uploads").paginate(
+            Bucket=bucket_name)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for page in pages:
+                list(executor.map(_abort, page.get("Uploads", [])))
+        return stats.uploads_aborted - aborted
+
+    def drain(self, bucket_name: str, versions: bool = None,
+              abort_uploads: bool = True, prefix: str = "") -> DrainStats:
+        """
+        Delete all the objects (and versions, delete markers) of the bucket.
+        :param bucket_name: Name of the bucket.
+        :param versions: Delete versions and delete markers, None to detect from bucket
+        versioning status.
+        :param abort_uploads: Abort in progress multipart uploads.
+        :param prefix: Only keys starting with prefix.
+        :return: DrainStats of the drain.
+        """
+        stats = DrainStats(bucket_name)
+        if versions is None:
+            versions = self.is_versioned(bucket_name)
+        if abort_uploads:
+            self.abort_multipart_uploads(bucket_name, stats)
+        last_log = time.time()
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for batch in self.iter_batches(bucket_name, versions, prefix):
+                stats.add(listed=len(batch))
+                # Bound in flight batches, listing should not run ahead of deletes.
+                if len(pending) >= 2 * self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(self._delete_batch, bucket_name, batch, stats))
+                if time.time() - last_log >= self.progress_interval:
+                    LOGGER.info("Draining %s", stats)
+                    last_log = time.time()
+            for future in pending:
+                future.result()
+        stats.add()
+        LOGGER.info("Drained %s", stats)
+        return stats
+
+
+def drain_bucket(s3_client, bucket_name: str, **kwargs) -> DrainStats:
+    """
+    Empty the bucket using BucketDrain.
+    :param s3_client: boto3 s3 client.
+    :param bucket_name: Name of the bucket.
+    :param kwargs: Optional keyword arguments of BucketDrain.drain.
+    :return: DrainStats of the drain.
+    """
+    return BucketDrain(s3_client).drain(bucket_name, **kwargs)
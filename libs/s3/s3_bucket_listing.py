@@ -0,0 +1,240 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Python Library using boto3 module to list buckets in parallel.
+
+The keyspace is split in partitions, either by the common prefixes of a delimiter or in key
+ranges, which are listed with concurrent list_objects_v2 pagination. Partitions still holding
+keys after a page are split again while workers are idle, at the position where the keys of
+the page differ, so dense ranges such as obj-1..obj-99999 are spread over all the workers.
+Pages are streamed through a bounded queue so memory use does not depend on the size of the
+bucket.
+"""
+
+import logging
+import os
+import queue
+import string
+import threading
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+LOGGER = logging.getLogger(__name__)
+
+# Boundaries of key range partitions, keys are ordered by their UTF-8 bytes.
+RANGE_BOUNDARIES = sorted(string.digits + string.ascii_letters)
+# Boundary characters of split ranges, smallest class holding the characters of listed keys.
+_BOUNDARY_CLASSES = (string.digits, "0123456789abcdef", "0123456789ABCDEF",
+                     string.ascii_uppercase, string.ascii_lowercase)
+_DONE = object()
+
+
+def split_range(keys: list, last_key: str = None) -> list:
+    """
+    Split key range (keys[-1], last_key] following a listed page of keys.
+    Boundaries are taken at the first position where the keys of the page differ, from the
+    smallest class (digits, hex digits, upper, lower case letters) holding the characters of
+    the page keys at that position, e.g. obj-2..obj-9 after a page obj-0..obj-1899. Deeper
+    positions of the last key are used when no boundary is left in the range.
+    :param keys: Sorted keys of the listed page.
+    :param last_key: Last key of the range, None for the end of the keyspace.
+    :return: list of (start_after, last_key) ranges, empty if range can not be split.
+    """
+    start_after = keys[-1]
+    for pos in range(len(os.path.commonprefix([keys[0], start_after])), len(start_after)):
+        seen = {key[pos] for key in keys
+                if len(key) > pos and key.startswith(start_after[:pos])}
+        chars = next((chars for chars in _BOUNDARY_CLASSES if seen.issubset(chars)),
+                     RANGE_BOUNDARIES)
+        bounds = [start_after[:pos] + char for char in chars if char > start_after[pos]]
+        bounds = [bound for bound in bounds if last_key is None or bound < last_key]
+        if bounds:
+            bounds = [start_after] + bounds + [last_key]
+            return [(bounds[ix], bounds[ix + 1]) for ix in range(len(bounds) - 1)]
+    return []
+
+
+def _put(pages: queue.Queue, item, closed: threading.Event) -> bool:
+    """Put item in the bounded queue, give up if consumer is gone."""
+    while not closed.is_set():
+        try:
+            pages.put(item, timeout=1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _set(event: threading.Event, flag: bool) -> None:
+    """Set or clear event."""
+    if flag:
+        event.set()
+    else:
+        event.clear()
+
+
+class BucketLister:
+    """Stream objects of a bucket using concurrent list_objects_v2 pagination."""
+
+    def __init__(self, s3_client, workers: int = 8, page_size: int = 1000,
+                 max_pages: int = 16) -> None:
+        """
+        Initializer for BucketLister.
+        :param s3_client: boto3 s3 client.
+        :param workers: Max concurrently listed partitions.
+        :param page_size: Keys per list_objects_v2 request, max 1000.
+        :param max_pages: Max listed pages buffered for the consumer.
+        """
+        self.s3_client = s3_client
+        self.workers = workers
+        self.page_size = page_size
+        self.max_pages = max_pages
+
+    def _paginate(self, bucket_name: str, prefix: str, **kwargs):
+        """list_objects_v2 pages of prefix."""
+        return self.s3_client.get_paginator("list_objects_v2").paginate(
+            Bucket=bucket_name, Prefix=prefix, PaginationConfig={"PageSize": self.page_size},
+            **kwargs)
+
+    def partitions(self, bucket_name: str, prefix: str = "", delimiter: str = None,
+                   pages: queue.Queue = None, closed: threading.Event = None) -> list:
+        """
+        Split keyspace under prefix in partitions.
+        With delimiter, each common prefix is a partition and keys directly under prefix are
+        put in pages. Otherwise the first page is put in pages and the keys after it are split
+        in ranges (start_after, last_key] with split_range, small buckets are listed with a
+        single request.
+        :return: list of (prefix, start_after, last_key) partitions.
+        """
+        closed = closed or threading.Event()
+        if not delimiter:
+            page = self.s3_client.list_objects_v2(
+                Bucket=bucket_name, Prefix=prefix, MaxKeys=self.page_size)
+            if page.get("Contents") and pages is not None:
+                _put(pages, page["Contents"], closed)
+            if not page.get("IsTruncated"):
+                return []
+            contents = page["Contents"]
+            ranges = split_range([obj["Key"] for obj in contents]) or \
+                [(contents[-1]["Key"], None)]
+            return [(prefix, start_after, last_key) for start_after, last_key in ranges]
+        parts = []
+        for page in self._paginate(bucket_name, prefix, Delimiter=delimiter):
+            parts.extend((cpx["Prefix"], None, None) for cpx in page.get("CommonPrefixes", []))
+            if page.get("Contents") and pages is not None:
+                _put(pages, page["Contents"], closed)
+        return parts
+
+    # pylint: disable=too-many-arguments
+    def _list_partition(self, bucket_name: str, partition: tuple, pages: queue.Queue,
+                        stop: threading.Event, closed: threading.Event,
+                        idle: threading.Event = None) -> list:
+        """
+        List one partition putting its pages in the queue till done, stopped or closed.
+        While idle is set, the rest of the partition is split and returned instead.
+        :return: list of partitions left to list.
+        """
+        prefix, start_after, last_key = partition
+        kwargs = {"StartAfter": start_after} if start_after else {}
+        for page in self._paginate(bucket_name, prefix, **kwargs):
+            contents = page.get("Contents", [])
+            done = not page.get("IsTruncated")
+            if last_key is not None and contents and contents[-1]["Key"] > last_key:
+                contents = [obj for obj in contents if obj["Key"] <= last_key]
+                done = True
+            if (contents and not _put(pages, contents, closed)) or done or stop.is_set():
+                return []
+            if contents and idle is not None and idle.is_set():
+                parts = split_range([obj["Key"] for obj in contents], last_key)
+                if parts:
+                    return [(prefix, start, last) for start, last in parts]
+        return []
+
+    def iter_objects(self, bucket_name: str, prefix: str = "", delimiter: str = None):
+        """
+        Yield object summaries (Key, Size, ETag, LastModified, ...) of the bucket.
+        Objects are yielded as pages complete, not in key order.
+        :param bucket_name: Name of the bucket.
+        :param prefix: Only keys starting with prefix.
+        :param delimiter: Partition keyspace on common prefixes of delimiter e.g. "/", default
+        key ranges.
+        """
+        pages = queue.Queue(maxsize=self.max_pages)
+        # stop ends listing on first error, closed is set once the consumer is gone.
+        stop = threading.Event()
+        closed = threading.Event()
+        # idle is set while fewer partitions than workers are pending.
+        idle = threading.Event()
+        errors = []
+
+        def _run(partition):
+            try:
+                return self._list_partition(bucket_name, partition, pages, stop, closed, idle)
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+                stop.set()
+            return []
+
+        def _produce():
+            try:
+                parts = self.partitions(bucket_name, prefix, delimiter, pages, closed)
+                LOGGER.debug("Listing %s/%s in %s partitions", bucket_name, prefix, len(parts))
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    pending = {executor.submit(_run, part) for part in parts}
+                    while pending:
+                        _set(idle, len(pending) < self.workers)
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            pending.update(executor.submit(_run, part)
+                                           for part in future.result())
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+            finally:
+                _put(pages, _DONE, closed)
+
+        threading.Thread(target=_produce, daemon=True).start()
+        try:
+            while True:
+                item = pages.get()
+                if item is _DONE:
+                    break
+                yield from item
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            closed.set()
+
+    def iter_keys(self, bucket_name: str, prefix: str = "", delimiter: str = None):
+        """Yield keys of the bucket, see iter_objects."""
+        for obj in self.iter_objects(bucket_name, prefix, delimiter):
+            yield obj["Key"]
+
+
+def iter_bucket_keys(s3_client, bucket_name: str, prefix: str = "", **kwargs):
+    """
+    Yield keys of the bucket listed in parallel.
+    :param s3_client: boto3 s3 client.
+    :param bucket_name: Name of the bucket.
+    :param prefix: Only keys starting with prefix.
+    :param kwargs: Optional keyword arguments of BucketLister.
+    """
+    yield from BucketLister(s3_client, **kwargs).iter_keys(bucket_name, prefix)
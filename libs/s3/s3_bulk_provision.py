@@ -0,0 +1,317 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Concurrent bulk provisioning of s3 accounts, iam users and buckets.
+
+A ProvisionSpec declares N accounts x M iam users x K buckets. Accounts are created first and
+then the iam users and buckets of all the accounts, each stage with bounded concurrency. Every
+create step is retried and made idempotent, entities left by a failed attempt are reused, so a
+retried step never fails with an already exists error. Entities which exist before the first
+attempt, e.g. of another run, are not taken over. Teardown removes the same entities.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from commons.utils import boto3_utils
+from config import S3_CFG
+from libs.s3.iam_test_lib import IamTestLib
+from libs.s3.s3_core_lib import S3Lib
+from libs.s3.s3_restapi_test_lib import S3AccountOperationsRestAPI
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ProvisionSpec:
+    """Declarative spec of accounts x iam users x buckets to be provisioned."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, accounts: int = 1, iam_users: int = 0, buckets: int = 0,
+                 prefix: str = "bulk_user", account_password: str = None,
+                 iam_password: str = None, email_suffix: str = "@seagate.com") -> None:
+        """
+        Initializer for ProvisionSpec.
+        :param accounts: Number of s3 accounts.
+        :param iam_users: Number of iam users per account.
+        :param buckets: Number of buckets per account.
+        :param prefix: Prefix of account names, iam users are named iam_<account>_<n>.
+        :param account_password: Password of the accounts.
+        :param iam_password: Password of the iam users, stored in the credential map only.
+        :param email_suffix: Email suffix of accounts and iam users.
+        """
+        self.accounts = accounts
+        self.iam_users = iam_users
+        self.buckets = buckets
+        self.prefix = prefix
+        self.account_password = account_password
+        self.iam_password = iam_password
+        self.email_suffix = email_suffix
+        self.time_stamp = time.strftime("%Y%m%d_%H%M%S")
+
+    def account_names(self) -> list:
+        """Names of the accounts."""
+        return [f"{self.prefix}{i}_{self.time_stamp}" for i in range(1, self.accounts + 1)]
+
+    def iam_user_names(self, account_name: str) -> list:
+        """Names of the iam users of account."""
+        return [f"iam_{account_name}_{i}" for i in range(1, self.iam_users + 1)]
+
+    def bucket_names(self, account_name: str) -> list:
+        """Names of the buckets of account."""
+        return [f"{account_name.replace('_', '-').lower()}bucket{i}"
+                for i in range(1, self.buckets + 1)]
+
+
+class BulkProvisioner:
+    """Create and remove accounts, iam users and buckets with bounded concurrency."""
+
+    def __init__(self, workers: int = 16, retries: int = 3, retry_delay: int = 2) -> None:
+        """
+        Initializer for BulkProvisioner.
+        :param workers: Max concurrent create/delete requests.
+        :param retries: Attempts of each step.
+        :param retry_delay: Initial delay between attempts, doubled on each attempt.
+        """
+        self.workers = workers
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.credentials = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _rest(self) -> S3AccountOperationsRestAPI:
+        """Account rest api object of the calling thread."""
+        if getattr(self._local, "rest", None) is None:
+            self._local.rest = S3AccountOperationsRestAPI()
+        return self._local.rest
+
+    def _retry(self, func, desc: str, *args):
+        """Call func till it succeeds or attempts are exhausted."""
+        delay = self.retry_delay
+        for attempt in range(1, self.retries + 1):
+            try:
+                return func(*args)
+            except Exception as error:  # pylint: disable=broad-except
+                if attempt == self.retries:
+                    LOGGER.error("Failed to %s: %s", desc, error)
+                    raise
+                LOGGER.warning("Failed to %s, attempt %s: %s", desc, attempt, error)
+                time.sleep(delay)
+                delay *= 2
+        return None
+
+    def _run(self, func, tasks: list) -> list:
+        """Run func on each task concurrently, first error is raised after all tasks ran."""
+        errors = []
+
+        def _task(task):
+            try:
+                return func(*task)
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(tasks)))) as executor:
+            results = list(executor.map(_task, tasks))
+        if errors:
+            LOGGER.error("%s of %s tasks failed", len(errors), len(tasks))
+            raise errors[0]
+        return results
+
+    def create_account(self, account_name: str, email: str, password: str) -> dict:
+        """
+        Create s3 account, keys of an account left by a failed attempt of this call are reset.
+        An account which exists before the first attempt, e.g. of another run, is an error.
+        :return: account details with accesskey, secretkey.
+        """
+        owned = []  # attempts of this call which created or may have created the account
+
+        def _create():
+            try:
+                status, resp = self._rest().create_s3_account(account_name, email, password)
+            except Exception:
+                owned.append(account_name)
+                raise
+            if not status:
+                if "exist" not in str(resp).lower():
+                    owned.append(account_name)
+                    raise IOError(f"Failed to create account {account_name}: {resp}")
+                if not owned:
+                    raise IOError(f"Account {account_name} already exists")
+                status, resp = self._rest().create_s3account_access_key(account_name, password)
+                if not status:
+                    raise IOError(resp)
+            return resp
+
+        resp = self._retry(_create, f"create account {account_name}")
+        LOGGER.info("Created s3 account %s", account_name)
+        details = {"user_name": account_name, "emailid": email, "password": password,
+                   "accesskey": resp["access_key"], "secretkey": resp["secret_key"],
+                   "iam_users": {}, "buckets": []}
+        with self._lock:
+            self.credentials[account_name] = details
+        return details
+
+    def create_iam_user(self, account: dict, user_name: str, email: str, password: str) -> dict:
+        """
+        Create iam user with an access key in account, a user and keys left by a failed
+        attempt of this call are reused or replaced. A user which exists before the first
+        attempt is an error.
+        :return: iam user details with accesskey, secretkey.
+        """
+        iam_obj = IamTestLib(access_key=account["accesskey"], secret_key=account["secretkey"])
+        owned = []  # attempts of this call which created or may have created the user
+
+        def _create():
+            try:
+                iam_obj.create_user(user_name)
+                owned.append(user_name)
+            except Exception as error:  # pylint: disable=broad-except
+                if "EntityAlreadyExists" not in str(error):
+                    owned.append(user_name)
+                    raise
+                if not owned:
+                    raise IOError(f"IAM user {user_name} already exists") from error
+                for key in iam_obj.list_access_keys(user_name)[1]["AccessKeyMetadata"]:
+                    iam_obj.delete_access_key(user_name, key["AccessKeyId"])
+            return iam_obj.create_access_key(user_name)[1]["AccessKey"]
+
+        access_key = self._retry(_create, f"create iam user {user_name}")
+        details = {"user_name": user_name, "emailid": email, "password": password,
+                   "accesskey": access_key["AccessKeyId"],
+                   "secretkey": access_key["SecretAccessKey"]}
+        with self._lock:
+            account["iam_users"][user_name] = details
+        return details
+
+    def create_bucket(self, account: dict, bucket_name: str) -> str:
+        """Create bucket owned by account, a bucket already owned by it is reused."""
+        s3_obj = S3Lib(account["accesskey"], account["secretkey"],
+                       endpoint_url=S3_CFG["s3_url"], s3_cert_path=S3_CFG["s3_cert_path"])
+
+        def _create():
+            try:
+                s3_obj.s3_client.create_bucket(Bucket=bucket_name)
+            except ClientError as error:
+                if error.response["Error"]["Code"] != "BucketAlreadyOwnedByYou":
+                    raise
+
+        self._retry(_create, f"create bucket {bucket_name}")
+        with self._lock:
+            account["buckets"].append(bucket_name)
+        return bucket_name
+
+    def create_buckets(self, buckets: list) -> None:
+        """
+        Create buckets concurrently, the buckets of each account are kept in creation order.
+        :param buckets: list of (account details, bucket name).
+        """
+        self._run(self.create_bucket, buckets)
+        for account, _ in buckets:
+            order = [name for acc, name in buckets if acc is account]
+            account["buckets"].sort(key=order.index)
+
+    def provision(self, spec: ProvisionSpec) -> dict:
+        """
+        Provision accounts, iam users and buckets of spec.
+        Created entities are kept in credentials, also on failure, to be removed by teardown.
+        :param spec: ProvisionSpec.
+        :return: credential map {account: {user_name, emailid, password, accesskey, secretkey,
+        iam_users: {user: {user_name, emailid, password, accesskey, secretkey}}, buckets}}.
+        """
+        start = time.time()
+        names = spec.account_names()
+        accounts = self._run(self.create_account, [
+            (name, name + spec.email_suffix, spec.account_password) for name in names])
+        tasks = []
+        for account in accounts:
+            tasks.extend((self.create_iam_user, account, user, user + spec.email_suffix,
+                          spec.iam_password)
+                         for user in spec.iam_user_names(account["user_name"]))
+            tasks.extend((self.create_bucket, account, bucket)
+                         for bucket in spec.bucket_names(account["user_name"]))
+        self._run(lambda func, *args: func(*args), tasks)
+        for account in accounts:
+            account["buckets"].sort(key=spec.bucket_names(account["user_name"]).index)
+        LOGGER.info("Provisioned %s accounts, %s iam users, %s buckets in %.2fs",
+                    len(accounts), len(accounts) * spec.iam_users, len(accounts) * spec.buckets,
+                    time.time() - start)
+        return {name: self.credentials[name] for name in names}
+
+    def _delete_iam_user(self, account: dict, user_name: str) -> None:
+        iam_obj = IamTestLib(access_key=account["accesskey"], secret_key=account["secretkey"])
+
+        def _delete():
+            try:
+                iam_obj.delete_users_with_access_key([user_name])
+            except Exception as error:  # pylint: disable=broad-except
+                if "NoSuchEntity" not in str(error):
+                    raise
+
+        self._retry(_delete, f"delete iam user {user_name}")
+        boto3_utils.evict_credentials(account["iam_users"][user_name]["accesskey"])
+
+    def _delete_bucket(self, account: dict, bucket_name: str) -> None:
+        s3_obj = S3Lib(account["accesskey"], account["secretkey"],
+                       endpoint_url=S3_CFG["s3_url"], s3_cert_path=S3_CFG["s3_cert_path"])
+
+        def _delete():
+            try:
+                s3_obj.delete_bucket(bucket_name, force=True)
+            except ClientError as error:
+                if error.response["Error"]["Code"] != "NoSuchBucket":
+                    raise
+
+        self._retry(_delete, f"delete bucket {bucket_name}")
+
+    def _delete_account(self, account_name: str, access_key: str = None) -> None:
+        def _delete():
+            status, resp = self._rest().delete_s3_account(account_name)
+            if not status and "not found" not in str(resp).lower():
+                raise IOError(f"Failed to delete account {account_name}: {resp}")
+
+        self._retry(_delete, f"delete account {account_name}")
+        # Credential map may come from another process, so its keys are not registered here.
+        boto3_utils.evict_credentials(access_key)
+
+    def teardown(self, credentials: dict = None) -> None:
+        """
+        Remove buckets (with their objects), iam users and then accounts of credential map.
+        :param credentials: credential map of provision, default all provisioned entities.
+        """
+        credentials = self.credentials if credentials is None else credentials
+        tasks = []
+        for account in credentials.values():
+            tasks.extend((self._delete_bucket, account, bucket)
+                         for bucket in account.get("buckets", []))
+            tasks.extend((self._delete_iam_user, account, user)
+                         for user in account.get("iam_users", {}))
+        self._run(lambda func, *args: func(*args), tasks)
+        names = list(credentials)
+        self._run(self._delete_account,
+                  [(name, credentials[name].get("accesskey")) for name in names])
+        with self._lock:
+            for name in names:
+                self.credentials.pop(name, None)
+        LOGGER.info("Removed %s accounts", len(names))
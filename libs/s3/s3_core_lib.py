@@ -30,7 +30,10 @@ from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from commons.constants import S3_ENGINE_RGW
+from commons.utils import boto3_utils
 from config import S3_CFG, CMN_CFG
+from libs.s3.s3_bucket_drain import drain_bucket
+from libs.s3.s3_bucket_listing import iter_bucket_keys
 
 LOGGER = logging.getLogger(__name__)
 
@@ -76,24 +79,25 @@ class S3Rest:
             self.enable_debug_mode()
         try:
             if init_s3_connection:
-                self.s3_resource = boto3.resource("s3",
-                                                  use_ssl=self.use_ssl,
-                                                  verify=self.s3_cert_path,
-                                                  aws_access_key_id=access_key,
-                                                  aws_secret_access_key=secret_key,
-                                                  endpoint_url=endpoint_url,
-                                                  region_name=region,
-                                                  aws_session_token=aws_session_token,
-                                                  config=config)
-                self.s3_client = boto3.client("s3",
-                                              use_ssl=self.use_ssl,
-                                              verify=self.s3_cert_path,
-                                              aws_access_key_id=access_key,
-                                              aws_secret_access_key=secret_key,
-                                              endpoint_url=endpoint_url,
-                                              region_name=region,
-                                              aws_session_token=aws_session_token,
-                                              config=config)
+                # Shared client of the credentials, resource is a new object backed by it.
+                self.s3_client = boto3_utils.get_client("s3",
+                                                        use_ssl=self.use_ssl,
+                                                        verify=self.s3_cert_path,
+                                                        aws_access_key_id=access_key,
+                                                        aws_secret_access_key=secret_key,
+                                                        endpoint_url=endpoint_url,
+                                                        region_name=region,
+                                                        aws_session_token=aws_session_token,
+                                                        config=config)
+                self.s3_resource = boto3_utils.get_resource("s3",
+                                                            use_ssl=self.use_ssl,
+                                                            verify=self.s3_cert_path,
+                                                            aws_access_key_id=access_key,
+                                                            aws_secret_access_key=secret_key,
+                                                            endpoint_url=endpoint_url,
+                                                            region_name=region,
+                                                            aws_session_token=aws_session_token,
+                                                            config=config)
             else:
                 LOGGER.info("Skipped: create s3 client, resource object with boto3.")
         except ClientError as error:
@@ -204,14 +208,13 @@ class S3Lib(S3Rest):
 
     def object_list(self, bucket_name: str = None) -> list:
         """
-        List all objects from s3 bucket.
+        List all objects from s3 bucket, the keyspace is listed in parallel.
 
         :param bucket_name: Name of the bucket.
         :return: response.
         """
-        bucket = self.s3_resource.Bucket(bucket_name)
-        response_obj = [obj.key for obj in bucket.objects.all()]
-        LOGGER.debug(response_obj)
+        response_obj = sorted(iter_bucket_keys(self.s3_client, bucket_name))
+        LOGGER.debug("Listed %s objects of bucket %s", len(response_obj), bucket_name)
 
         return response_obj
 
@@ -225,14 +228,14 @@ class S3Lib(S3Rest):
         :param maxkeys: Sets the maximum number of keys returned to the response.
         :return: List of objects of a bucket having specified prefix.
         """
-        resp = None
-        if prefix:
-            resp = self.s3_client.list_objects(Bucket=bucket_name, Prefix=prefix)
         if maxkeys:
-            resp = self.s3_client.list_objects(Bucket=bucket_name, MaxKeys=maxkeys)
-        LOGGER.debug("Resp is : %s", str(resp))
-        obj_lst = [obj['Key'] for obj in resp['Contents']]
-        LOGGER.debug(obj_lst)
+            resp = self.s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix or "",
+                                                  MaxKeys=maxkeys)
+            LOGGER.debug("Resp is : %s", str(resp))
+            obj_lst = [obj['Key'] for obj in resp.get('Contents', [])]
+        else:
+            obj_lst = sorted(iter_bucket_keys(self.s3_client, bucket_name, prefix or ""))
+        LOGGER.debug("Listed %s objects with prefix %s", len(obj_lst), prefix)
 
         return obj_lst
 
@@ -313,6 +316,8 @@ class S3Lib(S3Rest):
     def delete_bucket(self, bucket_name: str = None, force: bool = False) -> dict:
         """
         Delete the empty bucket or delete the bucket along with objects stored in it.
+        With force, objects, versions, delete markers and in progress multipart uploads are
+        removed first.
 
         :param bucket_name: Name of the bucket.
         :param force: Value for delete bucket with object or without object.
@@ -320,13 +325,10 @@ class S3Lib(S3Rest):
         """
         bucket = self.s3_resource.Bucket(bucket_name)
         if force:
-            self.object_list(bucket_name)
             LOGGER.info("This might cause data loss as you have opted for bucket deletion with "
                         "objects in it")
-            response = bucket.objects.all().delete()
-            LOGGER.debug("Objects deleted successfully from bucket %s, response: %s",
-                         bucket_name, response)
-            self.object_list(bucket_name)
+            stats = drain_bucket(self.s3_client, bucket_name)
+            LOGGER.debug("Objects deleted successfully from bucket %s: %s", bucket_name, stats)
         response = bucket.delete()
         LOGGER.debug("Bucket '%s' deleted successfully. Response: %s", bucket_name, response)
 
@@ -0,0 +1,300 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Lightweight AWS SigV4 signed raw HTTP client for S3 and IAM REST requests.
+
+Requests go through a pooled keep-alive requests session, signing keys are derived once per
+(date, region, service) and the credential scope is built once per date. The payload can be
+signed, sent as UNSIGNED-PAYLOAD or streamed with aws-chunked payload signing.
+"""
+
+import hashlib
+import hmac
+import io
+import logging
+import os
+import threading
+import urllib.parse
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.exceptions import InsecureRequestWarning
+
+from commons.utils import s3_utils
+
+LOGGER = logging.getLogger(__name__)
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+STREAMING_PAYLOAD = "STREAMING-AWS4-HMAC-SHA256-PAYLOAD"
+STREAMING_CHUNK_SIZE = 64 * 1024
+# Length of ";chunk-signature=" + signature + 2 * "\r\n" of an aws-chunked chunk.
+CHUNK_OVERHEAD = 17 + 64 + 4
+
+
+def _quote(value: str, safe: str = "-_.~") -> str:
+    """URI encode as required by SigV4."""
+    return urllib.parse.quote(value, safe=safe)
+
+
+class SigV4Signer:
+    """AWS signature version 4 signer of a set of credentials."""
+
+    def __init__(self, access_key: str, secret_key: str, region: str = "us-east-1",
+                 service: str = "s3") -> None:
+        """
+        Initializer for SigV4Signer.
+        :param access_key: Access key id.
+        :param secret_key: Secret access key.
+        :param region: Region of the credential scope.
+        :param service: Service of the credential scope e.g. s3, iam.
+        """
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.service = service
+        self._scopes = {}
+
+    def scope(self, date_stamp: str) -> str:
+        """Credential scope of the date, e.g. 20220101/us-east-1/s3/aws4_request."""
+        scope = self._scopes.get(date_stamp)
+        if scope is None:
+            scope = f"{date_stamp}/{self.region}/{self.service}/aws4_request"
+            self._scopes = {date_stamp: scope}
+        return scope
+
+    def signing_key(self, date_stamp: str) -> bytes:
+        """Signing key of the date, derived once per (date, region, service)."""
+        return s3_utils.get_v4_signature_key(self.secret_key, date_stamp, self.region,
+                                             self.service)
+
+    def _signature(self, date_stamp: str, string_to_sign: str) -> str:
+        return hmac.new(self.signing_key(date_stamp), string_to_sign.encode("utf-8"),
+                        hashlib.sha256).hexdigest()
+
+    # pylint: disable=too-many-arguments
+    def sign(self, method: str, path: str, query: list, headers: dict,
+             payload_hash: str, epoch_t: datetime = None) -> str:
+        """
+        Add x-amz-date, x-amz-content-sha256 and Authorization to headers.
+        :param method: HTTP method.
+        :param path: Canonical (not URI encoded) path of the request.
+        :param query: list of (name, value) query parameters.
+        :param headers: dict of request headers, must contain host, updated in place.
+        :param payload_hash: sha256 hexdigest of the body, UNSIGNED_PAYLOAD or STREAMING_PAYLOAD.
+        :param epoch_t: Time of the request, default now.
+        :return: signature, the seed signature of streaming payloads.
+        """
+        epoch_t = epoch_t or datetime.utcnow()
+        timestamp, date_stamp = s3_utils.get_timestamp(epoch_t), s3_utils.get_date(epoch_t)
+        headers["x-amz-date"] = timestamp
+        headers["x-amz-content-sha256"] = payload_hash
+        signed = {name.lower(): " ".join(str(value).split()) for name, value in headers.items()
+                  if name.lower() in ("host", "content-type", "content-md5", "content-encoding",
+                                      "content-length")
+                  or name.lower().startswith("x-amz-")}
+        signed_headers = ";".join(sorted(signed))
+        canonical_request = "\n".join([
+            method.upper(),
+            _quote(path, safe="/-_.~"),
+            "&".join(f"{_quote(name)}={_quote(str(value))}" for name, value in sorted(query)),
+            "".join(f"{name}:{signed[name]}\n" for name in sorted(signed)),
+            signed_headers,
+            payload_hash])
+        string_to_sign = "\n".join([
+            ALGORITHM, timestamp, self.scope(date_stamp),
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()])
+        signature = self._signature(date_stamp, string_to_sign)
+        headers["Authorization"] = (f"{ALGORITHM} Credential={self.access_key}/"
+                                    f"{self.scope(date_stamp)}, SignedHeaders={signed_headers}, "
+                                    f"Signature={signature}")
+        return signature
+
+    def sign_chunk(self, timestamp: str, date_stamp: str, prev_signature: str,
+                   chunk: bytes) -> str:
+        """Signature of a chunk of an aws-chunked streaming payload."""
+        string_to_sign = "\n".join([
+            f"{ALGORITHM}-PAYLOAD", timestamp, self.scope(date_stamp), prev_signature,
+            EMPTY_SHA256, hashlib.sha256(chunk).hexdigest()])
+        return self._signature(date_stamp, string_to_sign)
+
+
+def streaming_content_length(size: int, chunk_size: int = STREAMING_CHUNK_SIZE) -> int:
+    """Encoded length of an aws-chunked payload of size bytes."""
+    full, last = divmod(size, chunk_size)
+    length = full * (len(f"{chunk_size:x}") + CHUNK_OVERHEAD + chunk_size)
+    if last:
+        length += len(f"{last:x}") + CHUNK_OVERHEAD + last
+    return length + 1 + CHUNK_OVERHEAD  # final zero length chunk
+
+
+class AwsChunkedBody:
+    """File like aws-chunked encoding of a payload, each chunk signed with the previous one."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, signer: SigV4Signer, data, size: int, seed_signature: str,
+                 epoch_t: datetime, chunk_size: int = STREAMING_CHUNK_SIZE) -> None:
+        """
+        Initializer for AwsChunkedBody.
+        :param signer: SigV4Signer of the request.
+        :param data: Payload as bytes or file object.
+        :param size: Size of the payload.
+        :param seed_signature: Signature of the request headers.
+        :param epoch_t: Time of the request.
+        :param chunk_size: Size of the payload chunks.
+        """
+        self.signer = signer
+        self.data = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+        self.size = size
+        self.chunk_size = chunk_size
+        self._signature = seed_signature
+        self._timestamp = s3_utils.get_timestamp(epoch_t)
+        self._date_stamp = s3_utils.get_date(epoch_t)
+        self._remaining = size
+        self._buffer = b""
+        self._done = False
+
+    def __len__(self) -> int:
+        return streaming_content_length(self.size, self.chunk_size)
+
+    def _next_chunk(self) -> bytes:
+        chunk = self.data.read(min(self.chunk_size, self._remaining))
+        self._remaining -= len(chunk)
+        self._signature = self.signer.sign_chunk(self._timestamp, self._date_stamp,
+                                                 self._signature, chunk)
+        self._done = not chunk
+        return f"{len(chunk):x};chunk-signature={self._signature}\r\n".encode() + chunk + \
+            b"\r\n"
+
+    def read(self, amt: int = -1) -> bytes:
+        """Read next amt bytes of the encoded payload."""
+        while not self._done and (amt < 0 or len(self._buffer) < amt):
+            self._buffer += self._next_chunk()
+        if amt < 0:
+            amt = len(self._buffer)
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+
+class S3HttpClient:
+    """SigV4 signed raw HTTP client of an endpoint and credentials over a pooled session."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, endpoint: str, access_key: str, secret_key: str,
+                 region: str = "us-east-1", service: str = "s3", verify=False,
+                 pool_size: int = 50, timeout: int = 300) -> None:
+        """
+        Initializer for S3HttpClient.
+        :param endpoint: Endpoint url e.g. https://s3.seagate.com.
+        :param access_key: Access key id.
+        :param secret_key: Secret access key.
+        :param region: Region of the signature.
+        :param service: Service of the signature.
+        :param verify: Verify server certificate, or path of CA bundle.
+        :param pool_size: Max pooled keep-alive connections.
+        :param timeout: Request timeout in seconds.
+        """
+        self.endpoint = endpoint.rstrip("/")
+        self.host = urllib.parse.urlparse(self.endpoint).netloc
+        self.signer = SigV4Signer(access_key, secret_key, region, service)
+        self.verify = verify
+        self.timeout = timeout
+        if not verify:
+            requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    # pylint: disable=too-many-locals
+    def request(self, method: str, path: str = "/", params: dict = None,
+                headers: dict = None, data=b"", payload: str = "signed",
+                **kwargs) -> requests.Response:
+        """
+        Send signed request.
+        :param method: HTTP method e.g. GET, PUT.
+        :param path: Path of the request e.g. /bucket/key.
+        :param params: Query parameters, None values are sent as bare names e.g. {"acl": None}.
+        :param headers: Extra request headers.
+        :param data: Body as bytes, str, form dict or file object (streaming payload only).
+        :param payload: signed, unsigned (UNSIGNED-PAYLOAD) or streaming (aws-chunked).
+        :keyword content_length: Size of file object data.
+        :keyword chunk_size: Chunk size of streaming payload.
+        :keyword url: Send to url in place of endpoint + path, e.g. IAM endpoints.
+        :return: requests.Response.
+        """
+        headers = dict(headers or {})
+        if isinstance(data, dict):
+            data = urllib.parse.urlencode(data)
+            headers.setdefault("content-type", "application/x-www-form-urlencoded")
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        query = [(name, "" if value is None else value) for name, value in (params or {}).items()]
+        url = kwargs.get("url") or self.endpoint + _quote(path, safe="/-_.~")
+        if query:
+            url += "?" + "&".join(f"{_quote(name)}={_quote(str(value))}" if value != ""
+                                  else _quote(name) for name, value in query)
+        headers["host"] = urllib.parse.urlparse(url).netloc if kwargs.get("url") else self.host
+        sign_path = urllib.parse.unquote(urllib.parse.urlparse(url).path) or "/"
+        epoch_t = datetime.utcnow()
+        if payload == "streaming":
+            chunk_size = kwargs.get("chunk_size", STREAMING_CHUNK_SIZE)
+            size = kwargs.get("content_length")
+            if size is None:
+                size = len(data)
+            headers["content-encoding"] = "aws-chunked"
+            headers["x-amz-decoded-content-length"] = str(size)
+            headers["content-length"] = str(streaming_content_length(size, chunk_size))
+            seed = self.signer.sign(method, sign_path, query, headers, STREAMING_PAYLOAD, epoch_t)
+            body = AwsChunkedBody(self.signer, data, size, seed, epoch_t, chunk_size)
+        else:
+            payload_hash = UNSIGNED_PAYLOAD if payload == "unsigned" else \
+                hashlib.sha256(data).hexdigest()
+            self.signer.sign(method, sign_path, query, headers, payload_hash, epoch_t)
+            body = data
+        LOGGER.debug("%s %s", method.upper(), url)
+        return self.session.request(method.upper(), url, headers=headers, data=body,
+                                    verify=self.verify, timeout=self.timeout)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_http_client(endpoint: str, access_key: str, secret_key: str, **kwargs) -> S3HttpClient:
+    """
+    Shared S3HttpClient of endpoint and credentials, so the pooled connections are reused.
+    :param endpoint: Endpoint url.
+    :param access_key: Access key id.
+    :param secret_key: Secret access key.
+    :param kwargs: Optional keyword arguments of S3HttpClient.
+    """
+    key = (os.getpid(), endpoint, access_key, secret_key) + tuple(sorted(kwargs.items()))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = S3HttpClient(endpoint, access_key, secret_key, **kwargs)
+        return client
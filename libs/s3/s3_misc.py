@@ -20,10 +20,11 @@
 import os
 import time
 import logging
-import boto3
 from config.s3 import S3_CFG
 from commons.params import TEST_DATA_FOLDER
+from commons.utils import boto3_utils
 from commons.utils import system_utils
+from libs.s3.s3_bucket_listing import BucketLister
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,13 +41,13 @@ def create_iam_user(user_name, access_key: str, secret_key: str, **kwargs):
     region = kwargs.get("region_name", S3_CFG["region"])
     LOGGER.debug("Region : %s", region)
 
-    iam = boto3.client("iam",
-                       verify=False,
-                       endpoint_url=endpoint,
-                       aws_access_key_id=access_key,
-                       aws_secret_access_key=secret_key,
-                       region_name=region,
-                       **kwargs)
+    iam = boto3_utils.get_client("iam",
+                                 verify=False,
+                                 endpoint_url=endpoint,
+                                 aws_access_key_id=access_key,
+                                 aws_secret_access_key=secret_key,
+                                 region_name=region,
+                                 **kwargs)
     LOGGER.debug("IAM client created")
     iam.create_user(UserName=user_name)
     LOGGER.debug("Create IAM user command success")
@@ -72,13 +73,13 @@ def delete_iam_user(user_name, access_key: str, secret_key: str, **kwargs):
     region = kwargs.get("region_name", S3_CFG["region"])
     LOGGER.debug("Region : %s", region)
 
-    iam = boto3.client("iam",
-                       verify=False,
-                       endpoint_url=endpoint,
-                       aws_access_key_id=access_key,
-                       aws_secret_access_key=secret_key,
-                       region_name=region,
-                       **kwargs)
+    iam = boto3_utils.get_client("iam",
+                                 verify=False,
+                                 endpoint_url=endpoint,
+                                 aws_access_key_id=access_key,
+                                 aws_secret_access_key=secret_key,
+                                 region_name=region,
+                                 **kwargs)
     LOGGER.debug("IAM client created")
 
     iam.delete_user(UserName=user_name)
@@ -105,7 +106,7 @@ def create_bucket(bucket_name, access_key: str, secret_key: str, **kwargs):
     region = S3_CFG["region"]
     LOGGER.debug("Region : %s", region)
 
-    s3_resource = boto3.resource('s3', verify=False,
+    s3_resource = boto3_utils.get_resource('s3', verify=False,
                         endpoint_url=endpoint,
                         aws_access_key_id=access_key,
                         aws_secret_access_key=secret_key,
@@ -139,7 +140,7 @@ def delete_objects_bucket(bucket_name, access_key: str, secret_key: str, **kwarg
     region = S3_CFG["region"]
     LOGGER.debug("Region : %s", region)
 
-    s3_resource = boto3.resource('s3', verify=False,
+    s3_resource = boto3_utils.get_resource('s3', verify=False,
                         endpoint_url=endpoint,
                         aws_access_key_id=access_key,
                         aws_secret_access_key=secret_key,
@@ -176,7 +177,7 @@ def create_put_objects(object_name: str, bucket_name: str,
     region = S3_CFG["region"]
     LOGGER.debug("Region : %s", region)
 
-    s3_resource = boto3.resource('s3', verify=False,
+    s3_resource = boto3_utils.get_resource('s3', verify=False,
                         endpoint_url=endpoint,
                         aws_access_key_id=access_key,
                         aws_secret_access_key=secret_key,
@@ -219,7 +220,7 @@ def delete_object(obj_name, bucket_name, access_key: str, secret_key: str, **kwa
     region = S3_CFG["region"]
     LOGGER.debug("Region : %s", region)
 
-    s3_resource = boto3.resource('s3', verify=False,
+    s3_resource = boto3_utils.get_resource('s3', verify=False,
                         endpoint_url=endpoint,
                         aws_access_key_id=access_key,
                         aws_secret_access_key=secret_key,
@@ -253,17 +254,16 @@ def get_object_size(bucket_name, access_key: str, secret_key: str, **kwargs):
     region = S3_CFG["region"]
     LOGGER.debug("Region : %s", region)
 
-    s3_resource = boto3.resource('s3', verify=False,
+    s3_resource = boto3_utils.get_resource('s3', verify=False,
                         endpoint_url=endpoint,
                         aws_access_key_id=access_key,
                         aws_secret_access_key=secret_key,
                         region_name=region,
                         **kwargs)
     LOGGER.debug("S3 boto resource created")
-    objs = s3_resource.Bucket(bucket_name).objects.all()
     return_dict = {}
-    for obj in objs:
-        return_dict.update({obj.key:obj.size})
+    for obj in BucketLister(s3_resource.meta.client).iter_objects(bucket_name):
+        return_dict.update({obj["Key"]: obj["Size"]})
     return return_dict
 
 def get_objects_size_bucket(bucket_name, access_key: str, secret_key: str, **kwargs):
@@ -24,11 +24,16 @@ import os
 import sys
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from boto3.s3.transfer import TransferConfig
+from commons.utils.s3_utils import LazyPart
 from libs.s3.s3_core_lib import S3Lib
 
 LOGGER = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+MAX_PARTS = 10000  # max parts of a multipart upload
+
 
 class Multipart(S3Lib):
     """Class containing methods to implement multipart functionality."""
@@ -87,6 +92,45 @@ class Multipart(S3Lib):
 
         return response
 
+    def upload_parts_concurrently(self,
+                                  parts: dict = None,
+                                  bucket_name: str = None,
+                                  object_name: str = None,
+                                  **kwargs) -> list:
+        """
+        Upload parts of a specific multipart upload with a thread pool.
+
+        LazyPart bodies are streamed from their file slice, so only the parts in flight are read.
+        :param parts: Parts dict {part_number: LazyPart or [data, content_md5]}.
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :keyword upload_id: Multipart Upload ID.
+        :keyword max_workers: Max concurrent upload_part requests.
+        :return: List of uploaded parts {"PartNumber": part_number, "ETag": etag} in part order.
+        """
+        upload_id = kwargs.get("upload_id", None)
+        max_workers = kwargs.get("max_workers", 8)
+
+        # Multipart.upload_part returns the response also when called from subclasses which
+        # override upload_part.
+        def _upload(part_number):
+            part = parts[part_number]
+            if isinstance(part, LazyPart):
+                with part.open() as body:
+                    response = Multipart.upload_part(
+                        self, body, bucket_name, object_name, upload_id=upload_id,
+                        part_number=part_number, content_md5=part.content_md5)
+            else:
+                response = Multipart.upload_part(
+                    self, part[0], bucket_name, object_name, upload_id=upload_id,
+                    part_number=part_number, content_md5=part[1])
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(parts)))) as executor:
+            uploaded = list(executor.map(_upload, list(parts)))
+
+        return sorted(uploaded, key=lambda part: part["PartNumber"])
+
     def list_parts(
             self,
             mpu_id: str = None,
@@ -279,11 +323,16 @@ class MultipartUsingBoto(S3Lib):
     """Multipart lib using boto3 high level multi part functionality."""
 
     @staticmethod
-    def get_transfer_config():
-        """Create a transfer config."""
-        config = TransferConfig(multipart_threshold=1024 * 1024,
-                                max_concurrency=10,
-                                multipart_chunksize=1024 * 1024,
+    def get_transfer_config(file_size: int = 0, max_concurrency: int = 10):
+        """
+        Create a transfer config.
+
+        Part size is 1MB, raised in MB steps for objects which would need more than MAX_PARTS.
+        """
+        chunk_size = max(MB, -(-file_size // MAX_PARTS // MB) * MB)
+        config = TransferConfig(multipart_threshold=MB,
+                                max_concurrency=max_concurrency,
+                                multipart_chunksize=chunk_size,
                                 use_threads=True)
 
         return config
@@ -293,9 +342,9 @@ class MultipartUsingBoto(S3Lib):
         bucket_name = kwargs.get('bucket')
         file_path = kwargs.get('file_path')
         s3_prefix = kwargs.get('s3prefix')  # s3prefix should not start with /
-        config = self.get_transfer_config()
         assert bucket_name
         assert file_path
+        config = self.get_transfer_config(os.path.getsize(file_path))
         assert config
         key = os.path.split(file_path)[-1]
         if s3_prefix is not None:
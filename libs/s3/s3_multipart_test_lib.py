@@ -28,7 +28,6 @@ from numpy.random import permutation
 from botocore.exceptions import ClientError
 from commons import errorcodes as err
 from commons.exceptions import CTException
-from commons.greenlet_worker import GeventPool
 from commons.utils.system_utils import create_file
 from commons.utils.system_utils import cal_percent
 from commons.utils import s3_utils
@@ -246,26 +245,20 @@ class S3MultipartTestLib(Multipart):
                               **kwargs) -> tuple:
         """
         Upload parts for a specific multipart upload ID in parallel.
+        LazyPart parts are streamed from their file slice, only the parts in flight are read.
 
         :param upload_id: Multipart Upload ID.
         :param bucket_name: Name of the bucket.
         :param object_name: Name of the object.
+        :keyword parts: Parts dict {part_number: LazyPart or [data, content_md5]}.
+        :keyword parallel_thread: Max parts uploaded concurrently.
         :return: (Boolean, List of uploaded parts).
         """
         try:
             parts = kwargs.get("parts", None)
             parallel_thread = kwargs.get("parallel_thread", 5)
-            gevent_pool = GeventPool(parallel_thread)
-            part_number_list = list(parts.keys())
-
-            for part_number in part_number_list:
-                part = parts.get(part_number, None)
-                gevent_pool.wait_available()
-                gevent_pool.spawn(super().upload_part,
-                                  part[0], bucket_name,
-                                  object_name, upload_id=upload_id,
-                                  part_number=part_number, content_md5=part[1])
-            gevent_pool.join_group()
+            self.upload_parts_concurrently(parts, bucket_name, object_name,
+                                           upload_id=upload_id, max_workers=parallel_thread)
             response = self.list_parts(upload_id, bucket_name, object_name)
             return response
         except BaseException as error:
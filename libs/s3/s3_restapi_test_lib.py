@@ -22,14 +22,14 @@
 
 import logging
 import time
-import urllib
 from http import HTTPStatus
 
 from commons import errorcodes as err
 from commons.constants import Rest
 from commons.exceptions import CTException
-from commons.utils.s3_utils import get_headers
+from commons.utils import boto3_utils
 from commons.utils.s3_utils import convert_xml_to_dict
+from libs.s3.s3_http_client import get_http_client
 from libs.csm.rest.csm_rest_s3user import RestS3user
 from config.s3 import S3_CFG
 from config import CSM_REST_CFG
@@ -184,6 +184,7 @@ class S3AccountOperationsRestAPI(RestS3user):
             if response.status_code != Rest.SUCCESS_STATUS and response.ok is not True:
                 return False, f"Failed to reset password for '{user_name}'"
             LOGGER.debug(response.json())
+            boto3_utils.register_credentials(user_name, response.json().get("access_key"))
 
             return True, response.json()
         except BaseException as error:
@@ -219,23 +220,11 @@ class S3AuthServerRestAPI(RestS3user):
         endpoint = kwargs.get("endpoint", None)
         # S3auth server endpoint.
         endpoint = endpoint if endpoint else self.endpoint
-        # Create harder by calculate AuthV4 signature.
-        headers = get_headers(
-            request,
-            self.endpoint,
-            payload,
-            service="s3",
-            region="US",
-            access_key=access_key,
-            secret_key=secret_key)
-        LOGGER.debug(headers)
-        # Input data.
-        payload = urllib.parse.urlencode(payload)
+        # Pooled client of the credentials, signs each request with AuthV4 signature.
+        client = get_http_client(endpoint, access_key, secret_key, region="US", service="s3")
         LOGGER.debug(payload)
         # Fetching api response.
-        response = self.restapi.s3auth_rest_call(
-            "post", data=payload, endpoint=endpoint,
-            headers=headers)
+        response = client.request(request, data=payload, headers={"Accept": "text/plain"})
         response_data = convert_xml_to_dict(response)
         LOGGER.debug(response_data)
         if response.status_code != Rest.SUCCESS_STATUS and response.ok is not True:
@@ -345,6 +334,7 @@ class S3AuthServerRestAPI(RestS3user):
         if user_name:
             payload["UserName"] = user_name
         status, response = self.execute_restapi_on_s3authserver(payload, access_key, secret_key)
+        boto3_utils.evict_user(user_name)
 
         return status, response
 
@@ -363,6 +353,7 @@ class S3AuthServerRestAPI(RestS3user):
         status, response = self.execute_restapi_on_s3authserver(payload, access_key, secret_key)
         if status:
             response = response["CreateAccessKeyResponse"]["CreateAccessKeyResult"]["AccessKey"]
+            boto3_utils.register_credentials(user_name, response.get("AccessKeyId"))
         LOGGER.debug("Create acesskey response: %s", response)
 
         return status, response
@@ -392,6 +383,7 @@ class S3AuthServerRestAPI(RestS3user):
             payload, s3_access_key, s3_secret_key)
         if status:
             response = response["CreateAccessKeyResponse"]["CreateAccessKeyResult"]["AccessKey"]
+            boto3_utils.register_credentials(user_name, response.get("AccessKeyId"))
         LOGGER.debug("Create acesskey response: %s", response)
 
         return status, response
@@ -412,6 +404,7 @@ class S3AuthServerRestAPI(RestS3user):
         if access_key_id:
             payload["AccessKeyId"] = access_key_id
         status, response = self.execute_restapi_on_s3authserver(payload, access_key, secret_key)
+        boto3_utils.evict_credentials(access_key_id)
 
         return status, response
 
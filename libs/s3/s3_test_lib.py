@@ -25,7 +25,6 @@ import time
 from random import randint
 from time import perf_counter
 
-import boto3
 from botocore import UNSIGNED
 from botocore.client import Config
 from botocore.exceptions import ClientError
@@ -33,6 +32,7 @@ from botocore.exceptions import ClientError
 from commons import commands
 from commons import errorcodes as err
 from commons.exceptions import CTException
+from commons.utils import boto3_utils
 from commons.utils.s3_utils import poll
 from commons.utils.system_utils import create_file
 from commons.utils.system_utils import run_local_cmd
@@ -813,13 +813,13 @@ class S3LibNoAuth(S3TestLib, S3AclTestLib, S3BucketPolicyTestLib):
                          endpoint_url,
                          s3_cert_path,
                          **kwargs)
-        self.s3_client = boto3.client(
+        self.s3_client = boto3_utils.get_client(
             "s3",
             verify=s3_cert_path,
             endpoint_url=endpoint_url,
             config=Config(
                 signature_version=UNSIGNED))
-        self.s3_resource = boto3.resource(
+        self.s3_resource = boto3_utils.get_resource(
             "s3",
             verify=s3_cert_path,
             endpoint_url=endpoint_url,
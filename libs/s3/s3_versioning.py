@@ -70,6 +70,39 @@ class Versioning(S3Lib):
 
         return response
 
+    def iter_object_versions(self, bucket_name: str = None, optional_params: dict = None):
+        """
+        Yield all the List Object Versions pages of a bucket.
+
+        Pages are requested one at a time following both NextKeyMarker and
+        NextVersionIdMarker, so listing is not truncated and memory use does not depend on
+        the number of versions. IOError is raised if a truncated page has no NextKeyMarker.
+        :param bucket_name: Target bucket for the List Object Versions calls.
+        :param optional_params: Optional parameters for the List Object Versions calls
+            Delimiter, EncodingType, KeyMarker, MaxKeys, Prefix, VersionIdMarker
+        :return: generator of responses
+        """
+        params = dict(optional_params or {})
+        while True:
+            response = self.s3_client.list_object_versions(Bucket=bucket_name, **params)
+            LOGGER.debug("List Object Versions page: KeyMarker=%s, VersionIdMarker=%s",
+                         params.get("KeyMarker"), params.get("VersionIdMarker"))
+            yield response
+            if not response.get("IsTruncated"):
+                break
+            key_marker = response.get("NextKeyMarker")
+            version_marker = response.get("NextVersionIdMarker")
+            if not key_marker:
+                # Versions and DeleteMarkers are returned apart, the last entry in listing
+                # order can not be told from them, so the page can not be resumed safely.
+                raise IOError(f"List Object Versions of {bucket_name} is truncated without "
+                              "NextKeyMarker")
+            params["KeyMarker"] = key_marker
+            if version_marker:
+                params["VersionIdMarker"] = version_marker
+            else:
+                params.pop("VersionIdMarker", None)
+
     def get_object_version(self, bucket: str = None, key: str = None,
                            version_id: str = None) -> dict:
         """
@@ -36,6 +36,7 @@ from commons.utils import assert_utils
 from commons.utils import s3_utils
 from config import CMN_CFG
 from config.s3 import S3_CFG
+from libs.s3.s3_bucket_drain import drain_bucket
 from libs.s3.s3_common_test_lib import create_s3_acc
 from libs.s3.s3_test_lib import S3TestLib
 from libs.s3.s3_versioning_test_lib import S3VersioningTestLib
@@ -62,6 +63,29 @@ def create_s3_user_get_s3lib_object(user_name: str, email_id: str,
     return response
 
 
+def add_object_versions_page(index: dict, page: dict) -> dict:
+    """
+    Add the versions and delete markers of a List Object Versions page to the index.
+
+    :param index: dict in the format returned by parse_list_object_versions_response, updated
+        in place.
+    :param page: List Object Versions response page.
+    :return: dict, the updated index
+    """
+    for version in page.get("Versions", []):
+        versions = index["versions"].setdefault(version["Key"], {})
+        if version["VersionId"] not in versions:
+            index["version_count"] += 1
+        versions[version["VersionId"]] = {"etag": version["ETag"],
+                                          "is_latest": version["IsLatest"]}
+    for delete_marker in page.get("DeleteMarkers", []):
+        deletemarkers = index["delete_markers"].setdefault(delete_marker["Key"], {})
+        if delete_marker["VersionId"] not in deletemarkers:
+            index["deletemarker_count"] += 1
+        deletemarkers[delete_marker["VersionId"]] = {"is_latest": delete_marker["IsLatest"]}
+    return index
+
+
 def parse_list_object_versions_response(list_response: dict) -> dict:
     """
     Parse the response object returned from List Object Versions call.
@@ -80,8 +104,7 @@ def parse_list_object_versions_response(list_response: dict) -> dict:
                     ...
                 }
             "version_count": N
-            "deletemarkers": M
-            "deletemarker_count": {
+            "delete_markers": {
                 "<key_name>": {
                         "<version-id>": {
                             "is_latest": True/False
@@ -90,46 +113,40 @@ def parse_list_object_versions_response(list_response: dict) -> dict:
                     },
                     ...
                 }
+            "deletemarker_count": M
             }
         }
     """
-    versions = {}
-    deletemarkers = {}
-    version_count = 0
-    deletemarker_count = 0
-
-    print(f"List response: {list_response}")
-    if list_response[1].get("Versions"):
-        for version in list_response[1].get("Versions"):
-            key = version["Key"]
-            version_id = version["VersionId"]
-            if key not in versions.keys():
-                versions[key] = {}
-            versions[key][version_id] = {}
-            versions[key][version_id]["etag"] = version["ETag"]
-            versions[key][version_id]["is_latest"] = version["IsLatest"]
-            version_count += 1
-
-    if list_response[1].get("DeleteMarkers"):
-        for delete_marker in list_response[1].get("DeleteMarkers"):
-            key = delete_marker["Key"]
-            version_id = delete_marker["VersionId"]
-            if key not in deletemarkers.keys():
-                deletemarkers[key] = {}
-            deletemarkers[key][version_id] = {}
-            deletemarkers[key][version_id]["is_latest"] = delete_marker["IsLatest"]
-            deletemarker_count += 1
-
-    response = {
-        "versions": versions,
-        "version_count": version_count,
-        "delete_markers": deletemarkers,
-        "deletemarker_count": deletemarker_count,
-    }
-    print(f"Parsed response: {response}")
+    LOG.debug("List response: %s", list_response)
+    response = add_object_versions_page(
+        {"versions": {}, "version_count": 0, "delete_markers": {}, "deletemarker_count": 0},
+        list_response[1])
+    LOG.debug("Parsed response: %s", response)
     return response
 
 
+def list_all_object_versions(s3_ver_test_obj: S3VersioningTestLib, bucket_name: str,
+                             **kwargs) -> dict:
+    """
+    List all the versions and delete markers of a bucket, following all the pages.
+
+    The index is built incrementally from one page at a time, so listing is not truncated
+    at the max keys of a single List Object Versions call.
+    :param s3_ver_test_obj: S3VersioningTestLib object to perform S3 versioning calls
+    :param bucket_name: Bucket name for calling List Object Versions
+    :param kwargs: Optional query args of S3VersioningTestLib.list_object_versions
+    :return: dict, in the format returned by parse_list_object_versions_response
+    """
+    index = {"versions": {}, "version_count": 0, "delete_markers": {}, "deletemarker_count": 0}
+    pages = 0
+    for page in s3_ver_test_obj.iter_object_versions(bucket_name=bucket_name, **kwargs):
+        add_object_versions_page(index, page)
+        pages += 1
+    LOG.info("Listed %s versions, %s delete markers of %s in %s pages",
+             index["version_count"], index["deletemarker_count"], bucket_name, pages)
+    return index
+
+
 # pylint: disable-msg=too-many-locals
 def check_list_object_versions(s3_ver_test_obj: S3VersioningTestLib,
                                bucket_name: str, expected_versions: dict,
@@ -183,6 +200,11 @@ def check_list_object_versions(s3_ver_test_obj: S3VersioningTestLib,
         expected_deletemarker_count = 0
 
         resp_dict = parse_list_object_versions_response(list_response)
+        if list_response[1].get("IsTruncated") and expected_flags is None and \
+                "max_keys" not in (list_params or {}):
+            # Expected versions span more than one page, index all the pages.
+            resp_dict = list_all_object_versions(s3_ver_test_obj, bucket_name,
+                                                 **(list_params or {}))
         for key in expected_versions.keys():
             for version in expected_versions[key]["versions"].keys():
                 assert_utils.assert_in(version, list(resp_dict["versions"][key].keys()))
@@ -195,12 +217,13 @@ def check_list_object_versions(s3_ver_test_obj: S3VersioningTestLib,
                                           resp_dict["versions"][key][version]["etag"])
                 expected_version_count += 1
             for delete_marker in expected_versions[key]["delete_markers"]:
-                assert_utils.assert_in(delete_marker, list(resp_dict["deletemarkers"][key].keys()))
+                assert_utils.assert_in(delete_marker,
+                                       list(resp_dict["delete_markers"][key].keys()))
                 # Work on IsLatest flag in ListObjectVersions is WIP (CORTX-30178)
                 # is_latest = True if key["is_latest"] == delete_marker else False
                 # Uncomment once CORTX-30178 changes are available in main
                 # assert_utils.assert_in(is_latest,
-                #                        resp_dict["deletemarkers"][key][version]["is_latest"])
+                #                        resp_dict["delete_markers"][key][version]["is_latest"])
                 expected_deletemarker_count += 1
         assert_utils.assert_equal(expected_version_count, resp_dict["version_count"],
                                   "Unexpected Version entry count in the response")
@@ -471,9 +494,6 @@ def empty_versioned_bucket(s3_ver_test_obj: S3VersioningTestLib,
     :param s3_ver_test_obj: S3VersioningTestLib instance
     :param bucket_name: Name of the bucket to empty
     """
-    list_response = s3_ver_test_obj.list_object_versions(bucket_name=bucket_name)
-    to_delete = list_response[1].get("Versions", [])
-    to_delete.extend(list_response[1].get("DeleteMarkers", []))
-    for version in to_delete:
-        s3_ver_test_obj.delete_object_version(bucket=bucket_name, key=version["Key"],
-                                              version_id=version["VersionId"])
+    stats = drain_bucket(s3_ver_test_obj.s3_client, bucket_name, versions=True,
+                         abort_uploads=False)
+    assert_utils.assert_equal(stats.errors, 0, f"Failed to delete {stats.errors} versions")
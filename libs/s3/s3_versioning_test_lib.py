@@ -96,6 +96,14 @@ class S3VersioningTestLib(Versioning):
 
         return True, response
 
+    @staticmethod
+    def _list_versions_params(kwargs: dict) -> dict:
+        """Map optional query args to List Object Versions parameters."""
+        names = {"delimiter": "Delimiter", "encoding_type": "EncodingType",
+                 "key_marker": "KeyMarker", "max_keys": "MaxKeys", "prefix": "Prefix",
+                 "version_id_marker": "VersionIdMarker"}
+        return {names[arg]: value for arg, value in kwargs.items() if arg in names}
+
     def list_object_versions(self, bucket_name: str = None, **kwargs) -> tuple:
         """
         List all the versions and delete markers present in a bucket.
@@ -105,20 +113,7 @@ class S3VersioningTestLib(Versioning):
             delimiter, encoding_type, key_marker, max_keys, prefix, version_id_marker
         :return: response
         """
-        optional_params = dict()
-        user_params = list(kwargs.keys())
-        if "delimiter" in user_params:
-            optional_params["Delimiter"] = kwargs["delimiter"]
-        if "encoding_type" in user_params:
-            optional_params["EncodingType"] = kwargs["encoding_type"]
-        if "key_marker" in user_params:
-            optional_params["KeyMarker"] = kwargs["key_marker"]
-        if "max_keys" in user_params:
-            optional_params["MaxKeys"] = kwargs["max_keys"]
-        if "prefix" in user_params:
-            optional_params["Prefix"] = kwargs["prefix"]
-        if "version_id_marker" in user_params:
-            optional_params["VersionIdMarker"] = kwargs["version_id_marker"]
+        optional_params = self._list_versions_params(kwargs)
         LOGGER.info("Fetching bucket object versions list")
         try:
             response = super().list_object_versions(bucket_name=bucket_name,
@@ -131,6 +126,25 @@ class S3VersioningTestLib(Versioning):
 
         return True, response
 
+    def iter_object_versions(self, bucket_name: str = None, **kwargs):
+        """
+        Yield all the List Object Versions pages of a bucket.
+
+        :param bucket_name: Target bucket for the List Object Versions calls.
+        :param kwargs: Optional query args that can be supplied to the List Object Versions call
+            delimiter, encoding_type, key_marker, max_keys (page size), prefix, version_id_marker
+        :return: generator of responses
+        """
+        optional_params = self._list_versions_params(kwargs)
+        LOGGER.info("Fetching all pages of bucket object versions list")
+        try:
+            yield from super().iter_object_versions(bucket_name=bucket_name,
+                                                    optional_params=optional_params)
+        except (ClientError, Exception) as error:
+            LOGGER.error("Error in %s: %s", S3VersioningTestLib.iter_object_versions.__name__,
+                         error)
+            raise CTException(err.S3_CLIENT_ERROR, error.args[0]) from error
+
     def get_object_version(self, bucket: str = None, key: str = None,
                            version_id: str = None) -> tuple:
         """
@@ -25,12 +25,12 @@ import os
 import time
 from distutils.util import strtobool
 
-import boto3
 from boto3.exceptions import Boto3Error
 from botocore.client import Config
 from botocore.exceptions import BotoCoreError, ClientError, ConnectionClosedError
 from locust import events
 
+from commons.utils import boto3_utils
 from commons.utils import system_utils
 from core.runner import InMemoryDB
 from scripts.locust import LOCUST_CFG
@@ -48,7 +48,6 @@ class LocustUtils:
     """
 
     def __init__(self):
-        session = boto3.session.Session()
         access_key = os.getenv(
             'AWS_ACCESS_KEY_ID',
             LOCUST_CFG['default']['ACCESS_KEY'])
@@ -68,8 +67,8 @@ class LocustUtils:
         self.bucket_list = list()
         self.empty_buckets = list()
 
-        self.s3_client = session.client(
-            service_name="s3",
+        self.s3_client = boto3_utils.get_client(
+            "s3",
             use_ssl=self.use_ssl,
             verify=self.s3_cert_path,
             aws_access_key_id=access_key,
@@ -77,8 +76,8 @@ class LocustUtils:
             endpoint_url=endpoint_url,
             config=Config(max_pool_connections=max_pool_connections))
 
-        self.s3_resource = session.resource(
-            service_name="s3",
+        self.s3_resource = boto3_utils.get_resource(
+            "s3",
             use_ssl=self.use_ssl,
             verify=self.s3_cert_path,
             aws_access_key_id=access_key,
@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Unit tests of remote log tail helper, remote commands are run by the local shell."""
+import subprocess
+
+from commons.helpers.log_tail_helper import RemoteLogTail
+
+
+class LocalHost:
+    """Host stand-in running commands locally."""
+
+    hostname = "localhost"
+
+    @staticmethod
+    def execute_cmd_status(cmd):
+        """Run cmd in local shell, return status, stdout, stderr."""
+        proc = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=False)
+        return proc.returncode, proc.stdout, proc.stderr
+
+
+class TestRemoteLogTail:
+    """Remote log tail tests."""
+
+    def test_regex_patterns(self, tmp_path):
+        """Patterns follow python re syntax and only lines after the marker are matched."""
+        log = tmp_path / "sspl.log"
+        log.write_text("WARNING Disk usage increased to 91.2%, beyond threshold\n")
+        tail = RemoteLogTail(LocalHost(), offsets_file=str(tmp_path / "offsets.json"))
+        tail.mark(str(log))
+        with open(log, "a", encoding="utf-8") as log_file:
+            log_file.write("INFO sensor ok\nWARNING Disk usage increased to 93.5%, beyond\n")
+        pattern = r"WARNING Disk usage increased to \d{2}.\d%?, beyond"
+        assert tail.count_new(str(log), pattern) == 1
+        assert tail.count_new(str(log), [pattern, r"sensor \w+$"]) == 2
+        assert tail.wait_for_pattern(str(log), pattern, timeout=5) == [
+            "WARNING Disk usage increased to 93.5%, beyond"]
+        assert tail.read_new(str(log), pattern=pattern) == []
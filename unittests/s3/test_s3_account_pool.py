@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Unit tests of s3 account pool with a fake s3 client."""
+
+import pytest
+
+from libs.s3 import s3_account_pool
+from libs.s3 import s3_bulk_provision
+
+S3_CFG = {"s3_url": "https://s3.fake", "s3_cert_path": "ca.crt"}
+
+
+class FakeS3Client:
+    """In-memory buckets with their settings."""
+
+    def __init__(self):
+        self.buckets = {}
+
+    def list_buckets(self):
+        """List buckets."""
+        return {"Buckets": [{"Name": name} for name in self.buckets]}
+
+    def create_bucket(self, Bucket):  # pylint: disable=invalid-name
+        """Create bucket without settings."""
+        self.buckets[Bucket] = {}
+
+    def put_bucket_policy(self, Bucket, Policy):  # pylint: disable=invalid-name
+        """Set bucket policy."""
+        self.buckets[Bucket]["Policy"] = Policy
+
+
+class FakeS3Lib:
+    """S3Lib stand-in sharing one fake client."""
+
+    client = FakeS3Client()
+
+    def __init__(self, *_args, **_kwargs):
+        self.s3_client = self.client
+
+    def delete_bucket(self, bucket_name, force=False):
+        """Delete bucket."""
+        assert force
+        self.s3_client.buckets.pop(bucket_name)
+
+
+class FakeIamTestLib:
+    """IamTestLib stand-in without iam users."""
+
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    @staticmethod
+    def list_users():
+        """List users."""
+        return True, []
+
+
+@pytest.fixture(name="pool")
+def fixture_pool(tmp_path, monkeypatch):
+    """Pool wired to the fake s3 client."""
+    FakeS3Lib.client = FakeS3Client()
+    for module in (s3_account_pool, s3_bulk_provision):
+        monkeypatch.setattr(module, "S3Lib", FakeS3Lib)
+        monkeypatch.setattr(module, "S3_CFG", S3_CFG)
+    monkeypatch.setattr(s3_account_pool, "IamTestLib", FakeIamTestLib)
+    return s3_account_pool.S3AccountPool(str(tmp_path), account_password="passwd",
+                                         target=S3_CFG["s3_url"])
+
+
+class TestS3AccountPool:
+    """S3 account pool tests."""
+
+    def test_clean_buckets(self, pool):
+        """Clean removes extra buckets and resets settings of pool buckets."""
+        client = FakeS3Lib.client
+        account = {"user_name": "acc1", "accesskey": "ak", "secretkey": "sk",
+                   "buckets": ["bkt1", "bkt2"]}
+        for bucket in ("bkt1", "bkt2", "extra"):
+            client.create_bucket(Bucket=bucket)
+        client.put_bucket_policy(Bucket="bkt1", Policy="{}")
+        pool.clean(account)
+        assert client.buckets == {"bkt1": {}, "bkt2": {}}
+        assert account["buckets"] == ["bkt1", "bkt2"]
+
+    def test_failed_fill(self, pool, monkeypatch):
+        """Accounts created by a failed provision are removed, pool stays empty."""
+        removed = []
+
+        def _provision(spec):
+            name = spec.account_names()[0]
+            pool.provisioner.credentials[name] = {"user_name": name, "buckets": []}
+            raise IOError("create account failed")
+
+        monkeypatch.setattr(pool.provisioner, "provision", _provision)
+        monkeypatch.setattr(pool.provisioner, "teardown", removed.extend)
+        pool.provisioner.credentials["other"] = {"user_name": "other", "buckets": []}
+        with pytest.raises(IOError):
+            pool.fill()
+        assert len(removed) == 1 and removed[0].startswith("pool")
+        state = pool._update(lambda state: state)  # pylint: disable=protected-access
+        assert state["provisioning"] == 0 and not state["free"]
@@ -0,0 +1,103 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest for parallel bucket listing."""
+
+import bisect
+import hashlib
+import threading
+
+from libs.s3.s3_bucket_listing import BucketLister
+from libs.s3.s3_bucket_listing import split_range
+
+
+class FakePaginator:  # pylint: disable=too-few-public-methods
+    """list_objects_v2 paginator of FakeS3Client."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def paginate(self, PaginationConfig=None, **kwargs):  # pylint: disable=invalid-name
+        """Yield pages till listing is not truncated."""
+        kwargs["MaxKeys"] = PaginationConfig["PageSize"]
+        while True:
+            page = self.client.list_objects_v2(**kwargs)
+            yield page
+            if not page["IsTruncated"]:
+                return
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+
+class FakeS3Client:
+    """In memory list_objects_v2 of a single bucket."""
+
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+        self.lock = threading.Lock()
+        self.ranges = set()
+
+    def get_paginator(self, _name):
+        """Paginator of list_objects_v2."""
+        return FakePaginator(self)
+
+    # pylint: disable=invalid-name,too-many-arguments,unused-argument
+    def list_objects_v2(self, Bucket, Prefix="", MaxKeys=1000, StartAfter=None,
+                        ContinuationToken=None, Delimiter=None):
+        """List keys of prefix after StartAfter or ContinuationToken."""
+        start = ContinuationToken or StartAfter or ""
+        with self.lock:
+            self.ranges.add(StartAfter)
+        keys = [key for key in self.keys[bisect.bisect_right(self.keys, start):]
+                if key.startswith(Prefix)]
+        page = {"Contents": [{"Key": key} for key in keys[:MaxKeys]],
+                "IsTruncated": len(keys) > MaxKeys}
+        if page["IsTruncated"]:
+            page["NextContinuationToken"] = keys[MaxKeys - 1]
+        return page
+
+
+class TestS3BucketListing:
+    """Test key range partitioning and listing."""
+
+    def test_split_range(self):
+        """Test ranges are split where keys of the page differ."""
+        assert split_range(["obj-0", "obj-1", "obj-1899"]) == [
+            ("obj-1899", "obj-2"), ("obj-2", "obj-3"), ("obj-3", "obj-4"), ("obj-4", "obj-5"),
+            ("obj-5", "obj-6"), ("obj-6", "obj-7"), ("obj-7", "obj-8"), ("obj-8", "obj-9"),
+            ("obj-9", None)]
+        assert split_range(["obj-19", "obj-19899"], "obj-2") == [
+            ("obj-19899", "obj-199"), ("obj-199", "obj-2")]
+        assert split_range(["0a", "5f", "c1"]) == [("c1", "d"), ("d", "e"), ("e", "f"),
+                                                   ("f", None)]
+        assert split_range(["obj-9"], "obj-9") == []
+
+    def test_dense_keys(self):
+        """Test keys sharing a long prefix are spread over many partitions."""
+        keys = [f"test-object-{num}" for num in range(20000)]
+        client = FakeS3Client(keys)
+        listed = list(BucketLister(client, workers=8, page_size=100).iter_keys("bucket"))
+        assert sorted(listed) == sorted(keys)
+        assert len(client.ranges) > 8
+
+    def test_di_keys(self):
+        """Test random and sha1 named keys under prefix, with keys outside of prefix."""
+        keys = [f"{num:x}_{hashlib.sha1(str(num).encode()).hexdigest()}_cx.txt"
+                for num in range(5000)]
+        client = FakeS3Client(keys + ["a/" + key for key in keys[:500]])
+        lister = BucketLister(client, workers=4, page_size=50)
+        assert sorted(lister.iter_keys("bucket", "a/")) == sorted("a/" + key for key in keys[:500])
+        assert sorted(lister.iter_keys("bucket")) == client.keys
@@ -0,0 +1,227 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Unit tests of bulk provisioning with fake rest, iam and s3 objects."""
+
+import threading
+import time
+
+import pytest
+
+from libs.s3 import s3_bulk_provision
+from libs.s3.s3_bulk_provision import BulkProvisioner
+from libs.s3.s3_bulk_provision import ProvisionSpec
+
+S3_CFG = {"s3_url": "https://s3.fake", "s3_cert_path": "ca.crt"}
+
+
+class FakeCluster:
+    """Accounts, iam users and buckets of the fake cluster, with an ordered request log."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.accounts = {}
+        self.users = {}
+        self.buckets = set()
+        self.requests = []
+        self.failures = {}  # request name: remaining failures
+
+    def request(self, name: str, target: str) -> None:
+        """Log request, raise if a failure of it is pending."""
+        with self.lock:
+            self.requests.append((name, target))
+            if self.failures.get(name):
+                self.failures[name] -= 1
+                raise ConnectionError(f"{name} {target} failed")
+
+
+CLUSTER = FakeCluster()
+
+
+class FakeRest:
+    """S3AccountOperationsRestAPI stand-in."""
+
+    @staticmethod
+    def create_s3_account(name, email, password):
+        """Create account, a failure is injected after the account is created."""
+        with CLUSTER.lock:
+            if name in CLUSTER.accounts:
+                return False, f"The account {name} already exists"
+            CLUSTER.accounts[name] = (email, password)
+        CLUSTER.request("create_s3_account", name)
+        return True, {"access_key": f"ak-{name}", "secret_key": "sk"}
+
+    @staticmethod
+    def create_s3account_access_key(name, _password):
+        """Reset access key of account."""
+        CLUSTER.request("create_s3account_access_key", name)
+        return True, {"access_key": f"ak2-{name}", "secret_key": "sk2"}
+
+    @staticmethod
+    def delete_s3_account(name):
+        """Delete account."""
+        CLUSTER.request("delete_s3_account", name)
+        CLUSTER.accounts.pop(name)
+        return True, "deleted"
+
+
+class FakeIamTestLib:
+    """IamTestLib stand-in."""
+
+    def __init__(self, access_key=None, secret_key=None):
+        self.access_key = access_key
+        self.secret_key = secret_key
+
+    @staticmethod
+    def create_user(user_name):
+        """Create iam user."""
+        if user_name in CLUSTER.users:
+            raise Exception("EntityAlreadyExists")  # pylint: disable=broad-exception-raised
+        CLUSTER.users[user_name] = []
+        CLUSTER.request("create_user", user_name)
+
+    @staticmethod
+    def create_access_key(user_name):
+        """Create access key of iam user."""
+        CLUSTER.request("create_access_key", user_name)
+        key = f"ak-{user_name}-{len(CLUSTER.users[user_name])}"
+        CLUSTER.users[user_name].append(key)
+        return True, {"AccessKey": {"AccessKeyId": key, "SecretAccessKey": "sk"}}
+
+    @staticmethod
+    def list_access_keys(user_name):
+        """List access keys of iam user."""
+        return True, {"AccessKeyMetadata": [{"AccessKeyId": key}
+                                            for key in CLUSTER.users[user_name]]}
+
+    @staticmethod
+    def delete_access_key(user_name, access_key_id):
+        """Delete access key of iam user."""
+        CLUSTER.users[user_name].remove(access_key_id)
+
+    @staticmethod
+    def delete_users_with_access_key(user_names):
+        """Delete iam users."""
+        for user_name in user_names:
+            CLUSTER.request("delete_user", user_name)
+            CLUSTER.users.pop(user_name)
+
+
+class FakeS3Client:
+    """boto3 s3 client stand-in."""
+
+    @staticmethod
+    def create_bucket(Bucket):  # pylint: disable=invalid-name
+        """Create bucket."""
+        CLUSTER.request("create_bucket", Bucket)
+        CLUSTER.buckets.add(Bucket)
+
+
+class FakeS3Lib:
+    """S3Lib stand-in."""
+
+    s3_client = FakeS3Client()
+
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    @staticmethod
+    def delete_bucket(bucket_name, force=False):
+        """Delete bucket with its objects."""
+        assert force
+        CLUSTER.request("delete_bucket", bucket_name)
+        CLUSTER.buckets.remove(bucket_name)
+
+
+@pytest.fixture(name="provisioner")
+def fixture_provisioner(monkeypatch):
+    """Provisioner wired to a new fake cluster."""
+    global CLUSTER  # pylint: disable=global-statement
+    CLUSTER = FakeCluster()
+    monkeypatch.setattr(s3_bulk_provision, "S3AccountOperationsRestAPI", FakeRest)
+    monkeypatch.setattr(s3_bulk_provision, "IamTestLib", FakeIamTestLib)
+    monkeypatch.setattr(s3_bulk_provision, "S3Lib", FakeS3Lib)
+    monkeypatch.setattr(s3_bulk_provision, "S3_CFG", S3_CFG)
+    return BulkProvisioner(workers=4, retries=3, retry_delay=0)
+
+
+class TestBulkProvisioner:
+    """Bulk provisioner tests."""
+
+    def test_provision_and_teardown(self, provisioner):
+        """All entities are created and removed, accounts after their users and buckets."""
+        spec = ProvisionSpec(accounts=3, iam_users=2, buckets=2, prefix="ut_")
+        creds = provisioner.provision(spec)
+        assert sorted(creds) == spec.account_names()
+        for name, account in creds.items():
+            assert account["buckets"] == spec.bucket_names(name)
+            assert sorted(account["iam_users"]) == spec.iam_user_names(name)
+        assert len(CLUSTER.users) == 6 and len(CLUSTER.buckets) == 6
+        CLUSTER.requests.clear()
+        provisioner.teardown()
+        assert not CLUSTER.accounts and not CLUSTER.users and not CLUSTER.buckets
+        assert not provisioner.credentials
+        kinds = [name for name, _ in CLUSTER.requests]
+        assert kinds.index("delete_s3_account") == len(kinds) - 3
+
+    def test_retry_reuses_own_entities(self, provisioner):
+        """Entities created by a failed attempt are reused on retry, keys are reset."""
+        CLUSTER.failures = {"create_s3_account": 1, "create_access_key": 1}
+        creds = provisioner.provision(ProvisionSpec(accounts=1, iam_users=1, prefix="ut_"))
+        account = list(creds.values())[0]
+        assert account["accesskey"] == f"ak2-{account['user_name']}"
+        user = list(account["iam_users"].values())[0]
+        assert CLUSTER.users[user["user_name"]] == [user["accesskey"]]
+
+    def test_no_takeover(self, provisioner):
+        """Account of another run is not reused and its keys are not reset."""
+        spec = ProvisionSpec(accounts=1, prefix="ut_")
+        CLUSTER.accounts[spec.account_names()[0]] = ("other@run", "passwd")
+        with pytest.raises(IOError):
+            provisioner.provision(spec)
+        assert ("create_s3account_access_key", spec.account_names()[0]) not in CLUSTER.requests
+        account = {"accesskey": "ak", "secretkey": "sk", "iam_users": {}}
+        CLUSTER.users["other_user"] = ["ak-other"]
+        with pytest.raises(IOError):
+            provisioner.create_iam_user(account, "other_user", "e@mail", "passwd")
+        assert CLUSTER.users["other_user"] == ["ak-other"]
+
+    def test_run_is_bounded(self, provisioner):
+        """Tasks run at most workers at a time, errors are raised after all tasks ran."""
+        running, peak, done = [0], [0], []
+        lock = threading.Lock()
+
+        def _task(index):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+                done.append(index)
+            if index == 3:
+                raise ValueError("task failed")
+            return index
+
+        # pylint: disable=protected-access
+        assert provisioner._run(_task, [(i,) for i in range(3)]) == [0, 1, 2]
+        with pytest.raises(ValueError):
+            provisioner._run(_task, [(i,) for i in range(12)])
+        assert peak[0] == provisioner.workers
+        assert len(done) == 15
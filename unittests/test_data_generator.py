@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Unit tests of DI data generator."""
+import hashlib
+import io
+import zlib
+
+from libs.di.data_generator import BLOCK_SIZE
+from libs.di.data_generator import DataGenerator
+
+
+class TestDataGenerator:
+    """Streaming data generator tests."""
+
+    size = 3 * BLOCK_SIZE + 12345
+
+    def test_generate_is_deterministic(self):
+        """Same seed gives same content, stream, ranges and digests."""
+        gen = DataGenerator(c_ratio=2)
+        buf, csum = gen.generate(self.size, seed=42)
+        assert len(buf) == self.size
+        assert csum == hashlib.sha1(buf).hexdigest()
+        assert gen.generate(self.size, seed=42) == (buf, csum)
+        assert gen.generate(self.size, seed=43)[1] != csum
+        assert gen.digests(self.size, 42, ["sha1", "md5"]) == {
+            "sha1": csum, "md5": hashlib.md5(buf).hexdigest()}
+        for offset, length in ((0, 10), (BLOCK_SIZE - 5, 10), (self.size - 7, 100)):
+            assert gen.read_range(self.size, 42, offset, length) == buf[offset:offset + length]
+        assert gen.generate(0, seed=42) == (b"", hashlib.sha1(b"").hexdigest())
+
+    def test_stream(self):
+        """Stream reads and seeks within the generated content."""
+        gen = DataGenerator()
+        buf = gen.generate(self.size, seed=7)[0]
+        stream = io.BufferedReader(gen.open_stream(self.size, seed=7), 64 * 1024)
+        assert stream.read() == buf
+        stream.seek(BLOCK_SIZE + 3)
+        assert stream.read(20) == buf[BLOCK_SIZE + 3:BLOCK_SIZE + 23]
+
+    def test_stream_digests(self):
+        """Stream hashes content on first read, re-reads and skipped bytes are handled."""
+        gen = DataGenerator()
+        buf = gen.generate(self.size, seed=9)[0]
+        stream = gen.open_stream(self.size, seed=9, algos=["md5", "sha1"])
+        stream.read(1000)
+        stream.seek(0)
+        stream.read(BLOCK_SIZE + 10)
+        stream.seek(2 * BLOCK_SIZE)
+        stream.read(10)
+        assert stream.hexdigests() == {"md5": hashlib.md5(buf).hexdigest(),
+                                       "sha1": hashlib.sha1(buf).hexdigest()}
+
+    def test_compression_ratio(self):
+        """Compressible part of the content follows compression ratio."""
+        buf = DataGenerator(c_ratio=2).generate(BLOCK_SIZE, seed=1)[0]
+        ratio = len(buf) / len(zlib.compress(buf))
+        assert 1.8 < ratio < 2.2
+        buf = DataGenerator(c_ratio=1).generate(BLOCK_SIZE, seed=1)[0]
+        assert len(zlib.compress(buf)) >= len(buf)
@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Unit tests of DI data manager metadata journal."""
+import json
+import os
+
+from commons import params
+from libs.di import data_man
+
+
+def _file(ix, checksum="csum"):
+    return dict(name=f"obj{ix}", checksum=f"{checksum}{ix}", seed=ix, size=1024, mtime=1)
+
+
+class TestDataManager:
+    """Data manager journal tests."""
+
+    def test_journal_replay_and_compaction(self, tmp_path, monkeypatch):
+        """Mutations are journaled, replayed past a torn record and compacted."""
+        monkeypatch.setattr(params, "META_DATA_HOME", str(tmp_path))
+        monkeypatch.setattr(data_man, "COMPACT_EVERY", 50)
+        manager = data_man.DataManager()
+        for ix in range(120):
+            manager.add_file_to_bucket("user1", f"bkt{ix % 3}", _file(ix))
+        manager.add_file_to_bucket("user1", "bkt0", _file(0, "new"))
+        fpath = os.path.join(str(tmp_path), "user1" + params.USER_META_JSON)
+        with open(fpath + data_man.JOURNAL_SUFFIX, "rb") as jfile:
+            assert len(jfile.readlines()) == 21
+        with open(fpath + data_man.JOURNAL_SUFFIX, "ab") as jfile:
+            jfile.write(b'{"op": "add", "bucket": "bkt0", "fi')  # interrupted write
+
+        buckets = data_man.DataManager().get_all_buckets_data_for_user("user1")
+        assert [bkt["name"] for bkt in buckets] == ["bkt0", "bkt1", "bkt2"]
+        assert sum(len(bkt["files"]) for bkt in buckets) == 120
+        assert buckets[0]["files"][0] == dict(name="obj0", checksum="new0", sz=1024, seed=0,
+                                              mtime=1)
+
+        manager.add_file_to_bucket("user1", "bkt3", _file(120))
+        buckets = data_man.DataManager().get_all_buckets_data_for_user("user1")
+        assert buckets[3] == dict(name="bkt3", s3prefix="", files=[
+            dict(name="obj120", checksum="csum120", sz=1024, seed=120, mtime=1)])
+
+        manager.compact("user1")
+        assert os.path.getsize(fpath + data_man.JOURNAL_SUFFIX) == 0
+        with open(fpath) as snapshot:
+            assert json.load(snapshot)["buckets"] == buckets
@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Unit tests of DI manifest store."""
+import multiprocessing as mp
+
+from libs.di.di_manifest import STATUS_DELETED
+from libs.di.di_manifest import ManifestStore
+
+
+def _upload(path, user):
+    """Add objects of a user from a separate process."""
+    ManifestStore(path).add_objects(
+        [user, f"{user}-bucket{ix % 2}", f"obj{ix}", f"csum{ix}", ix, 1024] for ix in range(500))
+
+
+class TestManifestStore:
+    """Manifest store tests."""
+
+    def test_concurrent_writers_and_queries(self, tmp_path):
+        """Objects of concurrent writers are queried by user, bucket and status."""
+        path = str(tmp_path / "manifest.db")
+        procs = [mp.Process(target=_upload, args=(path, f"user{ix}")) for ix in range(4)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+            assert proc.exitcode == 0
+        store = ManifestStore(path)
+        assert store.count(status=None) == 2000
+        assert store.count(users=["user1", "user2"]) == 1000
+        assert store.count(bucket="user3-bucket1") == 250
+        assert store.set_status([("user1", "user1-bucket0", "obj0"),
+                                 ("user1", "user1-bucket1", "obj1")], STATUS_DELETED) == 2
+        assert store.count(users="user1") == 498
+        assert store.count(users="user1", status=STATUS_DELETED) == 2
+        obj = next(store.iter_objects(users="user2", bucket="user2-bucket1", key="obj7"))
+        assert (obj["checksum"], obj["seed"], obj["size"], obj["status"]) == \
+            ("csum7", 7, 1024, "live")
+        assert not list(store.iter_objects(users="user1", key="obj0"))
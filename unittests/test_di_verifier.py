@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Unit tests of DI streaming verifier."""
+import hashlib
+import io
+
+from libs.di.data_generator import DataGenerator
+from libs.di.di_verifier import StreamVerifier
+
+
+class FakeS3Client:
+    """get_object of in memory objects."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def get_object(self, Bucket, Key):  # pylint: disable=invalid-name
+        """Response with a streaming body."""
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+
+class TestStreamVerifier:
+    """Streaming verifier tests."""
+
+    def test_verify_digest(self):
+        """Digest is computed from the streamed body."""
+        data = b"cortx" * 100000
+        verifier = StreamVerifier(FakeS3Client({("bkt", "obj"): data}), read_size=4096)
+        assert verifier.digest("bkt", "obj", "sha512") == (hashlib.sha512(data).digest(),
+                                                           len(data))
+        assert verifier.verify_digest("bkt", "obj", hashlib.md5(data).hexdigest())[0]
+        assert verifier.verify_digest("bkt", "obj", hashlib.sha512(data).digest(), "sha512")[0]
+        assert not verifier.verify_digest("bkt", "obj", hashlib.md5(b"").hexdigest())[0]
+
+    def test_verify_seed(self):
+        """Object is compared with its regenerated content."""
+        gen = DataGenerator(c_ratio=2)
+        size = 3 * 1024 * 1024 + 17
+        data = gen.generate(size, seed=5)[0]
+        corrupt = data[:2000000] + b"\0" + data[2000001:]
+        verifier = StreamVerifier(FakeS3Client({("bkt", "ok"): data, ("bkt", "bad"): corrupt,
+                                                ("bkt", "short"): data[:-1]}),
+                                  read_size=1000003)
+        assert verifier.verify_seed("bkt", "ok", 5, size, gen) == (True, size)
+        assert verifier.verify_seed("bkt", "bad", 5, size, gen) == (False, 2000000)
+        assert verifier.verify_seed("bkt", "short", 5, size, gen) == (False, size - 1)
+        assert not verifier.verify_seed("bkt", "ok", 6, size, gen)[0]
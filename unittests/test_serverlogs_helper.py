@@ -16,6 +16,7 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 #
 """Test server log library."""
+import io
 import pytest
 from commons.helpers import serverlogs_helper
 from datetime import datetime
@@ -34,4 +35,18 @@ def test_serverlogs_lib():
                                               file_type="motr",
                                               node="node1",
                                               test_suffix="0707")
-    
+
+
+def test_extract_log_window():
+    # Binary search on sorted log must extract the same window as a linear scan
+    lines = [b"Dec  9 23:59:58 node1 msg 1\n", b"Dec 10 00:00:01 node1 msg 2\n",
+             b"  continuation of msg 2\n", b"Dec 10 00:00:05 node1 msg 3\n",
+             b"Dec 10 00:01:00 node1 msg 4\n"]
+    data = b"".join(lines)
+    sorted_out, scanned_out = io.BytesIO(), io.BytesIO()
+    serverlogs_helper.extract_log_window(io.BytesIO(data), len(data), "Dec 10 00:00:00",
+                                         "Dec 10 00:00:05", sorted_out)
+    serverlogs_helper.extract_log_window(io.BytesIO(data), len(data), "Dec 10 00:00:00",
+                                         "Dec 10 00:00:05", scanned_out, sorted_log=False)
+    assert sorted_out.getvalue() == b"".join(lines[1:4])
+    assert scanned_out.getvalue() == sorted_out.getvalue()
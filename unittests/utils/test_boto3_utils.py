@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Test boto3 client factory module."""
+
+from botocore.config import Config
+
+from commons.utils.boto3_utils import Boto3Factory
+
+
+class TestBoto3Utils:
+    """Test boto3 client factory class."""
+
+    @classmethod
+    def setup_class(cls):
+        """Initialize variables."""
+        cls.kwargs = {"endpoint_url": "http://127.0.0.1:1", "aws_access_key_id": "AKIATEST",
+                      "aws_secret_access_key": "secret", "region_name": "us-east-1"}
+
+    def test_client_shared_per_credentials(self):
+        """Test clients are reused for same arguments and config."""
+        factory = Boto3Factory()
+        client = factory.get_client("s3", config=Config(retries={"max_attempts": 6}),
+                                    **self.kwargs)
+        assert client is factory.get_client("s3", config=Config(retries={"max_attempts": 6}),
+                                            **self.kwargs)
+        assert client is not factory.get_client(
+            "s3", **dict(self.kwargs, aws_access_key_id="AKIAOTHER"))
+        resource = factory.get_resource("s3", config=Config(retries={"max_attempts": 6}),
+                                        **self.kwargs)
+        assert resource.meta.client is client
+        assert resource is not factory.get_resource(
+            "s3", config=Config(retries={"max_attempts": 6}), **self.kwargs)
+
+    def test_evict(self):
+        """Test clients of deleted credentials are evicted."""
+        factory = Boto3Factory()
+        client = factory.get_client("s3", **self.kwargs)
+        assert factory.evict("AKIATEST") == 1
+        assert client is not factory.get_client("s3", **self.kwargs)
+
+    def test_evict_user(self):
+        """Test clients of all the access keys of deleted user are evicted."""
+        factory = Boto3Factory()
+        factory.register("user1", "AKIATEST")
+        factory.register("user1", "AKIAOTHER")
+        kwargs = {key: {**self.kwargs, "aws_access_key_id": key}
+                  for key in ("AKIATEST", "AKIAOTHER", "AKIAKEPT")}
+        clients = {key: factory.get_client("s3", **kwargs[key]) for key in kwargs}
+        assert factory.evict_user("user1") == 2
+        assert factory.evict_user("user1") == 0
+        assert clients["AKIATEST"] is not factory.get_client("s3", **kwargs["AKIATEST"])
+        assert clients["AKIAOTHER"] is not factory.get_client("s3", **kwargs["AKIAOTHER"])
+        assert clients["AKIAKEPT"] is factory.get_client("s3", **kwargs["AKIAKEPT"])
@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test file checksum engine module."""
+
+import hashlib
+import os
+
+from commons.utils import checksum_utils
+
+
+class TestChecksumUtils:
+    """Test file checksum engine class."""
+
+    def test_file_digests(self, tmp_path):
+        """Test digests of all algos in one pass and cache invalidation on modification."""
+        fpath = str(tmp_path / "checksum.bin")
+        data = os.urandom(3 * 1024 * 1024 + 11)
+        with open(fpath, "wb") as f_obj:
+            f_obj.write(data)
+        digests = checksum_utils.file_digests(fpath, ["md5", "SHA-256"])
+        assert digests["md5"] == hashlib.md5(data).digest()  # nosec
+        assert digests["SHA-256"] == hashlib.sha256(data).digest()
+        assert checksum_utils.file_part_digests(fpath, 1024 * 1024)[-1] == \
+            hashlib.sha256(data[3 * 1024 * 1024:]).digest()
+        with open(fpath, "ab") as f_obj:
+            f_obj.write(b"x")
+        assert checksum_utils.file_digest(fpath) == hashlib.md5(data + b"x").digest()  # nosec
+
+    def test_files_digests(self, tmp_path):
+        """Test set of files hashed concurrently in order."""
+        paths = []
+        for index in range(5):
+            paths.append(str(tmp_path / f"file{index}"))
+            with open(paths[-1], "wb") as f_obj:
+                f_obj.write(str(index).encode() * 1024)
+        digests = checksum_utils.files_digests(paths, "sha1", max_workers=3)
+        assert [digest["sha1"] for digest in digests] == \
+            [hashlib.sha1(str(index).encode() * 1024).digest() for index in range(5)]  # nosec
+
+    def test_same_size_rewrite(self, tmp_path, monkeypatch):
+        """Test recent files are not cached and a rewrite keeping size and mtime is detected."""
+        fpath = str(tmp_path / "rewrite.bin")
+        with open(fpath, "wb") as f_obj:
+            f_obj.write(b"a" * 1024)
+        assert checksum_utils.file_digest(fpath) == hashlib.md5(b"a" * 1024).digest()  # nosec
+        key = checksum_utils.ChecksumCache.file_key(fpath)
+        assert checksum_utils.CHECKSUM_CACHE.get(key, "md5") is None
+        monkeypatch.setattr(checksum_utils, "MIN_CACHE_AGE", 0)
+        checksum_utils.file_digest(fpath)
+        assert checksum_utils.CHECKSUM_CACHE.get(key, "md5") is not None
+        mtime_ns = os.stat(fpath).st_mtime_ns
+        with open(fpath, "r+b") as f_obj:
+            f_obj.write(b"b" * 1024)
+        os.utime(fpath, ns=(mtime_ns, mtime_ns))
+        assert checksum_utils.file_digest(fpath) == hashlib.md5(b"b" * 1024).digest()  # nosec
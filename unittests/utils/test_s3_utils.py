@@ -119,3 +119,33 @@ class TestS3Utils:
         resp = s3_utils.get_unaligned_parts(self.fpath, total_parts=total_parts, random=True)
         self.log.info(resp.keys())
         self.log.info("ENDED: get aligned parts.")
+
+    def test_get_precalculated_parts(self):
+        """Test precalculated parts are read lazily from the file slices."""
+        self.log.info("STARTED: get precalculated parts.")
+        resp = system_utils.create_file(self.fpath, count=20)
+        assert_utils.assert_true(resp[0], resp[1])
+        parts = s3_utils.get_precalculated_parts(
+            self.fpath, [{"part_size": 5, "count": 2}, {"part_size": 2, "count": 5}])
+        with open(self.fpath, "rb") as fptr:
+            for part_number in sorted(parts):
+                data, content_md5 = parts[part_number]
+                assert_utils.assert_equal(data, fptr.read(len(data)))
+                assert_utils.assert_equal(content_md5, s3_utils.calc_contentmd5(data))
+                with parts[part_number].open() as body:
+                    assert_utils.assert_equal(body.read(), data)
+        self.log.info("ENDED: get precalculated parts.")
+
+    def test_calc_multipart_etag(self):
+        """Test streaming multipart ETag matches ETag of parts data."""
+        self.log.info("STARTED: calculate multipart ETag.")
+        resp = system_utils.create_file(self.fpath, count=12)
+        assert_utils.assert_true(resp[0], resp[1])
+        parts = s3_utils.get_unaligned_parts(self.fpath, total_parts=3, chunk_size=1048576)
+        expected = s3_utils.get_multipart_etag({key: list(val) for key, val in parts.items()})
+        assert_utils.assert_equal(s3_utils.get_multipart_etag(parts), expected)
+        part_sizes = [parts[key].length for key in sorted(parts)]
+        md5s, etag = s3_utils.calc_multipart_etag(self.fpath, part_sizes=part_sizes)
+        assert_utils.assert_equal(etag, expected)
+        assert_utils.assert_equal(len(md5s), len(parts))
+        self.log.info("ENDED: calculate multipart ETag.")
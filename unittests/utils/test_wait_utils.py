@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Test wait utility library module."""
+
+import logging
+import time
+
+import pytest
+
+from commons.utils import wait_utils
+
+
+class TestWaitUtils:
+    """Test wait utility library class."""
+
+    @classmethod
+    def setup_class(cls):
+        """Initialize variables."""
+        cls.log = logging.getLogger(__name__)
+
+    def test_wait_until_early_exit(self):
+        """Test wait ends as soon as the condition is true."""
+        attempts = []
+
+        def _condition():
+            attempts.append(time.monotonic())
+            return len(attempts) == 3 and "done"
+
+        start = time.monotonic()
+        resp = wait_utils.wait_until(_condition, timeout=10, interval=0.05, jitter=0,
+                                     desc="early exit")
+        assert resp == "done"
+        assert len(attempts) == 3
+        assert time.monotonic() - start < 1
+        assert wait_utils.get_wait_stats()["early exit"]["count"] >= 1
+
+    def test_wait_until_timeout(self):
+        """Test WaitTimeoutError carries diagnostics of the failed wait."""
+        def _condition():
+            raise IOError("not ready")
+
+        with pytest.raises(wait_utils.WaitTimeoutError) as error:
+            wait_utils.wait_until(_condition, timeout=0.3, interval=0.05, desc="never")
+        assert error.value.attempts > 1
+        assert isinstance(error.value.last_error, IOError)
+        resp = wait_utils.wait_until(lambda: 0, timeout=0.1, interval=0.05,
+                                     raise_on_timeout=False)
+        assert resp == 0
+
+    def test_backoff_intervals(self):
+        """Test poll interval grows exponentially till max interval."""
+        intervals = wait_utils.backoff_intervals(1, 8, backoff=2, jitter=0)
+        assert [next(intervals) for _ in range(6)] == [1, 2, 4, 8, 8, 8]